@@ -395,8 +395,40 @@ else:
 
 # region flags
 
-sys.dont_write_bytecode = True
+FAST_IMPORT = os.environ.get('BOOSTNODE_FAST_IMPORT', '').lower() in (
+    '1', 'true', 'yes')
+'''
+    Indicates whether modules should be prepared for a fast startup. Cached \
+    byte code is allowed and modules imported as library are only extended \
+    lightweight. Their logger is created on first usage and no command line \
+    interface is built up. Set environment variable "BOOSTNODE_FAST_IMPORT" \
+    to "true" to enable it.
+'''
+sys.dont_write_bytecode = not FAST_IMPORT
 '''Don't generate cached byte code files for imported modules.'''
+SIGNATURE_SAMPLING_RATE = builtins.int(os.environ.get(
+    'BOOSTNODE_SIGNATURE_SAMPLING_RATE', '1'))
+'''
+    Only every n-th call of a function in this package gets its signature \
+    checked. Set environment variable "BOOSTNODE_SIGNATURE_SAMPLING_RATE" to \
+    reduce checking overhead in production.
+'''
+SIGNATURE_TRUSTED_AFTER = builtins.int(os.environ.get(
+    'BOOSTNODE_SIGNATURE_TRUSTED_AFTER', '0')) or None
+'''
+    Number of passed signature checks in a row after which a function's \
+    calls are only sampled (see "SIGNATURE_SAMPLING_RATE"). Set \
+    environment variable "BOOSTNODE_SIGNATURE_TRUSTED_AFTER" to check each \
+    call until then.
+'''
+ASYNCHRONOUS_LOGGING = os.environ.get(
+    'BOOSTNODE_ASYNCHRONOUS_LOGGING', ''
+).lower() in ('1', 'true', 'yes')
+'''
+    Indicates whether log records are written by a background thread so \
+    that logging never waits for slow output streams. Set environment \
+    variable "BOOSTNODE_ASYNCHRONOUS_LOGGING" to "true" to enable it.
+'''
 
 # endregion
 
@@ -579,14 +611,19 @@ if __name__ != '__main__':
 # #     pass
     builtins.reload(sys)
     sys.setdefaultencoding(ENCODING)
+    '''NOTE: Reloading "sys" resets its flags so we have to restore them.'''
+    sys.dont_write_bytecode = not FAST_IMPORT
 # #
     try:
         '''
             Add signature checking for all functions and methods with joint \
             points in this package.
         '''
-        add_signature_check(point_cut='%s\..*' % Module.get_package_name(
-            frame=inspect.currentframe()))
+        add_signature_check(
+            point_cut='%s\..*' % Module.get_package_name(
+                frame=inspect.currentframe()),
+            sampling_rate=SIGNATURE_SAMPLING_RATE,
+            trusted_after=SIGNATURE_TRUSTED_AFTER)
     except WindowsError as exception:
 # # python3.5
 # #         logging.error(
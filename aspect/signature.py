@@ -60,16 +60,61 @@ from boostnode.paradigm.aspectOrientation import ASPECTS, FunctionDecorator, \
 # endregion
 
 
+# region constants
+
+# # region public constants
+
+CHECK_POLICY = {
+    'raise_exception': True, 'sampling_rate': 1, 'trusted_after': None}
+'''
+    Configures how often signature checks are applied to each function. \
+    Only every "sampling_rate"th call of a function is checked. If \
+    "trusted_after" is an integer each call is checked until the function \
+    has passed that many checks in a row, afterwards sampling takes place. \
+    Any violation resets this counter. If "raise_exception" is "False" \
+    violations are only logged and counted.
+'''
+CHECK_STATISTICS = {}
+'''
+    Aggregates the number of handled calls and returns, applied checks, \
+    passed checks in a row and violations (with the last violation message) \
+    per function path.
+'''
+
+# # endregion
+
+# endregion
+
+
 # region functions
 
 @JointPoint
-# # python3.5 def add_check(point_cut: builtins.str) -> builtins.list:
-def add_check(point_cut):
+# # python3.5
+# # def add_check(
+# #     point_cut: builtins.str, sampling_rate=1, trusted_after=None,
+# #     raise_exception=True
+# # ) -> builtins.list:
+def add_check(
+    point_cut, sampling_rate=1, trusted_after=None, raise_exception=True
+):
+# #
     '''
         Adds signature checking in functions and methods for given point cuts.
 
-        **point_cut** - A regular expression which will be checked again \
-                        every function context path.
+        **point_cut**       - A regular expression which will be checked \
+                              again every function context path.
+
+        **sampling_rate**   - Only check every n-th call per function.
+
+        **trusted_after**   - Check each call until a function has passed \
+                              given number of checks in a row before \
+                              sampling starts.
+
+        **raise_exception** - Indicates whether violations should raise an \
+                              exception or should only be logged and counted.
+
+        The sampling configuration applies to all registered checks (see \
+        "CHECK_POLICY").
 
         Examples:
 
@@ -78,7 +123,19 @@ def add_check(point_cut):
         >>> @JointPoint
         ... def test():
         ...     pass
+
+        >>> add_check(
+        ...     point_cut='.*test', sampling_rate=10, trusted_after=5
+        ... ) # doctest: +ELLIPSIS
+        [...]
+        >>> CHECK_POLICY['sampling_rate'], CHECK_POLICY['trusted_after']
+        (10, 5)
+
+        >>> CHECK_POLICY.update(sampling_rate=1, trusted_after=None)
     '''
+    CHECK_POLICY.update(
+        raise_exception=raise_exception, sampling_rate=sampling_rate,
+        trusted_after=trusted_after)
 # # python3.5
 # #     ASPECTS.append(
 # #         {'advice': ({'callback': CheckArguments, 'event': 'call'},
@@ -88,6 +145,42 @@ def add_check(point_cut):
 # #
     return ASPECTS
 
+@JointPoint
+# # python3.5 def describe_check_statistics() -> builtins.str:
+def describe_check_statistics():
+    '''
+        Describes aggregated signature check results per function. Functions \
+        with violations are listed first.
+
+        Examples:
+
+        >>> CHECK_STATISTICS['test'] = {
+        ...     'calls': 4, 'returns': 3, 'checks': 2, 'violations': 1,
+        ...     'consecutive_passes': 0, 'last_violation': 'Bad.'}
+        >>> CHECK_STATISTICS['a.test'] = {
+        ...     'calls': 4, 'returns': 0, 'checks': 4, 'violations': 0,
+        ...     'consecutive_passes': 4, 'last_violation': None}
+        >>> print(describe_check_statistics())
+        "test": 4 calls, 3 returns, 2 checks, 1 violations (last: "Bad.").
+        "a.test": 4 calls, 0 returns, 4 checks, 0 violations.
+
+        >>> del CHECK_STATISTICS['test']
+        >>> del CHECK_STATISTICS['a.test']
+    '''
+    descriptions = []
+    for function_path, statistic in builtins.sorted(
+        CHECK_STATISTICS.items(),
+        key=lambda item: (-item[1]['violations'], item[0])
+    ):
+        description = (
+            '"{function_path}": {calls} calls, {returns} returns, {checks} '
+            'checks, {violations} violations'.format(
+                function_path=function_path, **statistic))
+        if statistic['last_violation'] is not None:
+            description += ' (last: "%s")' % statistic['last_violation']
+        descriptions.append(description + '.')
+    return '\n'.join(descriptions)
+
 # endregion
 
 
@@ -183,6 +276,224 @@ class CheckObject(builtins.object):
 
     # # # endregion
 
+    # # # region checking plan
+
+    @builtins.classmethod
+# # python3.5
+# #     def _get_checking_plan(
+# #         cls: SelfClass, function: (Function, Method)
+# #     ) -> builtins.tuple:
+# #         '''
+# #             Compiles given function's signature into a checking plan and \
+# #             caches it on the function itself, so annotations are only \
+# #             analysed once per function.
+# #
+# #             A plan consists of the function's signature, the ordered \
+# #             parameter names if every argument could be bound positionally \
+# #             (otherwise "None"), a predicate for each checked parameter \
+# #             and a predicate for the return value ("None" if not \
+# #             annotated).
+# #
+# #             Examples:
+# #
+# #             >>> def test(a: int, b='hans', c=None) -> str: pass
+# #             >>> plan = CheckObject._get_checking_plan(test)
+# #             >>> plan[1]
+# #             ('a', 'b', 'c')
+# #             >>> sorted(plan[2].keys())
+# #             ['a', 'b', 'c']
+# #             >>> plan[2]['a'](5, None), plan[2]['a']('5', None)
+# #             (True, False)
+# #             >>> plan[3]('hans', None)
+# #             True
+# #             >>> plan is CheckObject._get_checking_plan(test)
+# #             True
+# #
+# #             >>> def test(*arguments: int, **keywords): pass
+# #             >>> plan = CheckObject._get_checking_plan(test)
+# #             >>> plan[1] is None, builtins.list(plan[2].keys()), plan[3]
+# #             (True, ['arguments'], None)
+# #         '''
+# #         if 'signature_checking_plan' in builtins.getattr(
+# #             function, '__dict__', {}
+# #         ):
+# #             return function.signature_checking_plan
+# #         signature = inspect.signature(function)
+# #         positional_names = []
+# #         predicates = {}
+# #         for name, parameter in signature.parameters.items():
+# #             if positional_names is not None and parameter.kind in (
+# #                 inspect.Parameter.POSITIONAL_ONLY,
+# #                 inspect.Parameter.POSITIONAL_OR_KEYWORD
+# #             ):
+# #                 positional_names.append(name)
+# #             else:
+# #                 positional_names = None
+# #             '''A given default value determines the expected type.'''
+# #             if parameter.default is not inspect.Parameter.empty:
+# #                 predicates[name] = cls._create_type_predicate(
+# #                     expected_type=Null if parameter.default is Null else
+# #                     builtins.type(parameter.default))
+# #             elif parameter.annotation is not inspect.Parameter.empty:
+# #                 predicates[name] = cls._create_predicate(
+# #                     specification=parameter.annotation)
+# #         return_predicate = None
+# #         if 'return' in builtins.getattr(function, '__annotations__', {}):
+# #             return_predicate = cls._create_predicate(
+# #                 specification=function.__annotations__['return'])
+# #         plan = (
+# #             signature, None if positional_names is None else
+# #             builtins.tuple(positional_names), predicates, return_predicate)
+# #         try:
+# #             function.signature_checking_plan = plan
+# #         except builtins.AttributeError:
+# #             pass
+# #         return plan
+    def _get_checking_plan(cls, function):
+        '''
+           Dummy method to be compatible to newer features.
+
+           Examples:
+
+           >>> def test(a): pass
+           >>> CheckObject._get_checking_plan(test)
+           (None, None, {}, None)
+        '''
+        return None, None, {}, None
+# #
+
+    @builtins.classmethod
+# # python3.5
+# #     def _create_predicate(
+# #         cls: SelfClass, specification: builtins.object
+# #     ) -> Function:
+    def _create_predicate(cls, specification):
+# #
+        '''
+            Creates a predicate for given argument or return value \
+            specification. It could be specified by a given type, multiple \
+            types or an explicit value. The predicate accepts a value and the \
+            current check object and only returns "True" if given value \
+            surely matches, so each other result has to be checked again to \
+            describe the error.
+
+            Examples:
+
+            >>> class A(CheckObject): pass
+            >>> a = A()
+
+            >>> CheckObject._create_predicate(int)(5, a)
+            True
+
+            >>> CheckObject._create_predicate((str, int))(5, a)
+            True
+
+            >>> CheckObject._create_predicate((str, int))(True, a)
+            False
+
+            >>> CheckObject._create_predicate((str, bool))(True, a)
+            True
+
+            >>> CheckObject._create_predicate([int, str])(str, a)
+            True
+
+            >>> CheckObject._create_predicate([int, str])('peter', a)
+            False
+
+            >>> CheckObject._create_predicate(5)(5, a)
+            True
+
+            >>> CheckObject._create_predicate(5)(6, a)
+            False
+        '''
+        if builtins.isinstance(specification, builtins.type):
+            return cls._create_type_predicate(expected_type=specification)
+        elif cls._is_multiple_type(type=specification):
+            if builtins.isinstance(specification, builtins.tuple):
+                if builtins.all(builtins.map(
+                    lambda expected_type: inspect.isclass(
+                        expected_type
+                    ) and expected_type not in (
+                        Null, builtins.type(None), Self, SelfClass,
+                        SelfClassObject, builtins.int
+                    ), specification
+                )):
+                    '''NOTE: Plain types can be checked at once.'''
+                    return lambda value, check: builtins.issubclass(
+                        builtins.type(value), specification)
+                predicates = builtins.tuple(builtins.map(
+                    cls._create_type_predicate, specification))
+                return lambda value, check: builtins.any(
+                    predicate(value, check) for predicate in predicates)
+            return lambda value, check: value in specification
+        return lambda value, check: not specification != value
+
+    @builtins.classmethod
+# # python3.5
+# #     def _create_type_predicate(
+# #         cls: SelfClass, expected_type: builtins.object
+# #     ) -> Function:
+    def _create_type_predicate(cls, expected_type):
+# #
+        '''
+            Creates a predicate which determines whether a value is an \
+            instance of given type (see "_create_predicate()").
+
+            Examples:
+
+            >>> class A(CheckObject): pass
+            >>> a = A()
+
+            >>> CheckObject._create_type_predicate(int)(5, a)
+            True
+
+            >>> CheckObject._create_type_predicate(int)(True, a)
+            False
+
+            >>> CheckObject._create_type_predicate(Null)('hans', a)
+            True
+
+            >>> CheckObject._create_type_predicate(Self)(a, a)
+            False
+
+            >>> a.object = a
+            >>> CheckObject._create_type_predicate(Self)(a, a)
+            True
+
+            >>> a.class_object = A
+            >>> CheckObject._create_type_predicate(SelfClass)(A, a)
+            True
+
+            >>> CheckObject._create_type_predicate(SelfClassObject)(a, a)
+            True
+
+            >>> CheckObject._create_type_predicate('hans')('hans', a)
+            False
+        '''
+        if expected_type is Null or expected_type is builtins.type(None):
+            return lambda value, check: True
+        elif expected_type is Self:
+            return lambda value, check: (
+                check.object is not None and value is check.object)
+        elif expected_type is SelfClass:
+            return lambda value, check: (
+                check.class_object is not None and
+                value is check.class_object)
+        elif expected_type is SelfClassObject:
+            return lambda value, check: (
+                check.class_object is not None and
+                builtins.type(value) is check.class_object)
+        elif expected_type is builtins.int:
+            return lambda value, check: (
+                builtins.type(value) is not builtins.bool and
+                builtins.issubclass(builtins.type(value), builtins.int))
+        elif inspect.isclass(expected_type):
+            return lambda value, check: builtins.issubclass(
+                builtins.type(value), expected_type)
+        return lambda value, check: False
+
+    # # # endregion
+
     # # endregion
 
     # endregion
@@ -302,6 +613,146 @@ class CheckObject(builtins.object):
 
     # # region protected
 
+# # python3.5     def _get_statistic(self: Self) -> builtins.dict:
+    def _get_statistic(self):
+        '''
+            Returns the aggregated check statistic of the checked function \
+            (see "CHECK_STATISTICS").
+
+            Examples:
+
+            >>> def sampled(): pass
+            >>> class A(CheckObject): pass
+            >>> a = A()
+            >>> a.__func__ = sampled
+
+            >>> a._get_statistic()['calls'], a._get_statistic()['checks']
+            (0, 0)
+
+            >>> a._get_statistic() is CHECK_STATISTICS[__name__ + '.sampled']
+            True
+
+            >>> del CHECK_STATISTICS[__name__ + '.sampled']
+        '''
+# # python3.5
+# #         function_path = '%s.%s' % (
+# #             self.__func__.__module__, self.__func__.__qualname__)
+        function_path = '%s.%s' % (
+            self.__func__.__module__, self.__func__.__name__)
+# #
+        if function_path not in CHECK_STATISTICS:
+            CHECK_STATISTICS[function_path] = {
+                'calls': 0, 'checks': 0, 'consecutive_passes': 0,
+                'last_violation': None, 'returns': 0, 'violations': 0}
+        return CHECK_STATISTICS[function_path]
+
+# # python3.5
+# #     def _is_sampled(
+# #         self: Self, event: builtins.str
+# #     ) -> builtins.bool:
+    def _is_sampled(self, event):
+# #
+        '''
+            Counts given event ("call" or "return") for the checked function \
+            and determines whether it should be checked regarding the \
+            current "CHECK_POLICY".
+
+            Examples:
+
+            >>> def sampled(): pass
+            >>> class A(CheckObject): pass
+            >>> a = A()
+            >>> a.__func__ = sampled
+
+            >>> [a._is_sampled('call') for _ in range(3)]
+            [True, True, True]
+
+            >>> CHECK_POLICY['sampling_rate'] = 2
+            >>> [a._is_sampled('call') for _ in range(4)]
+            [False, True, False, True]
+
+            >>> CHECK_POLICY['trusted_after'] = 1
+            >>> a._is_sampled('return'), a._is_sampled('return')
+            (True, True)
+            >>> a._record_check()._is_sampled('return')
+            True
+            >>> a._is_sampled('return')
+            False
+
+            >>> CHECK_POLICY.update(sampling_rate=1, trusted_after=None)
+            >>> del CHECK_STATISTICS[__name__ + '.sampled']
+        '''
+        statistic = self._get_statistic()
+        statistic[event + 's'] += 1
+        if(CHECK_POLICY['trusted_after'] is not None and
+           statistic['consecutive_passes'] < CHECK_POLICY['trusted_after']):
+            return True
+        return (statistic[event + 's'] - 1) % CHECK_POLICY[
+            'sampling_rate'
+        ] == 0
+
+# # python3.5
+# #     def _record_check(
+# #         self: Self,
+# #         violation: (builtins.Exception, builtins.type(None))=None
+# #     ) -> Self:
+    def _record_check(self, violation=None):
+# #
+        '''
+            Records an applied check for the checked function. Given \
+            violations are raised again or logged depending on the current \
+            "CHECK_POLICY".
+
+            Examples:
+
+            >>> def sampled(): pass
+            >>> class A(CheckObject): pass
+            >>> a = A()
+            >>> a.__func__ = sampled
+
+            >>> a._record_check()._get_statistic()['consecutive_passes']
+            1
+
+            >>> a._record_check(
+            ...     __exception__('Bad.')
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            SignatureError: Bad.
+
+            >>> CHECK_POLICY['raise_exception'] = False
+            >>> __test_buffer__.clear() # doctest: +ELLIPSIS
+            '...'
+            >>> a._record_check(__exception__('Worse.')) # doctest: +ELLIPSIS
+            Object of "A" with class object "None", object "None", called ...
+            >>> __test_buffer__.clear() # doctest: +ELLIPSIS
+            '...Worse...'
+            >>> statistic = a._get_statistic()
+            >>> statistic['checks'], statistic['violations']
+            (3, 2)
+            >>> statistic['consecutive_passes'], statistic['last_violation']
+            (0, 'Worse.')
+
+            >>> CHECK_POLICY['raise_exception'] = True
+            >>> del CHECK_STATISTICS[__name__ + '.sampled']
+        '''
+        statistic = self._get_statistic()
+        statistic['checks'] += 1
+        if violation is None:
+            statistic['consecutive_passes'] += 1
+        else:
+            statistic['consecutive_passes'] = 0
+            statistic['violations'] += 1
+# # python3.5
+# #             statistic['last_violation'] = builtins.str(violation)
+            statistic['last_violation'] = convert_to_unicode(violation)
+# #
+            if CHECK_POLICY['raise_exception']:
+                raise violation
+            __logger__.warning(
+                'Signature violation: %s', statistic['last_violation'])
+        return self
+
 # # python3.5
 # #     def _handle_multiple_types(
 # #         self: Self, value: builtins.object, given_type: builtins.type,
@@ -1063,7 +1514,9 @@ class CheckArguments(CallJointPoint, CheckObject):
     def aspect(self):
         '''
             This function could be used as decorator function or aspects to \
-            implement argument type check for each function call.
+            implement argument type check for each function call. Each \
+            argument is validated by the function's cached checking plan. \
+            Error messages are only determined for invalid arguments.
 
             Examples:
 
@@ -1072,16 +1525,116 @@ class CheckArguments(CallJointPoint, CheckObject):
             ...     Mockup, Mockup(), Mockup, (), {}
             ... ).aspect() # doctest: +ELLIPSIS
             Object of "CheckArguments" with class object "Mockup", object "...
+
+            >>> def test(a: int, *b: str, c=(), **d: (int, str)): pass
+            >>> CheckArguments(
+            ...     Mockup, None, test, (1, 'a', 'b'), {'c': (2,), 'e': 1}
+            ... ).aspect().__func__ # doctest: +ELLIPSIS
+            <function test at ...>
+
+            >>> CheckArguments(
+            ...     Mockup, None, test, (1, 'a', 2), {}
+            ... ).aspect() # doctest: +ELLIPSIS +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.SignatureError: "test()" expects ins...
+
+            >>> CheckArguments(
+            ...     Mockup, None, test, (1,), {'e': 3.0}
+            ... ).aspect() # doctest: +ELLIPSIS +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.SignatureError: "test()" expects one...
+
+            >>> CheckArguments(
+            ...     Mockup, None, test, (), {}
+            ... ).aspect() # doctest: +ELLIPSIS +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            TypeError: missing a required argument: 'a'
         '''
         if builtins.hasattr(self.__func__, '__annotations__'):
-            for argument in self.argument_specifications:
-                self._check_argument(argument)
+            signature, positional_names, predicates, _ = \
+                self._get_checking_plan(function=self.__func__)
+            if self._is_sampled(event='call'):
+                try:
+                    self._check_arguments(
+                        signature, positional_names, predicates)
+                except __exception__ as exception:
+                    self._record_check(violation=exception)
+                else:
+                    self._record_check()
         return self
 
         # endregion
 
         # region protected
 
+# # python3.5
+# #     def _check_arguments(
+# #         self: Self, signature: inspect.Signature,
+# #         positional_names: (builtins.tuple, builtins.type(None)),
+# #         predicates: builtins.dict
+# #     ) -> Self:
+    def _check_arguments(self, signature, positional_names, predicates):
+# #
+        '''
+            Binds given arguments to their parameters and checks each of \
+            them against its compiled predicate.
+        '''
+        if(positional_names is not None and not self.keywords and
+           builtins.len(positional_names) == builtins.len(self.arguments)):
+            '''
+                NOTE: Binding is trivial if all arguments are given \
+                positionally.
+            '''
+            bound_arguments = builtins.zip(positional_names, self.arguments)
+        else:
+            '''
+                We have to bind variables to recognize keyword arguments \
+                which are given as positional arguments.
+            '''
+            bound_arguments = signature.bind(
+                *self.arguments, **self.keywords
+            ).arguments.items()
+        for name, value in bound_arguments:
+            if name in predicates:
+                self._check_bound_argument(
+                    parameter=signature.parameters[name], value=value,
+                    predicate=predicates[name])
+        return self
+
+# # python3.5
+# #     def _check_bound_argument(
+# #         self: Self, parameter: inspect.Parameter, value: builtins.object,
+# #         predicate: Function
+# #     ) -> Self:
+    def _check_bound_argument(self, parameter, value, predicate):
+# #
+        '''
+            Checks a bound argument value against its compiled predicate. \
+            Variable positional and keyword arguments are checked for each \
+            given value. Invalid values are passed to "_check_argument()" to \
+            raise a describing exception.
+        '''
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            for index, positional_value in builtins.enumerate(value):
+                if not predicate(positional_value, self):
+                    self._check_argument(Argument(
+                        parameter=parameter, value=positional_value,
+                        function=self.__func__,
+                        name=builtins.str(index + 1) + '. argument'))
+        elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            for keyword_name, keyword_value in value.items():
+                if not predicate(keyword_value, self):
+                    self._check_argument(Argument(
+                        parameter=parameter, value=keyword_value,
+                        function=self.__func__, name=keyword_name))
+        elif not predicate(value, self):
+            self._check_argument(Argument(
+                parameter=parameter, value=value, function=self.__func__))
+        return self
+
 # # python3.5
 # #     def _check_argument_cases(self: Self, argument: Argument) -> Self:
     def _check_argument_cases(self, argument):
@@ -1158,27 +1711,50 @@ class CheckReturnValue(ReturnJointPoint, CheckObject):
             'hans'
         '''
 # # python3.5
-# #         if 'return' in self.__func__.__annotations__:
-# #             expected_return = self.__func__.__annotations__['return']
-# #             given_return_type = builtins.type(self.return_value)
-# #             if builtins.isinstance(expected_return, builtins.type):
-# #                 self._check_type(
-# #                     given_type=given_return_type,
-# #                     expected_type=expected_return, value=self.return_value)
-# #             elif self._is_multiple_type(type=expected_return):
-# #                 self._handle_multiple_types(
-# #                     value=self.return_value, given_type=given_return_type,
-# #                     expected_types=expected_return)
+# #         return_predicate = self._get_checking_plan(
+# #             function=self.__func__
+# #         )[3]
+# #         if(return_predicate is not None and
+# #            self._is_sampled(event='return')):
+# #             try:
+# #                 if not return_predicate(self.return_value, self):
+# #                     self._check_return_value()
+# #             except __exception__ as exception:
+# #                 self._record_check(violation=exception)
 # #             else:
-# #                 self._check_value(
-# #                     expected_value=expected_return,
-# #                     value=self.return_value)
+# #                 self._record_check()
         pass
 # #
         return self.return_value
 
         # endregion
 
+        # region protected
+
+# # python3.5     def _check_return_value(self: Self) -> Self:
+    def _check_return_value(self):
+        '''
+            Checks the given return value against its specification to \
+            describe the error.
+        '''
+# # python3.5
+# #         expected_return = self.__func__.__annotations__['return']
+# #         given_return_type = builtins.type(self.return_value)
+# #         if builtins.isinstance(expected_return, builtins.type):
+# #             return self._check_type(
+# #                 given_type=given_return_type,
+# #                 expected_type=expected_return, value=self.return_value)
+# #         elif self._is_multiple_type(type=expected_return):
+# #             return self._handle_multiple_types(
+# #                 value=self.return_value, given_type=given_return_type,
+# #                 expected_types=expected_return)
+# #         return self._check_value(
+# #             expected_value=expected_return, value=self.return_value)
+        return self
+# #
+
+        # endregion
+
     # endregion
 
 # endregion
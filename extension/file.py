@@ -37,14 +37,21 @@ import ctypes
 # # python3.5 from collections import Iterable
 import codecs
 from copy import deepcopy
+from datetime import datetime as DateTime
 import hashlib
 import inspect
+import json
 import mimetypes
+import mmap
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import os
 import re as regularExpression
 import shutil
 import stat
 import sys
+import tempfile
+import weakref
 # # python3.5
 # # from types import FunctionType as Function
 # # from types import GeneratorType as Generator
@@ -53,6 +60,7 @@ pass
 # #
 
 from distutils.dir_util import copy_tree as copy_to_existing_directory
+from distutils.errors import DistutilsFileError
 
 '''Make boostnode packages and modules importable via relative paths.'''
 sys.path.append(os.path.abspath(sys.path[0] + 2 * (os.sep + '..')))
@@ -171,6 +179,8 @@ class Handler(Class):
     '''Supported formats to handle the size of file.'''
     BLOCK_SIZE_IN_BYTE = 4096
     '''Defines the size of an empty folder, a symbolic link or empty file.'''
+    CHUNK_SIZE_IN_BYTE = 2 ** 20
+    '''Defines the default number of bytes to read at once by streaming.'''
     MAX_FILE_NAME_LENGTH = 255
     '''
         Defines the maximum number of chars containing in a file (or \
@@ -217,6 +227,22 @@ class Handler(Class):
         Defines a virtual root path for all methods. Through these class \
         objects aren't locations except in "_root_path" available.
     '''
+    _directory_cache = weakref.WeakValueDictionary()
+    '''
+        Holds directory handler templates determined by "get_directory()" \
+        as long as any copy of them is referenced anywhere.
+    '''
+    __slots__ = (
+        '__weakref__', '_current_element_index', '_directory_template',
+        '_encoding', '_has_extension', '_initialized_path',
+        '_next_element_index', '_output_with_root_prefix', '_path',
+        '_path_component_cache', '_path_component_cache_key',
+        '_respect_root_path')
+    '''
+        Saves instance properties in a compact representation since a lot of \
+        handlers are hold at once (e.g. by directory walkers). Weak \
+        references are needed for "_directory_cache".
+    '''
 
     # endregion
 
@@ -503,12 +529,782 @@ class Handler(Class):
             return ()
         return '~',
 
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def determine_hashes(
+# #         cls: SelfClass, locations: Iterable, algorithm='md5',
+# #         chunk_size=None, number_of_threads=None, limit=None
+# #     ) -> builtins.dict:
+    def determine_hashes(
+        cls, locations, algorithm='md5', chunk_size=None,
+        number_of_threads=None, limit=None
+    ):
+# #
+        '''
+            Computes hex digests of many files concurrently. Useful to find \
+            duplicates or to check integrity of whole trees. Each file is \
+            hashed incrementally like "get_hash()" does.
+
+            **locations**         - Paths or "Handler" objects of files to \
+                                    hash.
+
+            **algorithm**         - Name of a hash algorithm supported by \
+                                    "hashlib".
+
+            **chunk_size**        - Number of bytes to feed into each hash \
+                                    object at once.
+
+            **number_of_threads** - Number of files to process at the same \
+                                    time. Defaults to twice the number of \
+                                    available cpu's.
+
+            **limit**             - Number of leading bytes to hash. Useful \
+                                    as cheap pre check before comparing \
+                                    whole contents. All bytes are hashed if \
+                                    "None" is given.
+
+            Returns a dictionary mapping each file path to its hex digest.
+
+            Examples:
+
+            >>> a = Handler(__test_folder__.path + 'determine_hashes_a')
+            >>> a.content = 'hans'
+            >>> b = Handler(__test_folder__.path + 'determine_hashes_b')
+            >>> b.content = 'peter'
+
+            >>> hashes = Handler.determine_hashes((a, b.path), chunk_size=1)
+            >>> hashes[a.path] == a.hash
+            True
+            >>> hashes[b.path] == b.get_hash()
+            True
+
+            >>> Handler.determine_hashes(
+            ...     (a,), algorithm='sha1', number_of_threads=1
+            ... ) == {a.path: a.get_hash(algorithm='sha1')}
+            True
+
+            >>> Handler.determine_hashes(
+            ...     (b,), limit=4
+            ... ) == Handler.determine_hashes((a,), limit=4)
+            False
+            >>> b.content = 'hanswurst'
+            >>> Handler.determine_hashes(
+            ...     (b,), limit=4, chunk_size=3
+            ... )[b.path] == a.hash
+            True
+
+            >>> Handler.determine_hashes(())
+            {}
+
+            >>> Handler.determine_hashes((
+            ...     __test_folder__.path + 'determine_hashes_not_existing',
+            ... )) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Invalid path "...
+        '''
+        return cls._process_files_in_parallel(
+            locations, function=cls._create_native_hash_function(
+                algorithm, chunk_size, limit
+            ), number_of_threads=number_of_threads)
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def determine_numbers_of_lines(
+# #         cls: SelfClass, locations: Iterable, chunk_size=None,
+# #         number_of_threads=None
+# #     ) -> builtins.dict:
+    def determine_numbers_of_lines(
+        cls, locations, chunk_size=None, number_of_threads=None
+    ):
+# #
+        '''
+            Counts lines of many files concurrently like \
+            "get_number_of_lines()" does for a single file.
+
+            **locations**         - Paths or "Handler" objects of files to \
+                                    count lines in.
+
+            **chunk_size**        - Number of bytes to scan at once.
+
+            **number_of_threads** - Number of files to process at the same \
+                                    time. Defaults to twice the number of \
+                                    available cpu's.
+
+            Returns a dictionary mapping each file path to its number of \
+            lines.
+
+            Examples:
+
+            >>> a = Handler(__test_folder__.path + 'determine_numbers_of_a')
+            >>> a.content = 'a\\nb\\nc'
+            >>> b = Handler(__test_folder__.path + 'determine_numbers_of_b')
+            >>> b.content = ''
+
+            >>> numbers = Handler.determine_numbers_of_lines(
+            ...     (a, b), chunk_size=2)
+            >>> numbers[a.path]
+            3
+            >>> numbers[b.path]
+            0
+        '''
+        if chunk_size is None:
+            chunk_size = cls.CHUNK_SIZE_IN_BYTE
+
+# # python3.5
+# #         def determine_number_of_lines(path: builtins.str) -> builtins.int:
+        def determine_number_of_lines(path):
+# #
+            '''Counts line delimiters in given file path.'''
+            lines = 0
+            last_chunk = b''
+            with builtins.open(path, 'rb') as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    lines += chunk.count(b'\n')
+                    last_chunk = chunk
+            if last_chunk and not last_chunk.endswith(b'\n'):
+                lines += 1
+            return lines
+        return cls._process_files_in_parallel(
+            locations, function=determine_number_of_lines,
+            number_of_threads=number_of_threads)
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def process_operations(
+# #         cls: SelfClass, operations: Iterable, number_of_threads=None
+# #     ) -> builtins.list:
+    def process_operations(cls, operations, number_of_threads=None):
+# #
+        '''
+            Runs a batch of file operations concurrently. Operations whose \
+            paths overlap (one path equals or contains another) may depend \
+            on each other, so they are grouped and processed in given order \
+            by one thread. Independent groups are handled in parallel. A \
+            failed operation doesn't stop the batch. All errors \
+            are collected and reported once at the end. File contents are \
+            copied in kernel space via "os.copy_file_range()" or \
+            "os.sendfile()" if available.
+
+            **operations**        - Iterable of tuples. The first item is \
+                                    one of "copy", "move", "link" (creates \
+                                    a symbolic link) or "remove" followed \
+                                    by a source and (except for "remove") \
+                                    a target path or "Handler" object.
+
+            **number_of_threads** - Number of independent groups to \
+                                    process at the same time. Defaults to \
+                                    twice the number of available cpu's.
+
+            Returns a list of "(operation, error message)" tuples for each \
+            failed operation.
+
+            Examples:
+
+            >>> source = Handler(
+            ...     __test_folder__.path + 'process_operations_source',
+            ...     make_directory=True)
+            >>> file = Handler(source.path + 'file')
+            >>> file.content = 'hans'
+            >>> target = Handler(
+            ...     __test_folder__.path + 'process_operations_target',
+            ...     make_directory=True)
+
+            >>> Handler.process_operations((
+            ...     ('copy', file, target.path + 'copy'),
+            ...     ('copy', source, target.path + 'directory'),
+            ...     ('copy', file, target),
+            ...     ('link', file, target.path + 'link')))
+            []
+            >>> Handler(target.path + 'copy').content
+            'hans'
+            >>> Handler(target.path + 'directory/file').content
+            'hans'
+            >>> Handler(target.path + 'file').content
+            'hans'
+            >>> Handler(target.path + 'link').is_symbolic_link()
+            True
+
+            >>> Handler.process_operations((
+            ...     ('move', target.path + 'copy', target.path + 'moved'),
+            ...     ('remove', target.path + 'directory'),
+            ...     ('remove', target.path + 'link')), number_of_threads=1)
+            []
+            >>> Handler(target.path + 'moved').content
+            'hans'
+            >>> Handler(target.path + 'directory').is_element()
+            False
+            >>> Handler(target.path + 'link').is_element()
+            False
+
+            >>> errors = Handler.process_operations((
+            ...     ('remove', target.path + 'not_existing'),
+            ...     ('remove', target.path + 'moved')))
+            >>> builtins.len(errors)
+            1
+            >>> errors[0][0] == ('remove', target.path + 'not_existing')
+            True
+
+            Dependent operations are performed in given order.
+
+            >>> Handler.process_operations((
+            ...     ('copy', source, target.path + 'tree'),
+            ...     ('copy', file, target.path + 'tree/copy'),
+            ...     ('move', target.path + 'tree/copy', target.path + 'out'),
+            ...     ('copy', file, target.path + 'other')))
+            []
+            >>> Handler(target.path + 'out').content
+            'hans'
+            >>> Handler(target.path + 'tree/copy').is_element()
+            False
+
+            >>> Handler.process_operations(())
+            []
+
+            >>> Handler.process_operations((
+            ...     ('rename', file, target),
+            ... )) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Unknown file operation ...
+        '''
+        '''
+            Each operation starts its own group. Groups are merged via \
+            "parents" whenever their paths overlap. "touched" maps each \
+            given path and "containing" each of its ancestors to groups.
+        '''
+        groups = []
+        parents = []
+        touched = {}
+        containing = {}
+
+# # python3.5
+# #         def determine_root(group: builtins.int) -> builtins.int:
+        def determine_root(group):
+# #
+            '''Determines the group given group has been merged into.'''
+            while parents[group] != group:
+                group = parents[group]
+            return group
+
+        for index, operation in builtins.enumerate(operations):
+            if operation[0] not in ('copy', 'move', 'link', 'remove'):
+                raise __exception__(
+                    'Unknown file operation "%s".', operation[0])
+# # python3.5
+# #             paths = builtins.tuple(cls(
+# #                 location=location
+# #             )._get_ending_delimter_trimmed() for location in operation[1:])
+            paths = builtins.tuple(convert_to_string(cls(
+                location=location
+            )._get_ending_delimter_trimmed()) for location in operation[1:])
+# #
+            group = builtins.len(parents)
+            parents.append(group)
+            groups.append([(index, operation, paths)])
+            related = builtins.set()
+            for path in paths:
+                related.update(containing.get(path, ()))
+                while True:
+                    if path in touched:
+                        related.add(touched[path])
+                    if os.path.dirname(path) == path:
+                        break
+                    path = os.path.dirname(path)
+            for other_group in builtins.set(builtins.map(
+                determine_root, related
+            )):
+                parents[other_group] = group
+                groups[group].extend(groups[other_group])
+                groups[other_group] = None
+            for path in paths:
+                touched[path] = group
+                while os.path.dirname(path) != path:
+                    path = os.path.dirname(path)
+                    containing.setdefault(path, builtins.set()).add(group)
+        groups = [
+            [item[1:] for item in builtins.sorted(group)]
+            for group in groups if group is not None]
+        number_of_operations = builtins.sum(builtins.map(builtins.len, groups))
+        if not groups:
+            return []
+
+# # python3.5
+# #         def copy_file_in_kernel(
+# #             source_file: builtins.object, target_file: builtins.object
+# #         ) -> builtins.bool:
+        def copy_file_in_kernel(source_file, target_file):
+# #
+            '''
+                Copies file content without passing user space buffers. \
+                Returns "False" if not supported for given files.
+            '''
+            size = os.fstat(source_file.fileno()).st_size
+            offset = 0
+            while offset < size:
+                try:
+                    if builtins.hasattr(os, 'copy_file_range'):
+                        copied = os.copy_file_range(
+                            source_file.fileno(), target_file.fileno(),
+                            size - offset)
+                    elif builtins.hasattr(os, 'sendfile'):
+                        copied = os.sendfile(
+                            target_file.fileno(), source_file.fileno(),
+                            offset, size - offset)
+                    else:
+                        return False
+                except builtins.OSError:
+                    if offset:
+                        raise
+                    return False
+                if not copied:
+                    break
+                offset += copied
+            return True
+
+# # python3.5
+# #         def process_operation(
+# #             name: builtins.str, source: builtins.str, target=None
+# #         ) -> None:
+        def process_operation(name, source, target=None):
+# #
+            '''Performs given operation on native paths.'''
+            if name == 'remove':
+                if os.path.isdir(source) and not os.path.islink(source):
+                    shutil.rmtree(source)
+                else:
+                    os.remove(source)
+            elif name == 'link':
+                os.symlink(source, target)
+            elif name == 'move':
+                shutil.move(source, target)
+            elif os.path.isdir(source):
+                if os.path.isdir(target):
+                    copy_to_existing_directory(source, target)
+                else:
+                    shutil.copytree(source, target, symlinks=True)
+            else:
+                if os.path.isdir(target):
+                    target = os.path.join(target, os.path.basename(source))
+                with builtins.open(source, 'rb') as source_file, \
+                        builtins.open(target, 'wb') as target_file:
+                    if not copy_file_in_kernel(source_file, target_file):
+                        shutil.copyfileobj(
+                            source_file, target_file, cls.CHUNK_SIZE_IN_BYTE)
+                shutil.copystat(source, target)
+
+# # python3.5
+# #         def process_group(group: builtins.list) -> builtins.list:
+        def process_group(group):
+# #
+            '''Processes all operations of one directory in given order.'''
+            errors = []
+            for operation, paths in group:
+                try:
+                    process_operation(operation[0], *paths)
+                except (
+                    builtins.EnvironmentError, DistutilsFileError
+                ) as exception:
+                    errors.append((operation, builtins.str(exception)))
+            return errors
+        '''
+            NOTE: Operations are performed on native paths since joint point \
+            wrapped methods aren't thread safe.
+        '''
+        errors = builtins.sum(cls._map_in_parallel(
+            function=process_group, items=groups,
+            number_of_threads=number_of_threads
+        ), [])
+        __logger__.info(
+            '{number} of {total} file operations succeeded.'.format(
+                number=number_of_operations - builtins.len(errors),
+                total=number_of_operations))
+        if errors:
+            __logger__.warning(
+                '{number} file operations failed:\n{errors}'.format(
+                    number=builtins.len(errors), errors='\n'.join(
+                        '{name} "{path}": {message}'.format(
+                            name=operation[0], path=operation[1],
+                            message=message
+                        ) for operation, message in errors)))
+        return errors
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def determine_manifest_difference(
+# #         cls: SelfClass, first: (SelfClassObject, builtins.str),
+# #         second: (SelfClassObject, builtins.str)
+# #     ) -> builtins.dict:
+    def determine_manifest_difference(cls, first, second):
+# #
+        '''
+            Compares two backup manifests created by "backup_into_store()".
+
+            **first**  - Path or "Handler" object of the older manifest.
+
+            **second** - Path or "Handler" object of the newer manifest.
+
+            Returns a dictionary with sorted lists of relative file paths \
+            "added", "removed" and "changed" (in content) from first to \
+            second manifest.
+
+            Examples:
+
+            >>> source = Handler(
+            ...     __test_folder__.path + 'determine_manifest_difference',
+            ...     make_directory=True)
+            >>> store = Handler(
+            ...     __test_folder__.path +
+            ...     'determine_manifest_difference_store')
+            >>> a = Handler(source.path + 'a')
+            >>> a.content = 'hans'
+            >>> b = Handler(source.path + 'b')
+            >>> b.content = 'hans'
+            >>> first = source.backup_into_store(store)
+
+            >>> b.content = 'peter'
+            >>> a.remove_file()
+            True
+            >>> Handler(source.path + 'c').content = 'klaus'
+            >>> difference = Handler.determine_manifest_difference(
+            ...     first, source.backup_into_store(store))
+            >>> difference['added'], difference['removed']
+            (['c'], ['a'])
+            >>> difference['changed']
+            ['b']
+
+            >>> difference = Handler.determine_manifest_difference(
+            ...     first, first)
+            >>> difference['added'], difference['removed']
+            ([], [])
+        '''
+        first_files = cls._read_manifest(first)['files']
+        second_files = cls._read_manifest(second)['files']
+        return {
+            'added': builtins.sorted(builtins.set(second_files) - builtins.set(
+                first_files)),
+            'removed': builtins.sorted(builtins.set(
+                first_files
+            ) - builtins.set(second_files)),
+            'changed': builtins.sorted(
+                path for path in builtins.set(first_files) & builtins.set(
+                    second_files
+                ) if first_files[path][2] != second_files[path][2])}
+
     # # endregion
 
     # # region protected
 
     @JointPoint(builtins.classmethod)
 # # python3.5
+# #     def _process_files_in_parallel(
+# #         cls: SelfClass, locations: Iterable, function: Function,
+# #         number_of_threads: (builtins.int, builtins.type(None))
+# #     ) -> builtins.dict:
+    def _process_files_in_parallel(
+        cls, locations, function, number_of_threads
+    ):
+# #
+        '''
+            Applies given function to each given file location using a pool \
+            of threads. Locations are validated before any thread starts.
+
+            **locations**         - Paths or "Handler" objects of files.
+
+            **function**          - Function getting a native file path.
+
+            **number_of_threads** - Size of the thread pool. If "None" \
+                                    twice the number of cpu's will be used.
+
+            Returns a dictionary mapping file paths to function results.
+
+            Examples:
+
+            >>> file = Handler(__test_folder__.path + '_process_files_in_para')
+            >>> file.content = 'hans'
+
+            >>> Handler._process_files_in_parallel(
+            ...     (file,), function=lambda path: 5, number_of_threads=2
+            ... ) == {file.path: 5}
+            True
+
+            >>> Handler._process_files_in_parallel(
+            ...     (__test_folder__,), function=lambda path: 5,
+            ...     number_of_threads=2
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Only files could be ...
+        '''
+        paths = []
+        native_paths = []
+        for location in locations:
+            file = cls(location=location, must_exist=True)
+            if not file.is_file():
+                raise __exception__(
+                    'Only files could be processed (not "%s").', file.path)
+            paths.append(file.path)
+# # python3.5             native_paths.append(file._path)
+            native_paths.append(convert_to_string(file._path))
+        if not paths:
+            return {}
+        return builtins.dict(builtins.zip(paths, cls._map_in_parallel(
+            function, items=native_paths,
+            number_of_threads=number_of_threads)))
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _map_in_parallel(
+# #         cls: SelfClass, function: Function, items: builtins.list,
+# #         number_of_threads: (builtins.int, builtins.type(None))
+# #     ) -> builtins.list:
+    def _map_in_parallel(cls, function, items, number_of_threads):
+# #
+        '''
+            Applies given function to each given item using a pool of \
+            threads and returns all results in given order.
+
+            **function**          - Function to apply. It mustn't call any \
+                                    joint point wrapped method since they \
+                                    aren't thread safe.
+
+            **items**             - List of function arguments.
+
+            **number_of_threads** - Size of the thread pool. If "None" \
+                                    twice the number of cpu's will be used.
+
+            Examples:
+
+            >>> Handler._map_in_parallel(
+            ...     function=lambda number: 2 * number, items=[1, 2, 3],
+            ...     number_of_threads=None)
+            [2, 4, 6]
+
+            >>> Handler._map_in_parallel(
+            ...     function=lambda number: number, items=[],
+            ...     number_of_threads=2)
+            []
+        '''
+        if not items:
+            return []
+        '''
+            NOTE: Reading files and hashing releases the global interpreter \
+            lock so threads scale for this kind of work.
+        '''
+        pool = ThreadPool(processes=builtins.min(
+            cls._determine_number_of_threads(number_of_threads),
+            builtins.len(items)))
+        try:
+            return pool.map(function, items)
+        finally:
+            pool.close()
+            pool.join()
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _create_native_blob_store_function(
+# #         cls: SelfClass, algorithm: builtins.str, blobs_path: builtins.str,
+# #         chunk_size=None
+# #     ) -> Function:
+    def _create_native_blob_store_function(
+        cls, algorithm, blobs_path, chunk_size=None
+    ):
+# #
+        '''
+            Creates a function copying a file given by its native path into \
+            a content addressed blob store. The content is hashed while \
+            copying into a temporary file which is moved to its blob path \
+            afterwards, so blobs are never incomplete or stored under a \
+            foreign hash. The function returns the hash of the stored \
+            content or "None" if copying failed. It is thread safe.
+
+            **algorithm**  - Name of a hash algorithm supported by "hashlib".
+
+            **blobs_path** - Native path of the blob store.
+
+            **chunk_size** - Number of bytes to copy at once. If "None" \
+                             "CHUNK_SIZE_IN_BYTE" will be used.
+
+            Examples:
+
+            >>> blobs = Handler(
+            ...     __test_folder__.path +
+            ...     '_create_native_blob_store_function',
+            ...     make_directory=True)
+            >>> file = Handler(blobs.path + '..' + os.sep + 'blob_source')
+            >>> file.content = 'hans'
+            >>> store_blob = Handler._create_native_blob_store_function(
+            ...     'md5', blobs._path)
+
+            >>> store_blob(file._path)
+            'f2a0ffe83ec8d44f2be4b624b0f47dde'
+            >>> Handler(blobs.path + 'f2' + os.sep + (
+            ...     'f2a0ffe83ec8d44f2be4b624b0f47dde')).content
+            'hans'
+            >>> os.listdir(blobs.path)
+            ['f2']
+
+            >>> store_blob(blobs.path + 'not_existing') is None
+            True
+            >>> os.listdir(blobs.path)
+            ['f2']
+        '''
+        if chunk_size is None:
+            chunk_size = cls.CHUNK_SIZE_IN_BYTE
+
+# # python3.5
+# #         def store_blob(path: builtins.str) -> (
+# #             builtins.str, builtins.type(None)
+# #         ):
+        def store_blob(path):
+# #
+            '''Copies given file into the blob store.'''
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                suffix='.tmp', dir=blobs_path)
+            try:
+                hash_object = builtins.getattr(hashlib, algorithm)()
+                with os.fdopen(file_descriptor, 'wb') as target:
+                    with builtins.open(path, 'rb') as source:
+                        while True:
+                            chunk = source.read(chunk_size)
+                            if not chunk:
+                                break
+                            hash_object.update(chunk)
+                            target.write(chunk)
+                    target.flush()
+                    os.fsync(target.fileno())
+                hash_value = hash_object.hexdigest()
+                blob_path = os.path.join(
+                    blobs_path, hash_value[:2], hash_value)
+                try:
+                    os.mkdir(os.path.dirname(blob_path))
+                except builtins.OSError:
+                    if not os.path.isdir(os.path.dirname(blob_path)):
+                        raise
+                if not os.path.isfile(blob_path):
+                    os.rename(temporary_path, blob_path)
+                return hash_value
+            except builtins.EnvironmentError:
+                return None
+            finally:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+        return store_blob
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _create_native_hash_function(
+# #         cls: SelfClass, algorithm: builtins.str,
+# #         chunk_size: (builtins.int, builtins.type(None)), limit=None
+# #     ) -> Function:
+    def _create_native_hash_function(cls, algorithm, chunk_size, limit=None):
+# #
+        '''
+            Creates a function determining the hex digest of a file given by \
+            its native path. The function is thread safe.
+
+            **algorithm**  - Name of a hash algorithm supported by "hashlib".
+
+            **chunk_size** - Number of bytes to read at once. If "None" \
+                             "CHUNK_SIZE_IN_BYTE" will be used.
+
+            **limit**      - Number of leading bytes to hash. If "None" the \
+                             whole file will be hashed.
+
+            Examples:
+
+            >>> file = Handler(
+            ...     __test_folder__.path + '_create_native_hash_function')
+            >>> file.content = 'hans'
+            >>> Handler._create_native_hash_function('md5', None)(file.path)
+            'f2a0ffe83ec8d44f2be4b624b0f47dde'
+        '''
+        if chunk_size is None:
+            chunk_size = cls.CHUNK_SIZE_IN_BYTE
+
+# # python3.5
+# #         def determine_hash(path: builtins.str) -> builtins.str:
+        def determine_hash(path):
+# #
+            '''Determines the hex digest of given file path.'''
+            hash_object = builtins.getattr(hashlib, algorithm)()
+            remaining = limit
+            with builtins.open(path, 'rb') as file:
+                while remaining is None or remaining > 0:
+                    size = chunk_size
+                    if remaining is not None:
+                        size = builtins.min(size, remaining)
+                        remaining -= size
+                    chunk = file.read(size)
+                    if not chunk:
+                        break
+                    hash_object.update(chunk)
+            return hash_object.hexdigest()
+        return determine_hash
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _determine_number_of_threads(
+# #         cls: SelfClass,
+# #         number_of_threads: (builtins.int, builtins.type(None))
+# #     ) -> builtins.int:
+    def _determine_number_of_threads(cls, number_of_threads):
+# #
+        '''
+            Determines the number of threads to use for concurrent file \
+            operations.
+
+            **number_of_threads** - Explicit number of threads. If "None" \
+                                    twice the number of cpu's will be used.
+
+            Examples:
+
+            >>> Handler._determine_number_of_threads(3)
+            3
+
+            >>> Handler._determine_number_of_threads(None) > 0
+            True
+        '''
+        if number_of_threads is None:
+            try:
+                return 2 * multiprocessing.cpu_count()
+            except builtins.NotImplementedError:
+                return 1
+        return number_of_threads
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _read_manifest(
+# #         cls: SelfClass, location: (SelfClassObject, builtins.str)
+# #     ) -> builtins.dict:
+    def _read_manifest(cls, location):
+# #
+        '''
+            Loads a backup manifest created by "backup_into_store()".
+
+            **location** - Path or "Handler" object of the manifest file.
+
+            Examples:
+
+            >>> manifest = Handler(__test_folder__.path + '_read_manifest')
+            >>> manifest.content = '{"algorithm": "md5", "files": {}}'
+            >>> Handler._read_manifest(manifest)['algorithm']
+            'md5'
+
+            >>> Handler._read_manifest(
+            ...     __test_folder__.path + '_read_manifest_not_existing'
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Invalid path "...
+        '''
+        return json.loads(cls(location=location, must_exist=True).content)
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
 # #     def _sort_directory_to_end(
 # #         cls: SelfClass, files: Iterable, recursive_in_link: builtins.bool
 # #     ) -> builtins.list:
@@ -675,6 +1471,13 @@ class Handler(Class):
         self._encoding = encoding
         self._respect_root_path = respect_root_path
         self._output_with_root_prefix = output_with_root_prefix
+        '''
+            Caches path components derived from "_path" (like name or \
+            directory). The cache is only valid for the path and root path \
+            saved in "_path_component_cache_key" and created on first usage.
+        '''
+        self._path_component_cache = None
+        self._path_component_cache_key = None
         '''Saves the initially given path without any transformations.'''
         self._initialized_path = self._initialize_location(location)
         self._initialize_path()
@@ -971,25 +1774,41 @@ class Handler(Class):
     # # # region getter
 
     @JointPoint(Class.pseudo_property)
-# # python3.5     def get_hash(self: Self, algorithm='md5') -> builtins.str:
-    def get_hash(self, algorithm='md5'):
+# # python3.5
+# #     def get_hash(
+# #         self: Self, algorithm='md5', chunk_size=None
+# #     ) -> builtins.str:
+    def get_hash(self, algorithm='md5', chunk_size=None):
+# #
         '''
-            Returns encoding for current file handler. If no encoding was set \
-            "boostnode.ENCODING" is default.
+            Returns a hex digest of current file content. The file is read \
+            chunk by chunk so memory usage doesn't depend on the file size.
+
+            **algorithm**  - Name of a hash algorithm supported by "hashlib".
+
+            **chunk_size** - Number of bytes to feed into the hash object at \
+                             once (default: "CHUNK_SIZE_IN_BYTE").
 
             Examples:
 
             >>> Handler(location=__file_path__).hash # doctest: +ELLIPSIS
             '...'
+
+            >>> handler = Handler(__test_folder__.path + 'get_hash')
+            >>> handler.content = 'hans'
+            >>> handler.get_hash()
+            'f2a0ffe83ec8d44f2be4b624b0f47dde'
+
+            >>> handler.get_hash(algorithm='sha1')
+            '8800578b51f022c8d8adb9606a8b3db4fedbdac6'
+
+            >>> handler.get_hash(chunk_size=1)
+            'f2a0ffe83ec8d44f2be4b624b0f47dde'
         '''
-# # python3.5
-# #         return builtins.getattr(hashlib, algorithm)(builtins.open(
-# #             self._path, 'rb'
-# #         ).read()).hexdigest()
-        return builtins.getattr(hashlib, algorithm)(builtins.open(
-            convert_to_string(self._path), 'rb'
-        ).read()).hexdigest()
-# #
+        hash_object = builtins.getattr(hashlib, algorithm)()
+        for chunk in self.iterate_chunks(size=chunk_size):
+            hash_object.update(chunk)
+        return hash_object.hexdigest()
 
     @JointPoint
 # # python3.5     def get_encoding(self: Self) -> builtins.str:
@@ -1033,9 +1852,14 @@ class Handler(Class):
             >>> Handler(location=__file_path__).extension
             'py'
         '''
-        if self._has_extension:
-            return self.name[builtins.len(self.basename) + 1:]
-        return ''
+        cache = self._get_path_component_cache()
+        if 'extension' not in cache:
+            cache['extension'] = ''
+            if self._has_extension:
+                cache['extension'] = self.name[builtins.len(
+                    self.basename
+                ) + 1:]
+        return cache['extension']
 
     @JointPoint(Class.pseudo_property)
 # # python3.5     def get_timestamp(self: Self) -> builtins.float:
@@ -1053,11 +1877,16 @@ class Handler(Class):
         return os.stat(convert_to_string(self._path)).st_mtime
 
     @JointPoint(Class.pseudo_property)
-# # python3.5     def get_number_of_lines(self: Self) -> builtins.int:
-    def get_number_of_lines(self):
+# # python3.5
+# #     def get_number_of_lines(self: Self, chunk_size=None) -> builtins.int:
+    def get_number_of_lines(self, chunk_size=None):
+# #
         '''
             Returns the number of lines in the file content referenced by the \
-            "Handler" object.
+            "Handler" object. Line delimiters are counted in binary chunks.
+
+            **chunk_size** - Number of bytes to scan at once (default: \
+                             "CHUNK_SIZE_IN_BYTE").
 
             Examples:
 
@@ -1078,16 +1907,17 @@ class Handler(Class):
             >>> file.content = 'a\\nb\\nca\\nb\\nc'
             >>> file.get_number_of_lines()
             5
+
+            >>> file.get_number_of_lines(chunk_size=2)
+            5
         '''
         lines = 0
-# # python3.5
-# #         with builtins.open(self._path, mode='r') as file:
-        with builtins.open(convert_to_string(
-            self._path
-        ), mode='r') as file:
-# #
-            for line in file:
-                lines += 1
+        last_chunk = b''
+        for last_chunk in self.iterate_chunks(size=chunk_size):
+            lines += last_chunk.count(b'\n')
+        if last_chunk and not last_chunk.endswith(b'\n'):
+            '''Count last line even if it isn't terminated.'''
+            lines += 1
         return lines
 
     @JointPoint(Class.pseudo_property)
@@ -1471,6 +2301,9 @@ class Handler(Class):
         if output_with_root_prefix is None:
             taken_output_with_root_prefix = self._output_with_root_prefix
         if location is None:
+            if(output_with_root_prefix is None and
+               'path' in self._get_path_component_cache()):
+                return self._path_component_cache['path']
             if not self._path.endswith(os.sep) and self.is_directory():
                 self._path += os.sep
             '''
@@ -1479,13 +2312,22 @@ class Handler(Class):
                 than the root path. So simply return the internal path in \
                 this case.
             '''
-            if(taken_output_with_root_prefix or not self._path.startswith(
-                self.__class__._root_path)
-               ):
-                return self._path
-            return self._path[builtins.len(
-                self.__class__._root_path
-            ) - builtins.len(os.sep):]
+            path = self._path
+            if(not taken_output_with_root_prefix and
+               self._path.startswith(self.__class__._root_path)):
+                path = self._path[builtins.len(
+                    self.__class__._root_path
+                ) - builtins.len(os.sep):]
+            '''
+                NOTE: Paths of not existing locations aren't cached since \
+                they could become a directory which needs a trailing path \
+                delimiter.
+            '''
+            if output_with_root_prefix is None and (
+                self._path.endswith(os.sep) or self.is_file()
+            ):
+                self._get_path_component_cache()['path'] = path
+            return path
         return self._get_path(
             location, respect_root_path,
             output_with_root_prefix=taken_output_with_root_prefix)
@@ -1536,14 +2378,29 @@ class Handler(Class):
             '..'
         '''
         if context is None:
+            '''
+                NOTE: Relative paths depend on the current working directory \
+                so it is part of the cache entry.
+            '''
+            cache = self._get_path_component_cache()
+            working_directory = os.getcwd()
+            if not (arguments or keywords) and cache.get(
+                'relative_path', (None,)
+            )[0] == working_directory:
+                return cache['relative_path'][1]
+# # python3.5
+# #             relative_path = os.path.relpath(
+# #                 self._path, *arguments, **keywords)
+            relative_path = convert_to_unicode(os.path.relpath(
+                convert_to_string(self._path), *arguments, **keywords))
+# #
+            if not (arguments or keywords):
+                cache['relative_path'] = working_directory, relative_path
+            return relative_path
 # # python3.5
-# #             return os.path.relpath(self._path, *arguments, **keywords)
 # #         return os.path.relpath(
 # #             self._path, *arguments,
 # #             start=self.__class__(location=context)._path, **keywords)
-            return convert_to_unicode(os.path.relpath(convert_to_string(
-                self._path
-            ), *arguments, **keywords))
         return convert_to_unicode(os.path.relpath(
             convert_to_string(self._path), *arguments,
             start=self.__class__(location=context)._path, **keywords))
@@ -1591,6 +2448,19 @@ class Handler(Class):
 
             >>> Handler.set_root(root_backup) # doctest: +ELLIPSIS
             <class '...Handler'>
+
+            >>> handler = Handler(location=__file_path__)
+            >>> handler.directory is handler.directory
+            False
+            >>> directory = handler.directory
+            >>> directory._encoding = 'latin_1'
+            >>> directory._path = directory._path + 'moved'
+            >>> handler.directory._encoding == directory._encoding
+            False
+            >>> handler.directory.path == Handler(
+            ...     location=__file_path__
+            ... ).directory.path != directory.path
+            True
         '''
         directory_path = self.get_path(
             output_with_root_prefix=output_with_root_prefix)
@@ -1601,8 +2471,22 @@ class Handler(Class):
         ) > builtins.len(os.sep):
             subtrahend += builtins.len(os.sep)
         if subtrahend:
-            return self.__class__(location=directory_path[:-subtrahend])
-        return self.__class__(location=directory_path)
+            directory_path = directory_path[:-subtrahend]
+        if output_with_root_prefix is not None:
+            return self.__class__(location=directory_path)
+        '''
+            NOTE: Cached templates are never handed out. Each caller gets \
+            its own copy so mutable state like the encoding or iteration \
+            indexes isn't shared between unrelated callers.
+        '''
+        key = self.__class__, directory_path, self.__class__._root_path
+        template = self.__class__._directory_cache.get(key)
+        if template is None:
+            template = self.__class__(location=directory_path)
+            self.__class__._directory_cache[key] = template
+        directory = template._clone()
+        directory._directory_template = template
+        return directory
 
     @JointPoint(Class.pseudo_property)
 # # python3.5
@@ -1654,6 +2538,11 @@ class Handler(Class):
         keywords_dictionary.pop_from_keywords(
             name='force_windows_behavior', default_value=False)
 # #
+        use_cache = not (
+            arguments or keywords or force_windows_behavior or
+            output_with_root_prefix is not None)
+        if use_cache and 'name' in self._get_path_component_cache():
+            return self._path_component_cache['name']
         path = self.get_path(output_with_root_prefix=output_with_root_prefix)
         if builtins.len(path) and path.endswith(os.sep):
             path = path[:-builtins.len(os.sep)]
@@ -1668,13 +2557,17 @@ class Handler(Class):
                 '[A-Za-z]:$'
             ).match(path)):
 # #
-            return path
+            name = path
+        else:
 # # python3.5
-# #         return os.path.basename(path, *arguments, **keywords)
-        return convert_to_unicode(os.path.basename(convert_to_string(
-            path
-        ), *arguments, **keywords))
+# #             name = os.path.basename(path, *arguments, **keywords)
+            name = convert_to_unicode(os.path.basename(convert_to_string(
+                path
+            ), *arguments, **keywords))
 # #
+        if use_cache:
+            self._get_path_component_cache()['name'] = name
+        return name
 
     @JointPoint(Class.pseudo_property)
 # # python3.5
@@ -1713,20 +2606,28 @@ class Handler(Class):
             content=keywords
         ).pop_from_keywords(name='output_with_root_prefix')
 # #
+        use_cache = not (
+            arguments or keywords or output_with_root_prefix is not None)
+        if use_cache and 'basename' in self._get_path_component_cache():
+            return self._path_component_cache['basename']
         if self._has_extension:
 # # python3.5
-# #             return os.path.splitext(os.path.basename(
+# #             basename = os.path.splitext(os.path.basename(
 # #                 self.get_path(
 # #                     output_with_root_prefix=output_with_root_prefix
 # #                 ), *arguments, **keywords)
 # #             )[0]
-            return convert_to_unicode(os.path.splitext(os.path.basename(
+            basename = convert_to_unicode(os.path.splitext(os.path.basename(
                 convert_to_string(self.get_path(
                     output_with_root_prefix=output_with_root_prefix
                 ), *arguments, **keywords)
             ))[0])
 # #
-        return self.name
+        else:
+            basename = self.name
+        if use_cache:
+            self._get_path_component_cache()['basename'] = basename
+        return basename
 
     @JointPoint(Class.pseudo_property)
 # # python3.5     def get_free_space(self: Self) -> builtins.int:
@@ -1933,6 +2834,75 @@ class Handler(Class):
 
     @JointPoint(Class.pseudo_property)
 # # python3.5
+# #     def get_memory_map(
+# #         self: Self, writeable=False
+# #     ) -> builtins.memoryview:
+    def get_memory_map(self, writeable=False):
+# #
+        '''
+            Maps the referenced file into memory. Slicing the mapped content \
+            is done by the operating system's page cache so huge files can \
+            be accessed randomly without reading them completely.
+
+            **writeable** - Indicates whether changes on the returned object \
+                            should be written through to current file.
+
+            Returns a memory view (or the memory map itself in python2.7).
+
+            Examples:
+
+            >>> handler = Handler(__test_folder__.path + 'get_memory_map')
+            >>> handler.content = 'hans'
+
+            >>> bytes(handler.memory_map[1:3]) == b'an'
+            True
+
+            >>> memory_map = handler.get_memory_map(writeable=True)
+            >>> memory_map[0:1] = b'H'
+            >>> del memory_map
+            >>> handler.content
+            'Hans'
+
+            >>> handler.content = ''
+            >>> bytes(handler.memory_map) == b''
+            True
+
+            >>> Handler(
+            ...     __test_folder__.path + 'get_memory_map_not_existing'
+            ... ).memory_map # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Memory mapping is only ...
+        '''
+        if not self.is_file():
+            raise __exception__(
+                'Memory mapping is only possible for files and not for "%s".',
+                self.path)
+        mode = 'rb'
+        access = mmap.ACCESS_READ
+        if writeable:
+            mode = 'r+b'
+            access = mmap.ACCESS_WRITE
+# # python3.5
+# #         with builtins.open(self._path, mode) as file:
+# #             if not os.fstat(file.fileno()).st_size:
+# #                 '''NOTE: Empty files can't be mapped.'''
+# #                 return builtins.memoryview(builtins.bytearray())
+# #             return builtins.memoryview(mmap.mmap(
+# #                 file.fileno(), 0, access=access))
+        with builtins.open(convert_to_string(self._path), mode) as file:
+            if not os.fstat(file.fileno()).st_size:
+                '''NOTE: Empty files can't be mapped.'''
+                return builtins.bytearray()
+            '''
+                NOTE: Memory maps doesn't support the new buffer protocol in \
+                python2.7 so they can't be wrapped into a memory view.
+            '''
+            return mmap.mmap(file.fileno(), 0, access=access)
+# #
+
+    @JointPoint(Class.pseudo_property)
+# # python3.5
 # #     def get_portable_link_pattern(
 # #         self: Self, force_windows_behavior=False
 # #     ) -> builtins.str:
@@ -2268,6 +3238,51 @@ class Handler(Class):
 # #
         return self
 
+    @JointPoint
+# # python3.5
+# #     def append_content(
+# #         self: Self, content: (builtins.str, builtins.bytes),
+# #         *arguments: builtins.object, **keywords: builtins.object
+# #     ) -> Self:
+    def append_content(self, content, *arguments, **keywords):
+# #
+        '''
+            Appends given content to the end of current file without \
+            reading or rewriting existing content. This method serves as \
+            wrapper method for "set_content()".
+
+            **content** - Content to append to current file.
+
+            Additional arguments and keywords are forwarded to \
+            "self.set_content()".
+
+            Examples:
+
+            >>> handler = Handler(__test_folder__.path + 'append_content')
+            >>> handler.content = 'hans'
+
+            >>> handler.append_content(' and peter') # doctest: +ELLIPSIS
+            Object of "Handler" with path "..." ...
+            >>> handler.content
+            'hans and peter'
+
+            >>> handler.append_content(b'!') # doctest: +ELLIPSIS
+            Object of "Handler" with path "..." ...
+            >>> handler.content
+            'hans and peter!'
+
+            >>> Handler().append_content(
+            ...     'A'
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Set content is only ...
+        '''
+        mode = 'a'
+        if Object(content).is_binary():
+            mode = 'a+b'
+        return self.set_content(content, mode, *arguments, **keywords)
+
     @JointPoint(Class.pseudo_property)
 # # python3.5
 # #     def set_directory(
@@ -3016,6 +4031,277 @@ class Handler(Class):
 
     @JointPoint
 # # python3.5
+# #     def backup_into_store(
+# #         self: Self, store: (SelfClassObject, builtins.str),
+# #         algorithm='sha1', number_of_threads=None
+# #     ) -> SelfClassObject:
+    def backup_into_store(
+        self, store, algorithm='sha1', number_of_threads=None
+    ):
+# #
+        '''
+            Creates an incremental backup of current file or directory in a \
+            content addressed store. Each distinct file content is saved \
+            only once in the stores "blobs" directory named by its hash. \
+            Each backup is described by a manifest in the stores \
+            "manifests" directory mapping relative paths to size, \
+            modification time and hash of each file. Files with the same \
+            size and modification time as in the latest manifest of the \
+            same source and algorithm aren't hashed again. All other files \
+            are hashed concurrently.
+
+            **store**             - Directory to save blobs and manifests \
+                                    in. It will be created if it doesn't \
+                                    exist yet and is excluded from backup.
+
+            **algorithm**         - Name of a hash algorithm supported by \
+                                    "hashlib".
+
+            **number_of_threads** - Number of files to hash or store at the \
+                                    same time. Defaults to twice the number \
+                                    of available cpu's.
+
+            Returns a "Handler" object referencing the new manifest.
+
+            Examples:
+
+            >>> source = Handler(
+            ...     __test_folder__.path + 'backup_into_store',
+            ...     make_directory=True)
+            >>> a = Handler(source.path + 'a')
+            >>> a.content = 'hans'
+            >>> sub_directory = Handler(
+            ...     source.path + 'sub', make_directory=True)
+            >>> b = Handler(sub_directory.path + 'b')
+            >>> b.content = 'hans'
+            >>> store = source.path + 'store'
+
+            >>> manifest = source.backup_into_store(store)
+            >>> files = json.loads(manifest.content)['files']
+            >>> builtins.sorted(files.keys()) == ['a', 'sub' + os.sep + 'b']
+            True
+            >>> files['a'][2] == a.get_hash(algorithm='sha1')
+            True
+            >>> blobs = Handler(store + '/blobs')
+            >>> Handler(
+            ...     blobs.path + files['a'][2][:2] + '/' + files['a'][2]
+            ... ).content
+            'hans'
+            >>> builtins.len(blobs._determine_native_file_paths())
+            1
+
+            >>> a.content = 'peter'
+            >>> files = json.loads(source.backup_into_store(
+            ...     store
+            ... ).content)['files']
+            >>> files['a'][2] == a.get_hash(algorithm='sha1')
+            True
+            >>> builtins.len(blobs._determine_native_file_paths())
+            2
+
+            >>> shared_store = (
+            ...     __test_folder__.path + 'backup_into_store_shared')
+            >>> first = Handler(
+            ...     __test_folder__.path + 'backup_into_store_first',
+            ...     make_directory=True)
+            >>> second = Handler(
+            ...     __test_folder__.path + 'backup_into_store_second',
+            ...     make_directory=True)
+            >>> first_file = Handler(first.path + 'a')
+            >>> first_file.content = 'hans'
+            >>> first_file.set_timestamp((1, 1))
+            True
+            >>> second_file = Handler(second.path + 'a')
+            >>> second_file.content = 'otto'
+            >>> second_file.set_timestamp((1, 1))
+            True
+            >>> first.backup_into_store(shared_store) # doctest: +ELLIPSIS
+            Object of "Handler" with path "...backup_into_store_shared...
+            >>> files = json.loads(second.backup_into_store(
+            ...     shared_store
+            ... ).content)['files']
+            >>> files['a'][2] == second_file.get_hash(algorithm='sha1')
+            True
+
+            >>> file_manifest = a.backup_into_store(
+            ...     __test_folder__.path + 'backup_into_store_file',
+            ...     algorithm='md5')
+            >>> builtins.list(json.loads(file_manifest.content)['files'])
+            ['a']
+        '''
+        store = self.__class__(location=store, make_directory=True)
+        manifests = self.__class__(
+            location=store.path + 'manifests', make_directory=True)
+# # python3.5
+# #         blobs_path = self.__class__(
+# #             location=store.path + 'blobs', make_directory=True
+# #         ).path
+# #         manifest_names = os.listdir(manifests.path)
+        blobs_path = convert_to_string(self.__class__(
+            location=store.path + 'blobs', make_directory=True
+        ).path)
+        manifest_names = builtins.map(convert_to_unicode, os.listdir(
+            convert_to_string(manifests.path)))
+# #
+        previous_files = {}
+        for manifest_name in builtins.sorted(manifest_names, reverse=True):
+            '''
+                NOTE: A store may be shared by different sources, so only \
+                manifests of the current one describe its files.
+            '''
+            previous_manifest = self._read_manifest(
+                manifests.path + manifest_name)
+            if previous_manifest.get('source') == self.path:
+                if previous_manifest['algorithm'] == algorithm:
+                    previous_files = previous_manifest['files']
+                break
+        files = {}
+        paths_to_hash = []
+        for relative_path, path in self._determine_native_file_paths(
+            exclude=store
+        ):
+            status = os.stat(path)
+# # python3.5
+# #             previous_file = previous_files.get(relative_path)
+            relative_path = convert_to_unicode(relative_path)
+            previous_file = previous_files.get(relative_path)
+# #
+            if previous_file is not None and previous_file[:2] == [
+                status.st_size, status.st_mtime
+            ]:
+                files[relative_path] = previous_file
+            else:
+                files[relative_path] = [status.st_size, status.st_mtime, None]
+                paths_to_hash.append((relative_path, path))
+        '''Maps each missing blob to all files expected to provide it.'''
+        pending = {}
+        for (relative_path, path), hash_value in builtins.zip(
+            paths_to_hash, self._map_in_parallel(
+                function=self._create_native_hash_function(
+                    algorithm, chunk_size=None
+                ), items=[path for relative_path, path in paths_to_hash],
+                number_of_threads=number_of_threads)
+        ):
+            files[relative_path][2] = hash_value
+            if not os.path.isfile(os.path.join(
+                blobs_path, hash_value[:2], hash_value
+            )):
+                pending.setdefault(hash_value, []).append(
+                    (relative_path, path))
+        store_blob = self._create_native_blob_store_function(
+            algorithm, blobs_path)
+        while pending:
+            '''
+                Each missing blob is stored from one of its files. If that \
+                file has been changed since hashing, its content is stored \
+                under its new hash and another file is tried next round.
+            '''
+            candidates = [
+                (hash_value, paths.pop(0))
+                for hash_value, paths in pending.items()]
+            stored_hash_values = self._map_in_parallel(
+                function=store_blob,
+                items=[candidate[1][1] for candidate in candidates],
+                number_of_threads=number_of_threads)
+            for candidate, stored_hash_value in builtins.zip(
+                candidates, stored_hash_values
+            ):
+                hash_value, relative_path = candidate[0], candidate[1][0]
+                if stored_hash_value is None:
+                    raise __exception__(
+                        'Storing file contents of "%s" in "%s" failed.',
+                        self.path, store.path)
+                files[relative_path][2] = stored_hash_value
+                if stored_hash_value == hash_value or not pending[hash_value]:
+                    del pending[hash_value]
+        manifest = self.__class__(location=manifests.path + '%s.json' % (
+            DateTime.now().strftime('%Y%m%d%H%M%S%f')))
+        manifest.content = json.dumps({
+            'algorithm': algorithm, 'source': self.path, 'files': files})
+        return manifest
+
+    @JointPoint
+# # python3.5
+# #     def restore_from_store(
+# #         self: Self, manifest: (SelfClassObject, builtins.str),
+# #         number_of_threads=None
+# #     ) -> Self:
+    def restore_from_store(self, manifest, number_of_threads=None):
+# #
+        '''
+            Restores a backup created by "backup_into_store()" into current \
+            directory. Modification times are restored as well.
+
+            **manifest**          - Path or "Handler" object of the \
+                                    manifest describing the backup.
+
+            **number_of_threads** - Number of files to restore at the same \
+                                    time. Defaults to twice the number of \
+                                    available cpu's.
+
+            Examples:
+
+            >>> source = Handler(
+            ...     __test_folder__.path + 'restore_from_store',
+            ...     make_directory=True)
+            >>> sub_directory = Handler(
+            ...     source.path + 'sub', make_directory=True)
+            >>> file = Handler(sub_directory.path + 'file')
+            >>> file.content = 'hans'
+            >>> manifest = source.backup_into_store(
+            ...     __test_folder__.path + 'restore_from_store_store')
+            >>> target = Handler(
+            ...     __test_folder__.path + 'restore_from_store_target')
+
+            >>> target.restore_from_store(manifest) # doctest: +ELLIPSIS
+            Object of "Handler" with path "...restore_from_store_target..."...
+            >>> restored_file = Handler(target.path + 'sub/file')
+            >>> restored_file.content
+            'hans'
+            >>> builtins.abs(restored_file.timestamp - file.timestamp) < 0.001
+            True
+        '''
+        manifest = self.__class__(location=manifest, must_exist=True)
+# # python3.5
+# #         blobs_path = manifest.directory.directory.path + 'blobs'
+# #         self.make_directories()
+# #         target_path = self._get_ending_delimter_trimmed()
+        blobs_path = convert_to_string(
+            manifest.directory.directory.path + 'blobs')
+        self.make_directories()
+        target_path = convert_to_string(self._get_ending_delimter_trimmed())
+# #
+        operations = []
+        timestamps = []
+        for relative_path, (size, timestamp, hash_value) in \
+                self._read_manifest(manifest)['files'].items():
+# # python3.5
+# #             path = os.path.join(target_path, relative_path)
+# #             if not os.path.isdir(os.path.dirname(path)):
+# #                 os.makedirs(os.path.dirname(path))
+# #             operations.append(('copy', os.path.join(
+# #                 blobs_path, hash_value[:2], hash_value
+# #             ), path))
+            path = os.path.join(target_path, convert_to_string(relative_path))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            operations.append(('copy', os.path.join(
+                blobs_path, convert_to_string(hash_value[:2]),
+                convert_to_string(hash_value)
+            ), path))
+# #
+            timestamps.append((path, timestamp))
+        if self.process_operations(
+            operations, number_of_threads=number_of_threads
+        ):
+            raise __exception__(
+                'Restoring "%s" into "%s" failed.', manifest.path, self.path)
+        for path, timestamp in timestamps:
+            os.utime(path, (timestamp, timestamp))
+        return self
+
+    @JointPoint
+# # python3.5
 # #     def is_equivalent(
 # #         self: Self, other: (SelfClassObject, builtins.str)
 # #     ) -> builtins.bool:
@@ -4519,6 +5805,105 @@ class Handler(Class):
                     *arguments, **keywords)
         return True
 
+    @JointPoint
+# # python3.5     def iterate_chunks(self: Self, size=None) -> Generator:
+    def iterate_chunks(self, size=None):
+        '''
+            Reads current file chunk by chunk in binary mode. Only one chunk \
+            is held in memory at a time, so even huge files can be processed \
+            in constant memory.
+
+            **size** - Maximum number of bytes per chunk. If nothing is \
+                       provided "CHUNK_SIZE_IN_BYTE" will be used.
+
+            Returns a generator yielding binary strings.
+
+            Examples:
+
+            >>> handler = Handler(__test_folder__.path + 'iterate_chunks')
+            >>> handler.content = 'hans'
+
+            >>> list(handler.iterate_chunks(size=3)) == [b'han', b's']
+            True
+
+            >>> b''.join(handler.iterate_chunks()) == b'hans'
+            True
+
+            >>> handler.content = ''
+            >>> list(handler.iterate_chunks())
+            []
+
+            >>> list(Handler(
+            ...     __test_folder__.path + 'iterate_chunks_not_existing'
+            ... ).iterate_chunks()) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Could only iterate ...
+        '''
+        if not self.is_file():
+            raise __exception__(
+                'Could only iterate over content of a file (not "%s").',
+                self.path)
+        if size is None:
+            size = self.CHUNK_SIZE_IN_BYTE
+# # python3.5         with builtins.open(self._path, 'rb') as file:
+        with builtins.open(convert_to_string(self._path), 'rb') as file:
+            while True:
+                chunk = file.read(size)
+                if not chunk:
+                    break
+                yield chunk
+
+    @JointPoint
+# # python3.5     def iterate_lines(self: Self, strict=False) -> Generator:
+    def iterate_lines(self, strict=False):
+        '''
+            Reads current text file line by line with respect to current \
+            encoding. Line endings are preserved.
+
+            **strict** - Indicates whether encoding should through an \
+                         exception.
+
+            Returns a generator yielding text lines.
+
+            Examples:
+
+            >>> handler = Handler(__test_folder__.path + 'iterate_lines')
+            >>> handler.content = 'hans\\npeter\\nklaus'
+
+            >>> list(handler.iterate_lines())
+            ['hans\\n', 'peter\\n', 'klaus']
+
+            >>> handler.content = ''
+            >>> list(handler.iterate_lines())
+            []
+
+            >>> list(Handler(
+            ...     __test_folder__.path + 'iterate_lines_not_existing'
+            ... ).iterate_lines()) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.FileError: Could only iterate ...
+        '''
+        if not self.is_file():
+            raise __exception__(
+                'Could only iterate over content of a file (not "%s").',
+                self.path)
+        errors = 'strict' if strict else 'ignore'
+# # python3.5
+# #         with builtins.open(
+# #             self._path, 'r', encoding=self._encoding, errors=errors
+# #         ) as file:
+# #             for line in file:
+# #                 yield line
+        with codecs.open(
+            convert_to_string(self._path), 'r', encoding=self._encoding,
+            errors=errors
+        ) as file:
+            for line in file:
+                yield convert_to_unicode(line)
+# #
+
     @JointPoint
 # # python3.5
 # #     def delete_file_patterns(self: Self, *patterns: builtins.str) -> Self:
@@ -4919,6 +6304,132 @@ class Handler(Class):
 # # python3.5         return location
         return convert_to_unicode(location)
 
+# # python3.5     def _clone(self: Self) -> SelfClassObject:
+    def _clone(self):
+        '''
+            Creates an independent copy of this handler without \
+            initializing it again like "__copy__()" does.
+
+            NOTE: This method isn't wrapped by a joint point since it backs \
+            each "get_directory()" call.
+
+            Examples:
+
+            >>> handler = Handler(location=__file_path__)
+            >>> clone = handler._clone()
+            >>> clone is handler
+            False
+            >>> clone.path == handler.path
+            True
+            >>> clone._path_component_cache is handler._path_component_cache
+            False
+        '''
+        clone = builtins.object.__new__(self.__class__)
+        for name in Handler.__slots__:
+            if name != '__weakref__':
+                try:
+                    value = builtins.getattr(Handler, name).__get__(self)
+                except builtins.AttributeError:
+                    continue
+                if builtins.isinstance(value, builtins.dict):
+                    value = builtins.dict(value)
+                builtins.getattr(Handler, name).__set__(clone, value)
+        if builtins.hasattr(self, '__dict__'):
+            clone.__dict__.update(self.__dict__)
+        return clone
+
+    @JointPoint
+# # python3.5     def _get_path_component_cache(self: Self) -> builtins.dict:
+    def _get_path_component_cache(self):
+        '''
+            Returns a cache for path components derived from current path. \
+            The cache is cleared whenever the internal path or the global \
+            root path has changed.
+
+            Examples:
+
+            >>> handler = Handler(location=__file_path__)
+            >>> handler.name
+            'file.py'
+            >>> handler._get_path_component_cache()['name']
+            'file.py'
+
+            >>> handler._path = handler._path + 'c'
+            >>> handler._get_path_component_cache()
+            {}
+            >>> handler.name
+            'file.pyc'
+        '''
+        key = self._path, self.__class__._root_path
+        if self._path_component_cache_key != key:
+            self._path_component_cache = {}
+            self._path_component_cache_key = key
+        return self._path_component_cache
+
+    @JointPoint
+# # python3.5
+# #     def _determine_native_file_paths(
+# #         self: Self, exclude=None
+# #     ) -> builtins.list:
+    def _determine_native_file_paths(self, exclude=None):
+# #
+        '''
+            Determines relative and absolute native paths of all files in \
+            current directory (recursively) or of current file. Pythons \
+            native "os.walk()" is used to avoid creating a "Handler" object \
+            for each file.
+
+            **exclude** - Optional directory to skip.
+
+            Examples:
+
+            >>> directory = Handler(
+            ...     __test_folder__.path + '_determine_native_file_paths',
+            ...     make_directory=True)
+            >>> Handler(directory.path + 'file').content = ''
+            >>> excluded = Handler(
+            ...     directory.path + 'excluded', make_directory=True)
+            >>> Handler(excluded.path + 'file').content = ''
+
+            >>> paths = directory._determine_native_file_paths(excluded)
+            >>> [relative_path for relative_path, path in paths]
+            ['file']
+            >>> Handler(paths[0][1]) == Handler(directory.path + 'file')
+            True
+
+            >>> Handler(
+            ...     paths[0][1]
+            ... )._determine_native_file_paths(excluded)[0][0]
+            'file'
+        '''
+# # python3.5
+# #         path = self._get_ending_delimter_trimmed()
+# #         if self.is_file():
+# #             return [(os.path.basename(path), path)]
+# #         excluded_path = None
+# #         if exclude is not None:
+# #             excluded_path = exclude._get_ending_delimter_trimmed()
+        path = convert_to_string(self._get_ending_delimter_trimmed())
+        if self.is_file():
+            return [(os.path.basename(path), path)]
+        excluded_path = None
+        if exclude is not None:
+            excluded_path = convert_to_string(
+                exclude._get_ending_delimter_trimmed())
+# #
+        paths = []
+        for directory_path, directory_names, file_names in os.walk(path):
+            directory_names[:] = [
+                name for name in directory_names if os.path.join(
+                    directory_path, name
+                ) != excluded_path]
+            for file_name in file_names:
+                file_path = os.path.join(directory_path, file_name)
+                if os.path.isfile(file_path):
+                    paths.append(
+                        (os.path.relpath(file_path, path), file_path))
+        return paths
+
     @JointPoint
 # # python3.5
 # #     def _set_path(self: Self, path: builtins.str) -> builtins.bool:
@@ -4945,7 +6456,17 @@ class Handler(Class):
             True
             >>> handler.path # doctest: +ELLIPSIS
             '...boostnode...'
+
+            >>> handler = Handler(location=__file_path__)
+            >>> handler.name
+            'file.py'
+            >>> path = handler.directory.path
+            >>> handler._set_path(path)
+            True
+            >>> handler.name
+            'extension'
         '''
+        self._path_component_cache_key = None
 # # python3.5
 # #         self._path = os.path.normpath(path)
 # #         if not self.is_referenced_via_absolute_path():
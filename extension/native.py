@@ -68,7 +68,8 @@ import boostnode
 from boostnode import ENCODING, convert_to_string, convert_to_unicode
 # #
 from boostnode.extension.type import Null
-from boostnode.paradigm.aspectOrientation import FunctionDecorator, JointPoint
+from boostnode.paradigm.aspectOrientation import FunctionDecorator, \
+    JointPoint, get_caller_frame
 from boostnode.paradigm.objectOrientation import Class
 
 # endregion
@@ -938,19 +939,16 @@ class Object(Class):
             NotImplementedError: Method "..." wasn't implemented...
         '''
         '''
-            NOTE: fetch third frame "inspect.stack()[2]" \
-                0: this \
-                1: Decorator wrapper \
-                2: caller
+            NOTE: The abstract method is the first caller of this method \
+            which isn't a joint point wrapper.
         '''
         if class_name is None:
             class_name = cls.__name__
-        stack_level = 1 if sys.flags.optimize else 2
         return builtins.NotImplementedError(
             'Method "{name}" wasn\'t implemented by "{class_name}" and is '
             'necessary for abstract class "{abstract_class}".'.format(
-                name=inspect.stack()[stack_level][3], class_name=class_name,
-                abstract_class=abstract_class_name))
+                name=get_caller_frame(inspect.currentframe()).f_code.co_name,
+                class_name=class_name, abstract_class=abstract_class_name))
 
     # # endregion
 
@@ -4352,6 +4350,71 @@ class Dictionary(Iterable, builtins.dict):
     # endregion
 
 
+# # python3.5 class DeferredLogger:
+class DeferredLogger(builtins.object):
+
+    '''
+        Stands in for a module's logger until it is used the first time. \
+        Then the real logger is created and replaces this instance in the \
+        module's scope.
+
+        NOTE: Methods aren't wrapped by joint points since this class exists \
+        to avoid any overhead while importing modules.
+
+        Examples:
+
+        >>> from boostnode.extension.output import Logger
+
+        >>> module = ModuleType(builtins.str('deferred_logger_test'))
+        >>> module.__logger__ = DeferredLogger(module)
+        >>> module.__logger__ # doctest: +ELLIPSIS
+        Object of "DeferredLogger" for module "deferred_logger_test".
+
+        >>> module.__logger__.name
+        'deferred_logger_test'
+        >>> module.__logger__ is Logger.get('deferred_logger_test')
+        True
+    '''
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+# # python3.5
+# #     def __init__(self: Self, module: ModuleType) -> None:
+    def __init__(self, module):
+# #
+        '''Saves given module to determine the logger name later.'''
+        self.module = module
+
+# # python3.5     def __repr__(self: Self) -> builtins.str:
+    def __repr__(self):
+        '''Invokes if this object should describe itself by a string.'''
+        return 'Object of "{class_name}" for module "{name}".'.format(
+            class_name=self.__class__.__name__, name=self.module.__name__)
+
+# # python3.5
+# #     def __getattr__(self: Self, name: builtins.str) -> builtins.object:
+    def __getattr__(self, name):
+# #
+        '''
+            Creates the real logger, replaces this instance in the module's \
+            scope and forwards the requested attribute.
+        '''
+        from boostnode.extension.output import Logger
+
+        self.module.__logger__ = Logger.get(self.module.__name__)
+        return builtins.getattr(self.module.__logger__, name)
+
+    # # # endregion
+
+    # # endregion
+
+    # endregion
+
+
 class Module(Object):
 
     '''This class adds some features for dealing with modules.'''
@@ -4867,11 +4930,11 @@ class Module(Object):
 # # python3.5
 # #     def extend(
 # #         cls: SelfClass, name=__name__, frame=None, module=None,
-# #         post_extend_others=True
+# #         post_extend_others=True, lazy=False
 # #     ) -> builtins.dict:
     def extend(
         cls, name=__name__, frame=None, module=None,
-        post_extend_others=True
+        post_extend_others=True, lazy=False
     ):
 # #
         '''
@@ -4891,6 +4954,11 @@ class Module(Object):
                                      dependencies of other modules and extend \
                                      them if possible.
 
+            **lazy**               - indicates whether to derive the module's \
+                                     name and path from its file and to \
+                                     defer creating its logger till first \
+                                     usage.
+
             Returns a dictionary with new module's scope and module name.
 
             Examples:
@@ -4914,48 +4982,64 @@ class Module(Object):
             ...     __name__, module=sys.modules['doctest']
             ... ) # doctest: +ELLIPSIS
             {...'name': 'doctest'...}
+
+            >>> module = ModuleType(builtins.str('lazy_test'))
+            >>> module.__file__ = __file__
+            >>> Module.extend(module=module, lazy=True) # doctest: +ELLIPSIS
+            {...'name': 'lazy_test'...}
+            >>> module.__module_name__
+            'native'
+            >>> module.__file_path__ # doctest: +ELLIPSIS
+            '...boostnode...extension...native.py'
+            >>> module.__logger__
+            Object of "DeferredLogger" for module "lazy_test".
+            >>> module.__exception__ # doctest: +ELLIPSIS
+            <class '...NativeError'>
+
+            >>> import subprocess
+            >>> environment = copy(os.environ)
+            >>> environment[builtins.str('BOOSTNODE_FAST_IMPORT')] = (
+            ...     builtins.str('true'))
+            >>> environment[builtins.str('PYTHONPATH')] = builtins.str(
+            ...     os.pathsep.join(sys.path))
+            >>> print(subprocess.check_output((
+            ...     sys.executable, '-c', '\\n'.join((
+            ...         'import boostnode.extension.system',
+            ...         'from boostnode.extension import file',
+            ...         'file.__logger__.debug("fast import")',
+            ...         'print(file.__logger__.__class__.__name__)',
+            ...         'try:',
+            ...         '    file.Handler("/not/existing", must_exist=True)',
+            ...         'except file.__exception__ as exception:',
+            ...         '    print(exception.__class__.__name__)'))
+            ... ), env=environment).decode('utf_8').strip())
+            Logger
+            FileError
         '''
-        from boostnode.extension.output import Logger
         if module is None:
             module = sys.modules[name]
         else:
             name = module.__name__
-        module.__logger__ = Logger.get(name)
-        if(not builtins.hasattr(module, '__module_name__') or
-           module.__module_name__ is None):
-            module.__module_name__ = cls.get_name(frame, module)
-# # python3.5
-# #         module.__exception__ = builtins.type('%sError' % String(
-# #             module.__module_name__
-# #         ).camel_case_capitalize.content, (builtins.Exception,), {
-# #             '__init__': lambda self, message,
-# #             *arguments: builtins.Exception.__init__(
-# #                 self, message % arguments
-# #             ) if arguments else builtins.Exception.__init__(
-# #                 self, message)})
-        module.__exception__ = builtins.type(builtins.str('%sError' % String(
-            module.__module_name__
-        ).camel_case_capitalize.content), (builtins.Exception,), {
-            '__init__': lambda self, message,
-            *arguments: builtins.Exception.__init__(
-                self, message % arguments
-            ) if arguments else builtins.Exception.__init__(
-                self, message)})
-# #
-        module.__test_mode__ = False
-        module.__file_path__ = cls.get_name(
-            frame, module, path=True, extension=True)
-        '''Extend imported modules which couldn't be extended yet.'''
+        if lazy and builtins.getattr(module, '__file__', None):
+            result = cls._extend_lazy(module)
+        else:
+            result = cls._extend_eager(name, frame, module)
+        '''
+            Extend imported modules which couldn't be extended yet. Core \
+            modules can't extend themselves while being imported so they \
+            rely on this step in lazy mode as well.
+        '''
         if post_extend_others:
-            for imported_name, imported_module in sys.modules.items():
+            for imported_name, imported_module in builtins.tuple(
+                sys.modules.items()
+            ):
                 if('%s.' % imported_name.startswith(boostnode.__name__) and
                    builtins.hasattr(imported_module, '__module_name__') and
                    imported_module.__module_name__ is None):
-                    '''Take this method via introspection.'''
-                    builtins.getattr(cls, inspect.stack()[0][3])(
+                    cls.extend(
                         name=imported_name, module=imported_module,
-                        post_extend_others=False)
-        return {'name': name, 'scope': module}
+                        post_extend_others=False, lazy=lazy)
+        return result
 
     @JointPoint(builtins.classmethod)
 # # python3.5
@@ -4998,6 +5082,13 @@ class Module(Object):
             <class '...Module'>
             >>> sys.argv = command_line_arguments_save
         '''
+        if boostnode.FAST_IMPORT and name != '__main__':
+            '''
+                Modules imported as library don't provide a command line \
+                interface so there is nothing more to prepare.
+            '''
+            cls.extend(name, frame, lazy=True)
+            return cls
         from boostnode.extension.system import CommandLine
         '''
             NOTE: We have to copy caller keywords to avoid changing the \
@@ -5053,6 +5144,116 @@ class Module(Object):
 
     # # region protected
 
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _extend_eager(
+# #         cls: SelfClass, name: builtins.str,
+# #         frame: (Frame, builtins.type(None)), module: ModuleType
+# #     ) -> builtins.dict:
+    def _extend_eager(cls, name, frame, module):
+# #
+        '''
+            Extends given module with its logger, exception type, name and \
+            file path determined via introspection.
+        '''
+        from boostnode.extension.output import Logger
+
+        module.__logger__ = Logger.get(name)
+        if(not builtins.hasattr(module, '__module_name__') or
+           module.__module_name__ is None):
+            module.__module_name__ = cls.get_name(frame, module)
+# # python3.5
+# #         module.__exception__ = builtins.type('%sError' % String(
+# #             module.__module_name__
+# #         ).camel_case_capitalize.content, (builtins.Exception,), {
+# #             '__init__': lambda self, message,
+# #             *arguments: builtins.Exception.__init__(
+# #                 self, message % arguments
+# #             ) if arguments else builtins.Exception.__init__(
+# #                 self, message)})
+        module.__exception__ = builtins.type(builtins.str('%sError' % String(
+            module.__module_name__
+        ).camel_case_capitalize.content), (builtins.Exception,), {
+            '__init__': lambda self, message,
+            *arguments: builtins.Exception.__init__(
+                self, message % arguments
+            ) if arguments else builtins.Exception.__init__(
+                self, message)})
+# #
+        module.__test_mode__ = False
+        module.__file_path__ = cls.get_name(
+            frame, module, path=True, extension=True)
+        return {'name': name, 'scope': module}
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _extend_lazy(cls: SelfClass, module: ModuleType) -> builtins.dict:
+    def _extend_lazy(cls, module):
+# #
+        '''
+            Extends given module like "extend()" but determines all values \
+            directly from the module's file location without any \
+            introspection. The module's logger is created on first usage.
+
+            Examples:
+
+            >>> module = ModuleType(builtins.str('lazy_test'))
+            >>> module.__file__ = 'lazyTest.pyc'
+            >>> Module._extend_lazy(module) # doctest: +ELLIPSIS
+            {...'name': 'lazy_test'...}
+            >>> module.__module_name__
+            'lazyTest'
+            >>> module.__file_path__ # doctest: +ELLIPSIS
+            '...lazyTest.py'
+            >>> module.__exception__ # doctest: +ELLIPSIS
+            <class '...LazyTestError'>
+            >>> raise module.__exception__(
+            ...     '%s', 'hans'
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            LazyTestError: hans
+        '''
+# # python3.5
+# #         file_path = os.path.abspath(module.__file__)
+        file_path = convert_to_unicode(os.path.abspath(module.__file__))
+# #
+        if file_path.endswith(('.pyc', '.pyo')):
+            file_path = file_path[:-1]
+        module.__logger__ = DeferredLogger(module)
+        if(not builtins.hasattr(module, '__module_name__') or
+           module.__module_name__ is None):
+            module.__module_name__ = os.path.splitext(os.path.basename(
+                file_path))[0]
+        '''
+            NOTE: This is an inlined version of \
+            "String.get_camel_case_capitalize()" to avoid creating wrapped \
+            string objects while importing.
+        '''
+# # python3.5
+# #         module.__exception__ = builtins.type('%s%sError' % (
+# #             module.__module_name__[:1].upper(),
+# #             module.__module_name__[1:]
+# #         ), (builtins.Exception,), {
+# #             '__init__': lambda self, message,
+# #             *arguments: builtins.Exception.__init__(
+# #                 self, message % arguments
+# #             ) if arguments else builtins.Exception.__init__(
+# #                 self, message)})
+        module.__exception__ = builtins.type(builtins.str('%s%sError' % (
+            module.__module_name__[:1].upper(),
+            module.__module_name__[1:]
+        )), (builtins.Exception,), {
+            '__init__': lambda self, message,
+            *arguments: builtins.Exception.__init__(
+                self, message % arguments
+            ) if arguments else builtins.Exception.__init__(
+                self, message)})
+# #
+        module.__test_mode__ = False
+        module.__file_path__ = file_path
+        return {'name': module.__name__, 'scope': module}
+
     @JointPoint(builtins.classmethod)
 # # python3.5     def _determine_scope(cls, object, only_module_level):
     def _determine_scope(cls, object, only_module_level):
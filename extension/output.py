@@ -47,8 +47,11 @@ import Queue as native_queue
 '''Make boostnode packages and modules importable via relative paths.'''
 sys.path.append(os.path.abspath(sys.path[0] + 2 * (os.sep + '..')))
 
-# # python3.5 pass
-from boostnode import convert_to_string, convert_to_unicode
+# # python3.5
+# # from boostnode import ASYNCHRONOUS_LOGGING
+from boostnode import ASYNCHRONOUS_LOGGING, convert_to_string, \
+    convert_to_unicode
+# #
 from boostnode.extension.file import Handler as FileHandler
 from boostnode.extension.native import Module
 # # python3.5 from boostnode.extension.type import Self, SelfClass
@@ -239,11 +242,12 @@ class Buffer(Class, LoggingStreamHandler):
             during truncating or writing.
         '''
         self._lock = threading.Lock()
-        '''Saves the current buffer content.'''
-# # python3.5
-# #         self._content = ''
-        self._content = builtins.str() if self.force_string else ''
-# #
+        '''
+            Saves all written chunks of a memory buffer. Reading the content \
+            collapses them into one joined chunk which serves as cached view \
+            until the next write appends another one.
+        '''
+        self._chunks = []
 
     @JointPoint
 # # python3.5     def __repr__(self: Self) -> builtins.str:
@@ -324,7 +328,7 @@ class Buffer(Class, LoggingStreamHandler):
 
     # # region getter
 
-    @JointPoint
+    @JointPoint(Class.pseudo_property)
 # # python3.5     def get_content(self: Self) -> builtins.str:
     def get_content(self):
         '''
@@ -338,29 +342,78 @@ class Buffer(Class, LoggingStreamHandler):
             >>> Buffer(queue=True).write('test').content
             'test'
         '''
-        with self._lock:
-            if self.file is not None:
-                self._content = self.file.content
-            elif self.queue:
-                self._content = ''
-                temp_buffer = []
-                while not self.queue.empty():
-# # python3.5
-# #                     temp_buffer.append(self.queue.get())
-                    temp_buffer.append(convert_to_unicode(
-                        self.queue.get()))
-# #
-                    self._content += temp_buffer[-1]
-                for content in temp_buffer:
-                    self.queue.put(content)
+        if self.file is not None:
+            with self._lock:
+                content = self.file.content
+        elif self.queue:
+            content = self._join(self.snapshot)
+        else:
+            chunks = self._chunks
+            if builtins.len(chunks) > 1:
+                with self._lock:
+                    '''
+                        NOTE: Chunks appended during joining are located \
+                        behind the replaced slice so they will survive.
+                    '''
+                    number_of_chunks = builtins.len(chunks)
+                    chunks[:number_of_chunks] = [self._join(
+                        chunks[:number_of_chunks])]
+            content = self._join(chunks[:1])
 # # python3.5
 # #         pass
         if self.force_string and builtins.isinstance(
-            self._content, builtins.unicode
+            content, builtins.unicode
         ):
-            self._content = convert_to_string(self._content)
+            content = convert_to_string(content)
 # #
-        return self._content
+        return content
+
+    @JointPoint(Class.pseudo_property)
+# # python3.5     def get_snapshot(self: Self) -> builtins.list:
+    def get_snapshot(self):
+        '''
+            Getter for all currently buffered chunks. In contrast to \
+            "clear()" the buffer content stays untouched.
+
+            Examples:
+
+            >>> buffer = Buffer(queue=True).write('a').write('b')
+            >>> buffer.snapshot
+            ['a', 'b']
+            >>> buffer.snapshot
+            ['a', 'b']
+            >>> buffer.clear()
+            'ab'
+
+            >>> Buffer().write('a').write('b').snapshot
+            ['a', 'b']
+
+            >>> buffer = Buffer(file=__test_folder__.path + 'get_snapshot')
+            >>> buffer.clear() # doctest: +ELLIPSIS
+            '...'
+            >>> buffer.write('a').write('b').snapshot
+            ['ab']
+        '''
+        if self.file is not None:
+            return [self.content]
+        if self.queue:
+            if builtins.hasattr(self.queue, 'mutex'):
+                '''
+                    NOTE: Native queues allow us to copy their underlying \
+                    storage without consuming it.
+                '''
+                with self.queue.mutex:
+                    chunks = builtins.list(self.queue.queue)
+            else:
+                chunks = []
+                with self._lock:
+                    while not self.queue.empty():
+                        chunks.append(self.queue.get())
+                    for chunk in chunks:
+                        self.queue.put(chunk)
+# # python3.5             return chunks
+            return builtins.list(builtins.map(convert_to_unicode, chunks))
+        return self._chunks[:]
 
     # # endregion
 
@@ -396,14 +449,20 @@ class Buffer(Class, LoggingStreamHandler):
         ):
             content = convert_to_string(content)
 # #
+        if self.file is None and not self.queue:
+            '''
+                NOTE: Appending to a list is atomic so writing into memory \
+                doesn't need to wait for the lock.
+            '''
+            self.last_written = content
+            self._chunks.append(content)
+            return self
         with self._lock:
             self.last_written = content
             if self.file is not None:
                 self.file.content += self.last_written
-            elif self.queue:
-                self.queue.put(self.last_written)
             else:
-                self._content += self.last_written
+                self.queue.put(self.last_written)
         return self
 
     @JointPoint
@@ -474,20 +533,48 @@ class Buffer(Class, LoggingStreamHandler):
                 else:
                     self.file.content = ''
             elif self.queue:
-                content = ''
+                chunks = []
                 while not self.queue.empty():
-                    content += self.queue.get()
+                    chunks.append(self.queue.get())
+                content = self._join(chunks)
             else:
-                content = self._content
-                self._content = ''
+                number_of_chunks = builtins.len(self._chunks)
+                content = self._join(self._chunks[:number_of_chunks])
+                del self._chunks[:number_of_chunks]
 # # python3.5
 # #         pass
         if self.force_string:
-            self._content = builtins.str()
             content = convert_to_string(content)
 # #
         return content
 
+    # # region protected
+
+# # python3.5
+# #     def _join(self: Self, chunks: builtins.list) -> builtins.str:
+    def _join(self, chunks):
+# #
+        '''
+            Concatenates given chunks in linear time.
+
+            **chunks** - list of strings to concatenate
+
+            NOTE: This method isn't wrapped by a joint point since it is used \
+            in the highly used area.
+
+            Examples:
+
+            >>> Buffer()._join(['a', 'b'])
+            'ab'
+
+            >>> Buffer()._join([])
+            ''
+        '''
+# # python3.5         return ''.join(chunks)
+        return (builtins.str() if self.force_string else '').join(chunks)
+
+    # # endregion
+
     # endregion
 
 
@@ -708,6 +795,286 @@ class ColoredLoggingFormatter(LoggingFormatter):
         ), inspect.stack()[0][3])(record)
 
 
+class AsynchronousLoggingHandler(LoggingStreamHandler):
+
+    '''
+        Hands log records over to a background thread which formats and \
+        writes them in batches. Emitting a record never waits for the \
+        underlying stream.
+
+        **stream**             - stream to write formatted records into
+
+        **maximum_queue_size** - number of pending records before back \
+                                 pressure takes effect
+
+        **back_pressure**      - "drop" discards new records while the queue \
+                                 is full and "block" waits for free space
+
+        **batch_size**         - maximum number of records written at once
+
+        Examples:
+
+        >>> buffer = Buffer()
+        >>> handler = AsynchronousLoggingHandler(stream=buffer)
+        >>> handler.setFormatter(LoggingFormatter('%(message)s'))
+        >>> logger = getLogger('AsynchronousLoggingHandler')
+        >>> logger.propagate = False
+        >>> logger.addHandler(handler)
+
+        >>> logger.critical('first')
+        >>> logger.critical('second')
+        >>> handler.flush()
+        >>> buffer.content
+        'first\\nsecond\\n'
+
+        >>> logger.removeHandler(handler)
+        >>> handler.close()
+
+        Shutting down the logging module holds the handler's lock while \
+        flushing, so pending records have to be written without it.
+
+        >>> import time
+        >>> import weakref
+        >>> class SlowStream(builtins.object):
+        ...     content = ''
+        ...     def write(self, content):
+        ...         time.sleep(0.001)
+        ...         self.content += content
+        >>> stream = SlowStream()
+        >>> handler = AsynchronousLoggingHandler(stream=stream, batch_size=1)
+        >>> for _ in builtins.range(500):
+        ...     handler.emit(logging.LogRecord(
+        ...         'test', logging.INFO, __file__, 1, 'message', (), None))
+        >>> logging.shutdown((weakref.ref(handler),))
+        >>> stream.content.count('message')
+        500
+
+        A forked process writes its records with its own writer thread.
+
+        >>> buffer = Buffer(
+        ...     file=__test_folder__.path + 'AsynchronousLoggingHandler')
+        >>> handler = AsynchronousLoggingHandler(stream=buffer)
+        >>> handler.setFormatter(LoggingFormatter('%(message)s'))
+        >>> logger.addHandler(handler)
+        >>> worker = multiprocessing.Process(
+        ...     target=lambda: logger.critical('child') or handler.flush())
+        >>> worker.start()
+        >>> worker.join()
+        >>> logger.critical('parent')
+        >>> handler.flush()
+        >>> 'child' in buffer.content, 'parent' in buffer.content
+        (True, True)
+        >>> logger.removeHandler(handler)
+        >>> handler.close()
+    '''
+
+    # region properties
+
+    BACK_PRESSURE_POLICIES = 'block', 'drop'
+    '''Defines all supported behaviors for a full queue.'''
+    terminator = '\n'
+    '''Suffix in each logging output.'''
+
+    # endregion
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+    @JointPoint
+# # python3.5
+# #     def __init__(
+# #         self: Self, stream=None, maximum_queue_size=10000,
+# #         back_pressure='drop', batch_size=100
+# #     ) -> None:
+    def __init__(
+        self, stream=None, maximum_queue_size=10000, back_pressure='drop',
+        batch_size=100
+    ):
+# #
+        '''
+            Initializes the record queue and starts the writer thread.
+
+            Examples:
+
+            >>> handler = AsynchronousLoggingHandler(back_pressure='block')
+            >>> handler.back_pressure
+            'block'
+            >>> handler.close()
+
+            >>> AsynchronousLoggingHandler(
+            ...     back_pressure='ignore'
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            boostnode.extension.native.OutputError: Back pressure policy "...
+        '''
+        if back_pressure not in self.BACK_PRESSURE_POLICIES:
+            raise __exception__(
+                'Back pressure policy "%s" isn\'t supported.', back_pressure)
+        builtins.super(AsynchronousLoggingHandler, self).__init__(stream)
+        self.maximum_queue_size = maximum_queue_size
+        self.back_pressure = back_pressure
+        self.batch_size = batch_size
+        '''Counts all records discarded due to a full queue.'''
+        self.dropped = 0
+        self._reset()
+
+    # # # endregion
+
+    def emit(self, record):
+        '''
+            Enqueues given record. Formatting is deferred to the writer \
+            thread.
+
+            **record** - log record to write
+
+            NOTE: This method isn't wrapped by a joint point since it is \
+            called for every log record.
+
+            Examples:
+
+            >>> handler = AsynchronousLoggingHandler(
+            ...     stream=Buffer(), maximum_queue_size=1)
+            >>> handler.close()
+            >>> record = logging.LogRecord(
+            ...     'test', logging.INFO, __file__, 1, 'message', (), None)
+            >>> handler.emit(record)
+            >>> handler.emit(record)
+            >>> handler.dropped
+            1
+        '''
+        if self._process_id != os.getpid():
+            '''
+                NOTE: A forked process inherits neither the writer thread \
+                nor a usable queue. Records inherited by it are written by \
+                its parent process.
+            '''
+            self._reset()
+        if self.back_pressure == 'block':
+            self.queue.put(record)
+        else:
+            try:
+                self.queue.put_nowait(record)
+            except native_queue.Full:
+                self.dropped += 1
+
+    @JointPoint
+# # python3.5     def flush(self: Self) -> None:
+    def flush(self):
+        '''
+            Waits until all pending records are written and flushes the \
+            stream.
+
+            Examples:
+
+            >>> buffer = Buffer()
+            >>> handler = AsynchronousLoggingHandler(stream=buffer)
+            >>> handler.emit(logging.LogRecord(
+            ...     'test', logging.INFO, __file__, 1, 'message', (), None))
+            >>> handler.flush()
+            >>> buffer.content
+            'message\\n'
+            >>> handler.close()
+        '''
+        if self._process_id != os.getpid():
+            self._reset()
+        if(self._writer.is_alive() and
+           threading.current_thread() is not self._writer):
+            self.queue.join()
+        with self._stream_lock:
+            if self.stream and builtins.hasattr(self.stream, 'flush'):
+                self.stream.flush()
+
+    @JointPoint
+# # python3.5     def close(self: Self) -> None:
+    def close(self):
+        '''
+            Writes all pending records and stops the writer thread.
+
+            Examples:
+
+            >>> buffer = Buffer()
+            >>> handler = AsynchronousLoggingHandler(stream=buffer)
+            >>> handler.emit(logging.LogRecord(
+            ...     'test', logging.INFO, __file__, 1, 'message', (), None))
+            >>> handler.close()
+            >>> buffer.content
+            'message\\n'
+            >>> handler.close()
+        '''
+        if self._writer.is_alive():
+            self.queue.put(None)
+            self._writer.join()
+        builtins.super(AsynchronousLoggingHandler, self).close()
+
+    # # endregion
+
+    # # region protected
+
+    @JointPoint
+# # python3.5     def _reset(self: Self) -> None:
+    def _reset(self):
+        '''
+            Initializes the record queue and starts the writer thread for \
+            the current process.
+        '''
+        self._process_id = os.getpid()
+        '''Saves all records which weren't written yet.'''
+        self.queue = native_queue.Queue(maxsize=self.maximum_queue_size)
+        '''
+            NOTE: The writer thread mustn't depend on the handler's lock \
+            since "logging.shutdown()" holds it while waiting for pending \
+            records in "flush()".
+        '''
+        self._stream_lock = threading.Lock()
+        self._writer = threading.Thread(
+            target=self._write, name='%s writer' % self.__class__.__name__)
+        self._writer.daemon = True
+        self._writer.start()
+
+    @JointPoint
+# # python3.5     def _write(self: Self) -> None:
+    def _write(self):
+        '''
+            Collects pending records in batches and writes each batch with a \
+            single stream operation. A "None" record stops this loop.
+        '''
+        while True:
+            records = [self.queue.get()]
+            while(records[-1] is not None and
+                  builtins.len(records) < self.batch_size):
+                try:
+                    records.append(self.queue.get_nowait())
+                except native_queue.Empty:
+                    break
+            output = []
+            for record in records:
+                if record is not None:
+                    try:
+                        output.append(self.format(record) + self.terminator)
+                    except builtins.Exception:
+                        self.handleError(record)
+            if output:
+                with self._stream_lock:
+                    try:
+                        self.stream.write(''.join(output))
+                        if builtins.hasattr(self.stream, 'flush'):
+                            self.stream.flush()
+                    except builtins.Exception:
+                        self.handleError(records[0])
+            for record in records:
+                self.queue.task_done()
+            if records[-1] is None:
+                break
+
+    # # endregion
+
+    # endregion
+
+
 class Logger(Class):
 
     '''
@@ -732,6 +1099,11 @@ class Logger(Class):
     '''Output buffer for all logging outputs.'''
     instances = []
     '''Saves all logging handler instances.'''
+    asynchronous = ASYNCHRONOUS_LOGGING
+    '''
+        Indicates whether new created logger handler should write their \
+        records in a background thread (see "AsynchronousLoggingHandler").
+    '''
 
     # endregion
 
@@ -828,7 +1200,7 @@ class Logger(Class):
         '''
         for logger in cls.instances:
             for handler in logger.handlers:
-                handler.stream.flush()
+                handler.flush()
         return cls
 
     @JointPoint(builtins.classmethod)
@@ -935,7 +1307,7 @@ class Logger(Class):
             if buffer:
                 new_handler = []
                 for new_buffer in cls.buffer:
-                    new_handler.append(LoggingStreamHandler(stream=new_buffer))
+                    new_handler.append(cls._create_handler(new_buffer))
             for handler, level, terminator, colored_format, format in \
             builtins.zip(
                 new_handler, cls.level, cls.terminator, cls.colored_format,
@@ -951,6 +1323,10 @@ class Logger(Class):
                 handler.setLevel(level.upper())
             for handler in logger.handlers:
                 logger.removeHandler(handler)
+                if handler not in new_handler and builtins.isinstance(
+                    handler, AsynchronousLoggingHandler
+                ):
+                    handler.close()
             for handler in new_handler:
                 logger.addHandler(handler)
             logger.setLevel(builtins.getattr(logging, cls.level[0].upper()))
@@ -1025,11 +1401,13 @@ class Logger(Class):
                 ] else builtins.getattr(cls, property_name))
         for handler in getLogger(name).handlers:
             getLogger(name).removeHandler(handler)
+            if builtins.isinstance(handler, AsynchronousLoggingHandler):
+                handler.close()
         logger = getLogger(name)
         logger.propagate = False
         for _level, _buffer, _terminator, _colored_format, _format in \
         builtins.zip(properties[0], properties[1], properties[2], properties[3], properties[4]):
-            handler = LoggingStreamHandler(stream=_buffer)
+            handler = cls._create_handler(_buffer)
             handler.terminator = _terminator
             handler.setLevel(_level.upper())
             # TODO check new branches
@@ -1045,6 +1423,38 @@ class Logger(Class):
         logger.setLevel(builtins.getattr(logging, properties[0][0].upper()))
         return logger
 
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _create_handler(
+# #         cls: SelfClass, buffer: builtins.object
+# #     ) -> LoggingStreamHandler:
+    def _create_handler(cls, buffer):
+# #
+        '''
+            Creates a logging handler writing into given buffer.
+
+            **buffer** - output stream for the new handler
+
+            Examples:
+
+            >>> asynchronous_backup = Logger.asynchronous
+
+            >>> Logger.asynchronous = False
+            >>> Logger._create_handler(Buffer()) # doctest: +ELLIPSIS
+            <...StreamHandler ...>
+
+            >>> Logger.asynchronous = True
+            >>> handler = Logger._create_handler(Buffer())
+            >>> handler.__class__.__name__
+            'AsynchronousLoggingHandler'
+            >>> handler.close()
+
+            >>> Logger.asynchronous = asynchronous_backup
+        '''
+        if cls.asynchronous:
+            return AsynchronousLoggingHandler(stream=buffer)
+        return LoggingStreamHandler(stream=buffer)
+
     # # endregion
 
     # endregion
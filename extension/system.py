@@ -43,6 +43,7 @@ except builtins.ImportError:
     fcntl = None
 import importlib
 import inspect
+import json
 import logging
 import multiprocessing
 import os
@@ -227,8 +228,15 @@ class Runnable(builtins.object):
 
             Examples:
 
-            >>> sys.flags.optimize == 1 or (Runnable._run.__wrapped__ ==
-            ...     Runnable._get_potential_wrapped_method(Runnable._run))
+            >>> def a(): pass
+            >>> def b(): pass
+            >>> b.__wrapped__ = a
+
+            >>> Runnable._get_potential_wrapped_method(b) is a
+            True
+            >>> Runnable._get_potential_wrapped_method(b, all=True) == [b, a]
+            True
+            >>> Runnable._get_potential_wrapped_method(a) is a
             True
         '''
         methods = []
@@ -1705,7 +1713,9 @@ class CommandLine(builtins.object):
              'action': 'store',
              'default': '',
              'type': builtins.str,
-             'choices': ('all', 'test', 'clear', 'document', 'lint'),
+             'choices': (
+                 'all', 'test', 'clear', 'document', 'lint',
+                 'profile-import'),
              # 'required': True,
              'help': {'execute':
                       '"Select commands for performing action with this '
@@ -1713,6 +1723,70 @@ class CommandLine(builtins.object):
                       '"\\", \\"".join(choices)'},
              'metavar': 'COMMAND'}},)
     '''Defines arguments for performing actions on python packages.'''
+    IMPORT_PROFILE_FILE_NAME = 'importProfile.json'
+    '''Defines the file name to write import profiles to.'''
+    IMPORT_PROFILE_SCRIPT = '''
+import gc
+import json
+import sys
+import time
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+try:
+    import resource
+except ImportError:
+    resource = None
+
+name, root = sys.argv[1:3]
+sys.path.insert(0, root)
+native_import = builtins.__import__
+nested_durations = [0.0]
+self_durations = []
+
+
+def profiled_import(*arguments, **keywords):
+    nested_durations.append(0.0)
+    loaded = name in sys.modules
+    start = time.time()
+    try:
+        return native_import(*arguments, **keywords)
+    finally:
+        duration = time.time() - start
+        nested_duration = nested_durations.pop()
+        nested_durations[-1] += duration
+        if not (loaded or self_durations) and name in sys.modules:
+            self_durations.append(duration - nested_duration)
+
+builtins.__import__ = profiled_import
+parts = name.split('.')
+for index in range(len(parts)):
+    profiled_import('.'.join(parts[:index + 1]))
+builtins.__import__ = native_import
+joint_point = getattr(sys.modules.get(
+    'boostnode.paradigm.aspectOrientation'), 'JointPoint', None)
+number_of_joint_points = 0
+if isinstance(joint_point, type):
+    number_of_joint_points = len([
+        object for object in gc.get_objects()
+        if isinstance(object, joint_point)])
+memory_in_byte = None
+if resource is not None:
+    memory_in_byte = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        memory_in_byte *= 1024
+print(json.dumps({
+    'name': name, 'cumulative_time_in_seconds': nested_durations[0],
+    'self_time_in_seconds': self_durations[0],
+    'number_of_joint_points': number_of_joint_points,
+    'memory_in_byte': memory_in_byte}))
+'''
+    '''
+        Imports a given module in a fresh interpreter and prints cumulative \
+        and self import time, the number of created joint points and the \
+        maximum resident memory as json.
+    '''
     DEFAULT_TEMP_FILE_PATTERNS = (
         '^temp_.+$', '^__pycache__$', '^.+\.pyc$', '^.+~$')
     '''
@@ -1971,8 +2045,8 @@ class CommandLine(builtins.object):
 # #
         '''
             Provides a command-line interface like a makefile. Supported \
-            features are linting, generate documentation, testing and \
-            removing temporary files.
+            features are linting, generate documentation, testing, profiling \
+            imports and removing temporary files.
 
             **name**                         - package name
 
@@ -2712,8 +2786,8 @@ class CommandLine(builtins.object):
     ):
 # #
         '''
-            Test, lints and documents given modules if corresponding command \
-            line flags are set.
+            Test, lints, documents and profiles given modules if \
+            corresponding command line flags are set.
 
             Examples:
 
@@ -2737,6 +2811,8 @@ class CommandLine(builtins.object):
                 documentation_path, frame,
                 current_working_directory_backup,
                 documentation_file_extension)
+        if 'profile-import' in arguments.commands:
+            cls._profile_imports(module_names)
         return cls
 
     @JointPoint(builtins.classmethod)
@@ -2964,6 +3040,91 @@ class CommandLine(builtins.object):
 
     @JointPoint(builtins.classmethod)
 # # python3.5
+# #     def _profile_imports(
+# #         cls: SelfClass, module_names: Iterable, location=None
+# #     ) -> builtins.dict:
+    def _profile_imports(cls, module_names, location=None):
+# #
+        '''
+            Imports each given module in a fresh interpreter and writes a \
+            report about their startup costs.
+
+            **module_names** - names of modules in current directory
+
+            **location**     - file path to write the json report to
+
+            Returns the written report.
+
+            Examples:
+
+            >>> report = CommandLine._profile_imports(
+            ...     ('type', 'not_existing'),
+            ...     __test_folder__.path + '_profile_imports.json')
+            >>> __test_buffer__.clear() # doctest: +ELLIPSIS
+            '...Profile import of module "boostnode.extension.type"...'
+            >>> builtins.len(report['modules'])
+            1
+            >>> module = report['modules'][0]
+            >>> module['name']
+            'boostnode.extension.type'
+            >>> (0 < module['self_time_in_seconds'] <=
+            ...  module['cumulative_time_in_seconds'])
+            True
+            >>> module['number_of_joint_points'] > 0
+            True
+            >>> module['memory_in_byte'] > 0
+            True
+            >>> report == json.loads(FileHandler(
+            ...     __test_folder__.path + '_profile_imports.json'
+            ... ).content)
+            True
+        '''
+        if location is None:
+            location = cls.IMPORT_PROFILE_FILE_NAME
+        report = {
+            'fast_import': sys.modules['boostnode'].FAST_IMPORT,
+            'python': sys.version.split()[0], 'modules': []}
+        for module_name in module_names:
+            path = os.path.abspath(module_name + '.py')
+            if not os.path.isfile(path):
+                continue
+            context_path = Module.get_context_path(path=path)
+            root = path[:-builtins.len(
+                context_path.replace('.', os.sep) + '.py')]
+            if context_path.endswith('.__init__'):
+                context_path = context_path[:-builtins.len('.__init__')]
+            __logger__.info('Profile import of module "%s".', context_path)
+# # python3.5
+# #             process = subprocess.Popen(
+# #                 (sys.executable, '-c', cls.IMPORT_PROFILE_SCRIPT,
+# #                  context_path, root),
+# #                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            process = subprocess.Popen(builtins.tuple(builtins.map(
+                convert_to_string, (
+                    sys.executable, '-c', cls.IMPORT_PROFILE_SCRIPT,
+                    context_path, root)
+            )), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+# #
+            standard_output, error_output = process.communicate()
+# # python3.5
+# #             standard_output = standard_output.decode(ENCODING)
+# #             error_output = error_output.decode(ENCODING)
+            standard_output = convert_to_unicode(standard_output)
+            error_output = convert_to_unicode(error_output)
+# #
+            if process.returncode == 0:
+                report['modules'].append(json.loads(
+                    standard_output.strip().split('\n')[-1]))
+            else:
+                __logger__.warning(
+                    'Importing module "%s" failed: %s', context_path,
+                    error_output.strip())
+        FileHandler(location).content = json.dumps(
+            report, indent=4, sort_keys=True)
+        return report
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
 # #     def _test_modules(
 # #         cls: SelfClass, module_names: Iterable,
 # #         temp_file_patterns: Iterable
@@ -39,6 +39,7 @@ import inspect
 import os
 import re as regularExpression
 import sys
+from types import FrameType as Frame
 from types import FunctionType as Function
 from types import MethodType as Method
 
@@ -74,11 +75,68 @@ ASPECTS = []
     ...                  'event': 'return'}),
     ...      'point_cut': '.+'})
 '''
+DISABLE_JOINT_POINTS = builtins.bool(
+    sys.flags.optimize
+) or os.environ.get('BOOSTNODE_DISABLE_JOINT_POINTS', '').lower() in (
+    '1', 'true', 'yes')
+'''
+    Indicates whether joint points should leave decorated functions \
+    untouched. This is the case in optimized mode or if the environment \
+    variable "BOOSTNODE_DISABLE_JOINT_POINTS" is set to "true".
+'''
+CONTEXT_PATHS = {}
+'''
+    Caches module context paths by their file path to avoid analysing the \
+    package structure for each point cut matching.
+'''
 
 # # endregion
 
 # endregion
 
+# region functions
+
+# NOTE: This function isn't wrapped by a joint point since it inspects the
+# frames created by joint points.
+# # python3.5
+# # def get_caller_frame(
+# #     frame: Frame
+# # ) -> (Frame, builtins.type(None)):
+def get_caller_frame(frame):
+# #
+    '''
+        Determines the frame which has called given frame. Frames of joint \
+        point wrappers in between are skipped, so the result doesn't depend \
+        on whether the call was handled by a joint point or not.
+
+        **frame** - frame to determine its caller for
+
+        Examples:
+
+        >>> def caller():
+        ...     return callee()
+        >>> def callee():
+        ...     return get_caller_frame(inspect.currentframe())
+
+        >>> caller().f_code.co_name
+        'caller'
+
+        >>> test_globals_backup = __test_globals__['ASPECTS']
+        >>> __test_globals__['ASPECTS'] = [{'advice': (), 'point_cut': '.*'}]
+        >>> callee = JointPoint(callee)
+        >>> caller().f_code.co_name
+        'caller'
+        >>> __test_globals__['ASPECTS'] = test_globals_backup
+    '''
+    frame = frame.f_back
+    while(frame is not None and frame.f_code.co_name in (
+        '__call__', 'wrapper_function'
+    ) and frame.f_code.co_filename == get_caller_frame.__code__.co_filename):
+        frame = frame.f_back
+    return frame
+
+# endregion
+
 
 # region abstract classes
 
@@ -316,9 +374,12 @@ class FunctionDecorator(Class):
             recursive_instance.wrapped_decorator = self.wrapped_decorator
             return recursive_instance.__get__(object, class_object)
         if self.wrapped_decorator is not None:
-            self.__func__ = builtins.getattr(
-                self.wrapped_decorator, inspect.stack()[0][3]
-            )(object, class_object)
+            '''
+                NOTE: Determining this method name via introspection is too \
+                expensive in the highly used area.
+            '''
+            self.__func__ = self.wrapped_decorator.__get__(
+                object, class_object)
         self.object = object
         self.class_object = class_object
         if self.class_object is None:
@@ -457,40 +518,6 @@ class JointPointHandler(Class):
         self.__func__ = function
         self.arguments = arguments
         self.keywords = keywords
-        self.argument_specifications = []
-# # python3.5
-# #         argument_specifications = inspect.signature(
-# #             self.__func__
-# #         ).parameters
-# #         '''
-# #             We have to bind variables to recognize keyword arguments which \
-# #             are given as positional arguments.
-# #         '''
-# #         for name, value in inspect.signature(self.__func__).bind(
-# #             *self.arguments, **self.keywords
-# #         ).arguments.items():
-# #             if(argument_specifications[name].kind is
-# #                inspect.Parameter.VAR_POSITIONAL):
-# #                 for index, positional_value in builtins.enumerate(
-# #                     value
-# #                 ):
-# #                     self.argument_specifications.append(Argument(
-# #                         parameter=argument_specifications[name],
-# #                         value=positional_value, function=self.__func__,
-# #                         name=builtins.str(index + 1) + '. argument'))
-# #             elif(argument_specifications[name].kind is
-# #                  inspect.Parameter.VAR_KEYWORD):
-# #                 for keyword_name, keyword_value in value.items():
-# #                     self.argument_specifications.append(Argument(
-# #                         parameter=argument_specifications[name],
-# #                         value=keyword_value, function=self.__func__,
-# #                         name=keyword_name))
-# #             else:
-# #                 self.argument_specifications.append(Argument(
-# #                     parameter=argument_specifications[name],
-# #                     value=value, function=self.__func__))
-        pass
-# #
 
         # # # endregion
 
@@ -510,6 +537,59 @@ class JointPointHandler(Class):
 
     # # # endregion
 
+    # # # region getter
+
+    @Class.pseudo_property
+# # python3.5     def get_argument_specifications(self: Self) -> builtins.list:
+    def get_argument_specifications(self):
+        '''
+            Binds given arguments and keywords to the handled function's \
+            signature and describes each resulting argument. Bindings are \
+            only determined if needed since most aspects don't need them.
+
+            Examples:
+
+            >>> class A:
+            ...     def a(self): pass
+
+            >>> JointPointHandler(
+            ...     A, A(), A().a, (), {}
+            ... ).argument_specifications
+            []
+        '''
+        argument_specifications = []
+# # python3.5
+# #         parameters = inspect.signature(self.__func__).parameters
+# #         '''
+# #             We have to bind variables to recognize keyword arguments which \
+# #             are given as positional arguments.
+# #         '''
+# #         for name, value in inspect.signature(self.__func__).bind(
+# #             *self.arguments, **self.keywords
+# #         ).arguments.items():
+# #             if parameters[name].kind is inspect.Parameter.VAR_POSITIONAL:
+# #                 for index, positional_value in builtins.enumerate(
+# #                     value
+# #                 ):
+# #                     argument_specifications.append(Argument(
+# #                         parameter=parameters[name], value=positional_value,
+# #                         function=self.__func__,
+# #                         name=builtins.str(index + 1) + '. argument'))
+# #             elif parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+# #                 for keyword_name, keyword_value in value.items():
+# #                     argument_specifications.append(Argument(
+# #                         parameter=parameters[name], value=keyword_value,
+# #                         function=self.__func__, name=keyword_name))
+# #             else:
+# #                 argument_specifications.append(Argument(
+# #                     parameter=parameters[name], value=value,
+# #                     function=self.__func__))
+        pass
+# #
+        return argument_specifications
+
+    # # # endregion
+
     @classmethod
 # # python3.5     def aspect(cls: SelfClass) -> None:
     def aspect(cls):
@@ -663,8 +743,11 @@ class ReturnJointPoint(JointPointHandler, ReturnAspect):
             ... ) # doctest: +ELLIPSIS
             Object of "ReturnJointPoint" with class object "A", object "...".
         '''
-        '''Take this method via introspection from super classes.'''
-        builtins.getattr(ReturnAspect, inspect.stack()[0][3])(self)
+        '''
+            NOTE: Taking this method via introspection from super classes is \
+            too expensive in the highly used area.
+        '''
+        ReturnAspect.__init__(self)
 
         # # # region properties
 
@@ -677,10 +760,7 @@ class ReturnJointPoint(JointPointHandler, ReturnAspect):
 
         # # # endregion
 
-        '''Take this method via introspection from super classes.'''
-        return builtins.getattr(
-            JointPointHandler, inspect.stack()[0][3]
-        )(self, *arguments, **keywords)
+        return JointPointHandler.__init__(self, *arguments, **keywords)
 
         # # endregion
 
@@ -960,9 +1040,11 @@ class PointCut(ReturnAspect):
     def _handle_aspects(self, handler):
 # #
         '''Iterates through each aspect matching current function call.'''
-        from boostnode.extension.native import Module
-        context_path = Module.get_context_path(path=inspect.getfile(
-            self.__func__))
+        file_path = inspect.getfile(self.__func__)
+        if file_path not in CONTEXT_PATHS:
+            from boostnode.extension.native import Module
+            CONTEXT_PATHS[file_path] = Module.get_context_path(path=file_path)
+        context_path = CONTEXT_PATHS[file_path]
         if self.class_object:
             context_path += '.' + self.class_object.__name__
         context_path += '.' + self.__func__.__name__
@@ -986,7 +1068,7 @@ class PointCut(ReturnAspect):
     # endregion
 
 
-if sys.flags.optimize:
+if DISABLE_JOINT_POINTS:
 # # python3.5
 # #     def JointPoint(function: (Function, Method)) -> (Function, Method):
     def JointPoint(function):
@@ -1077,6 +1159,106 @@ else:
 
     # # region public
 
+    # # # region special
+
+# # python3.5
+# #         def __call__(
+# #             self: Self, *arguments: builtins.object,
+# #             **keywords: builtins.object
+# #         ) -> builtins.object:
+        def __call__(self, *arguments, **keywords):
+# #
+            '''
+                Calls a wrapped standalone function directly if no aspects \
+                are registered.
+
+                Examples:
+
+                >>> test_globals_backup = __test_globals__['ASPECTS']
+                >>> __test_globals__['ASPECTS'] = []
+
+                >>> @JointPoint
+                ... def a(value): return value
+                >>> a(5)
+                5
+
+                >>> __test_globals__['ASPECTS'] = test_globals_backup
+            '''
+            if(not ASPECTS and self.method_type is None and
+               self.wrapped_decorator is None and self.object is None and
+               self.class_object is None and
+               builtins.isinstance(self.__func__, Function)):
+                return self.__func__(*arguments, **keywords)
+            return FunctionDecorator.__call__(self, *arguments, **keywords)
+
+# # python3.5
+# #         def __get__(
+# #             self: Self, object: builtins.object, class_object=None
+# #         ) -> (Function, Method):
+        def __get__(self, object, class_object=None):
+# #
+            '''
+                Binds the wrapped function natively to given object or class \
+                if no aspects are registered. So calls doesn't pass any \
+                joint point handling until an aspect is added.
+
+                **object**       - Contains the function bounded instance.
+
+                **class_object** - Contains the function bounded class.
+
+                Examples:
+
+                >>> test_globals_backup = __test_globals__['ASPECTS']
+                >>> __test_globals__['ASPECTS'] = []
+
+                >>> class A(Class):
+                ...     @JointPoint
+                ...     def a(self, value): return value
+                ...     @JointPoint(builtins.classmethod)
+                ...     def b(cls, value): return cls, value
+                ...     @JointPoint(builtins.staticmethod)
+                ...     def c(value): return value
+                ...     @JointPoint(Class.pseudo_property)
+                ...     def get_d(self): return 'd'
+                >>> A().a(1)
+                1
+                >>> A().b(2) # doctest: +ELLIPSIS
+                (<class '...A'>, 2)
+                >>> A.b(3) # doctest: +ELLIPSIS
+                (<class '...A'>, 3)
+                >>> A().c(4)
+                4
+                >>> A().d
+                'd'
+                >>> builtins.hasattr(A().a, '__wrapped__')
+                False
+
+                >>> __test_globals__['ASPECTS'] = [
+                ...     {'advice': (), 'point_cut': '.*'}]
+                >>> builtins.hasattr(A().a, '__wrapped__')
+                True
+                >>> A().a(5)
+                5
+
+                >>> __test_globals__['ASPECTS'] = test_globals_backup
+            '''
+            if(not ASPECTS and self.wrapped_decorator is None and
+               builtins.isinstance(self.__func__, Function)):
+                if self.method_type is builtins.classmethod:
+                    if class_object is None:
+                        class_object = object.__class__
+                    return self.__func__.__get__(
+                        class_object, builtins.type(class_object))
+                if self.method_type is builtins.staticmethod:
+                    return self.__func__
+                if object is not None and self.method_type in (
+                    None, Class.pseudo_property
+                ):
+                    return self.__func__.__get__(object, class_object)
+            return FunctionDecorator.__get__(self, object, class_object)
+
+    # # # endregion
+
     # # # region getter
 
 # # python3.5
@@ -1096,6 +1278,12 @@ else:
                 while builtins.hasattr(self.__func__, '__func__'):
                     self.__func__ = self.__func__.__func__
                 arguments = self._determine_arguments(arguments)
+                '''
+                    Aspects could have been removed since this wrapper was \
+                    bound.
+                '''
+                if not ASPECTS:
+                    return self.__func__(*arguments, **keywords)
                 point_cut = PointCut(
                     self.class_object, self.object, function=self.__func__,
                     arguments=arguments, keywords=keywords)
@@ -108,9 +108,11 @@ import __builtin__ as builtins
 import inspect
 import os
 import sys
+import threading
 # # python3.5
+# # from types import MemberDescriptorType as MemberDescriptor
 # # from types import MethodType as Method
-pass
+from types import MemberDescriptorType as MemberDescriptor
 # #
 
 '''Make boostnode packages and modules importable via relative paths.'''
@@ -119,6 +121,23 @@ sys.path.append(os.path.abspath(sys.path[0] + 2 * (os.sep + '..')))
 # endregion
 
 
+# region constants
+
+# # region public constants
+
+ATTRIBUTE_RESOLUTIONS = {}
+'''
+    Caches accessor methods of "Class" based classes. Maps a tuple of class, \
+    access type ("get" or "set") and public property name to a tuple of the \
+    specific accessor method name and the resolved accessor method name \
+    ("None" if the class doesn't provide any accessor).
+'''
+
+# # endregion
+
+# endregion
+
+
 # region abstract classes
 
 # # python3.5 class Class:
@@ -130,6 +149,17 @@ class Class(builtins.object):
         classes in the global scope.
     '''
 
+    # region properties
+
+    __slots__ = ()
+    '''
+        Allows derived classes to define a compact instance representation \
+        via "__slots__". Other derived classes keep their instance \
+        dictionary.
+    '''
+
+    # endregion
+
     # region static methods
 
     # # region public
@@ -246,17 +276,34 @@ class Class(builtins.object):
             ...
             AttributeError: Property "c" doesn't exist in given instance of ...
         '''
-        internal_name = '_%s' % name
-        getter_name = 'get%s' % internal_name
-        special_method = None
-        if self.is_method(name=getter_name):
-            special_method = builtins.getattr(self, getter_name)
-        if(self.is_property(internal_name) or special_method is not None and
-           builtins.hasattr(special_method, 'pseudo_property')):
-            if special_method is not None:
-                return special_method()
-            elif self.is_method(name='get'):
-                return self.get(internal_name)
+        descriptor = builtins.getattr(self.__class__, name, None)
+        if builtins.isinstance(descriptor, PseudoProperty):
+            '''
+                NOTE: Python falls back to this method if an installed pseudo \
+                property getter raises an attribute error itself. We have to \
+                forward this error instead of calling the getter again.
+            '''
+            descriptor.raise_failure()
+        getter_name = self._determine_accessor_name(name, type='get')
+        if getter_name is not None:
+            internal_name = '_%s' % name
+            if getter_name == 'get':
+                if self.is_property(internal_name):
+                    return self.get(internal_name)
+            else:
+                getter = builtins.getattr(self, getter_name)
+                if builtins.hasattr(getter, 'pseudo_property'):
+                    if getter_name not in self._get_instance_attributes():
+                        '''
+                            Install a descriptor to avoid triggering this \
+                            method for further read access.
+                        '''
+                        builtins.setattr(self.__class__, name, PseudoProperty(
+                            class_object=self.__class__, name=name,
+                            getter_name=getter_name))
+                    return getter()
+                if self.is_property(internal_name):
+                    return getter()
         raise builtins.AttributeError(
              'Property "%s" doesn\'t exist in given instance of "%s".' %
             (name, self.__class__.__name__))
@@ -303,10 +350,14 @@ class Class(builtins.object):
             'hans and peter'
         '''
         if not self._set_attribute_helper(name, value):
-            if name in self.__class__.__dict__:
+            if name in self.__class__.__dict__ and not builtins.isinstance(
+                self.__class__.__dict__[name],
+                (PseudoProperty, MemberDescriptor)
+            ):
                 builtins.setattr(self.__class__, name, value)
             else:
-                self.__dict__[name] = value
+                '''Supports instance dictionaries and slots.'''
+                builtins.object.__setattr__(self, name, value)
         return value
 
     # # # endregion
@@ -334,9 +385,10 @@ class Class(builtins.object):
             >>> Class().is_method('not existing')
             False
         '''
+        attributes = self._get_instance_attributes()
         if name in self.__class__.__dict__ and self._is_callable(
             self.__class__.__dict__[name]
-        ) or name in self.__dict__ and self._is_callable(self.__dict__[name]):
+        ) or name in attributes and self._is_callable(attributes[name]):
             return True
         for base_class in self.__class__.__bases__:
             if name in base_class.__dict__ and self._is_callable(
@@ -366,12 +418,26 @@ class Class(builtins.object):
             >>> class A(Class): pass
             >>> A().is_property('test')
             True
+
+            >>> class B(Class):
+            ...     __slots__ = '_a', '_b'
+            ...     def __init__(self): self._a = 5
+            >>> B().is_property('_a'), B().is_property('_b')
+            (True, False)
         '''
+        if builtins.isinstance(
+            builtins.getattr(self.__class__, name, None), MemberDescriptor
+        ):
+            '''Slots are only properties if they hold a value.'''
+            try:
+                builtins.object.__getattribute__(self, name)
+            except builtins.AttributeError:
+                return False
+            return True
+        attributes = self._get_instance_attributes()
         if name in self.__class__.__dict__ and not self._is_callable(
             self.__class__.__dict__[name]
-        ) or name in self.__dict__ and not self._is_callable(
-            self.__dict__[name]
-        ):
+        ) or name in attributes and not self._is_callable(attributes[name]):
             return True
         for base_class in self.__class__.__bases__:
             if(name in base_class.__dict__ and
@@ -385,6 +451,32 @@ class Class(builtins.object):
 
     # # region protected
 
+# # python3.5     def _get_instance_attributes(self) -> builtins.dict:
+    def _get_instance_attributes(self):
+        '''
+            Returns the instance's attribute dictionary. Instances with a \
+            compact representation (see "__slots__") result in an empty \
+            dictionary.
+
+            Examples:
+
+            >>> class A(Class): pass
+            >>> a = A()
+            >>> a.a = 5
+            >>> a._get_instance_attributes()
+            {'a': 5}
+
+            >>> class B(Class):
+            ...     __slots__ = '_b',
+            ...     def __init__(self): self._b = 5
+            >>> B()._get_instance_attributes()
+            {}
+        '''
+        try:
+            return builtins.object.__getattribute__(self, '__dict__')
+        except builtins.AttributeError:
+            return {}
+
 # # python3.5
 # #     def _is_callable(self, object: builtins.object) -> builtins.bool:
     def _is_callable(self, object):
@@ -412,15 +504,226 @@ class Class(builtins.object):
             Returns "True" if the given property was successful overwritten \
             or "False" otherwise.
         '''
-        name = '_%s' % name
-        setter_name = 'set%s' % name
-        if self.is_method(name=setter_name):
+        setter_name = self._determine_accessor_name(name, type='set')
+        if setter_name is None:
+            return False
+        elif setter_name == 'set':
+            self.set('_%s' % name, value)
+        else:
             builtins.getattr(self, setter_name)(value)
-            return True
-        elif self.is_method(name='set'):
-            self.set(name, value)
-            return True
-        return False
+        return True
+
+# # python3.5
+# #     def _determine_accessor_name(
+# #         self, name: builtins.str, type: builtins.str
+# #     ) -> (builtins.str, builtins.type(None)):
+    def _determine_accessor_name(self, name, type):
+# #
+        '''
+            Determines the method name handling given access type ("get" or \
+            "set") for given property name. A specific accessor (e.g. \
+            "get_name") is preferred over the general one (e.g. "get").
+
+            **name** - is the public property name.
+
+            **type** - is the access type ("get" or "set").
+
+            Returns the accessor method name or "None" if no accessor exists. \
+            Accessors given by the class hierarchy are cached (see \
+            "ATTRIBUTE_RESOLUTIONS").
+
+            Examples:
+
+            >>> class A(Class):
+            ...     def get_a(self): pass
+            ...     def set(self, name, value): pass
+            >>> a = A()
+
+            >>> a._determine_accessor_name('a', type='get')
+            'get_a'
+            >>> a._determine_accessor_name('b', type='get')
+            >>> a._determine_accessor_name('a', type='set')
+            'set'
+            >>> ATTRIBUTE_RESOLUTIONS[(A, 'get', 'a')]
+            ('get_a', 'get_a')
+
+            >>> a.__dict__['get'] = lambda name: name
+            >>> a._determine_accessor_name('b', type='get')
+            'get'
+            >>> A()._determine_accessor_name('b', type='get')
+        '''
+        key = (self.__class__, type, name)
+        if key not in ATTRIBUTE_RESOLUTIONS:
+            specific_name = '%s_%s' % (type, name)
+            resolved_name = None
+            for name_candidate in (specific_name, type):
+                for class_object in (
+                    (self.__class__,) + self.__class__.__bases__
+                ):
+                    if name_candidate in class_object.__dict__ and \
+                            self._is_callable(
+                                class_object.__dict__[name_candidate]):
+                        resolved_name = name_candidate
+                        break
+                if resolved_name is not None:
+                    break
+            ATTRIBUTE_RESOLUTIONS[key] = (specific_name, resolved_name)
+        specific_name, resolved_name = ATTRIBUTE_RESOLUTIONS[key]
+        attributes = self._get_instance_attributes()
+        if attributes and (
+            specific_name in attributes or type in attributes
+        ):
+            '''NOTE: Methods bound to an instance can't be cached.'''
+            if self.is_method(name=specific_name):
+                return specific_name
+            elif self.is_method(name=type):
+                return type
+            return None
+        return resolved_name
+
+    # # endregion
+
+    # endregion
+
+# endregion
+
+
+# region classes
+
+# # python3.5 class PseudoProperty:
+class PseudoProperty(builtins.object):
+
+    '''
+        Descriptor which forwards read access of a public property to its \
+        pseudo property getter method. It is installed into "Class" based \
+        classes after their first read access, so further access doesn't \
+        have to be resolved by "Class.__getattr__()". Values saved in an \
+        instance itself still take precedence.
+
+        Examples:
+
+        >>> class A(Class):
+        ...     calls = []
+        ...     def __init__(self): self._a = 'hans'
+        ...     @Class.pseudo_property
+        ...     def get_a(self): return self._a
+        ...     @Class.pseudo_property
+        ...     def get_b(self):
+        ...         self.calls.append('b')
+        ...         return self._b
+        >>> a = A()
+
+        >>> 'a' in A.__dict__
+        False
+        >>> a.a
+        'hans'
+        >>> A.a # doctest: +ELLIPSIS
+        Object of "PseudoProperty" for property "a" of "A" ...
+        >>> A().a
+        'hans'
+
+        >>> a.__dict__['a'] = 'peter'
+        >>> a.a
+        'peter'
+
+        >>> A().b
+        Traceback (most recent call last):
+        ...
+        AttributeError: Property "_b" doesn't exist in given instance of "A".
+        >>> A().b
+        Traceback (most recent call last):
+        ...
+        AttributeError: Property "_b" doesn't exist in given instance of "A".
+        >>> A.calls
+        ['b', 'b']
+
+        >>> class B(A):
+        ...     @Class.pseudo_property
+        ...     def get_a(self): return 'klaus'
+        >>> B().a
+        'klaus'
+    '''
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+# # python3.5
+# #     def __init__(
+# #         self, class_object: builtins.type, name: builtins.str,
+# #         getter_name: builtins.str
+# #     ) -> None:
+    def __init__(self, class_object, name, getter_name):
+# #
+        '''
+            Saves the resolved getter for given property name.
+
+            **class_object** - class which resolved given getter method
+
+            **name**         - public property name
+
+            **getter_name**  - name of the pseudo property getter method
+        '''
+
+        # # # region properties
+
+        self.class_object = class_object
+        self.name = name
+        self.getter_name = getter_name
+        '''Saves attribute errors raised by getter methods per thread.'''
+        self.failure = threading.local()
+
+        # # # endregion
+
+# # python3.5     def __repr__(self) -> builtins.str:
+    def __repr__(self):
+        '''Describes the handled property.'''
+        return (
+            'Object of "{class_name}" for property "{name}" of '
+            '"{class_object}" handled by "{getter_name}()".'.format(
+                class_name=self.__class__.__name__, name=self.name,
+                class_object=self.class_object.__name__,
+                getter_name=self.getter_name))
+
+# # python3.5
+# #     def __get__(
+# #         self, object: builtins.object,
+# #         class_object: (builtins.type, builtins.type(None))=None
+# #     ) -> builtins.object:
+    def __get__(self, object, class_object=None):
+# #
+        '''
+            Returns the value determined by the pseudo property getter. \
+            Instances of sub classes (which may provide another getter) \
+            are resolved via "Class.__getattr__()".
+        '''
+        if object is None:
+            return self
+        if object.__class__ is not self.class_object:
+            return Class.__getattr__(object, self.name)
+        getter = builtins.getattr(object, self.getter_name)
+        if not builtins.hasattr(getter, 'pseudo_property'):
+            return Class.__getattr__(object, self.name)
+        try:
+            return getter()
+        except builtins.AttributeError as exception:
+            self.failure.exception = exception
+            raise
+
+    # # # endregion
+
+# # python3.5     def raise_failure(self) -> None:
+    def raise_failure(self):
+        '''
+            Raises the attribute error last raised by the getter in the \
+            current thread (if present).
+        '''
+        exception = builtins.getattr(self.failure, 'exception', None)
+        if exception is not None:
+            self.failure.exception = None
+            raise exception
 
     # # endregion
 
@@ -56,12 +56,16 @@ import logging
 import multiprocessing
 import os
 import posixpath
-# # python3.5 import socketserver
-pass
+# # python3.5
+# # import queue
+# # import socketserver
+import Queue as queue
+# #
 import ssl
 import re as regularExpression
 import signal
 import socket
+import struct
 import subprocess
 import sys
 # # python3.5
@@ -100,7 +104,7 @@ from boostnode.extension.output import RESET_ATTRIBUTE_MODE as \
     RESET_OUTPUT_ATTRIBUTE_MODE
 from boostnode.extension.output import COLOR as OUTPUT_COLOR
 from boostnode.extension.system import CommandLine, Platform, Runnable
-# # python3.5 from boostnode.extension.type import Self
+# # python3.5 from boostnode.extension.type import Self, SelfClass
 pass
 from boostnode.paradigm.aspectOrientation import JointPoint
 from boostnode.paradigm.objectOrientation import Class
@@ -317,6 +321,14 @@ class MultiProcessingHTTPServer(
                 exception.__class__.__name__, convert_to_unicode(
                     exception))
 # #
+        finally:
+            self.web.send_cache_updates()
+            if self.web.access_log is not None:
+                '''
+                    NOTE: Forked workers exit without running any exit \
+                    handlers.
+                '''
+                self.web.access_log.flush()
 
     @JointPoint
 # # python3.5
@@ -364,6 +376,11 @@ class MultiProcessingHTTPServer(
         self.read_file_socket = SocketFileObjectWrapper(
             request_socket, 'rb', -1)
 # #
+        '''
+            Caches filled by forked workers would be lost with them so they \
+            are taken over before the next worker is forked.
+        '''
+        self.web.merge_cache_updates()
         '''NOTE: We have to add 1 for the server processes itself.'''
         self.web.number_of_running_processes = \
             builtins.len(multiprocessing.active_children()) + 1
@@ -419,6 +436,685 @@ class MultiProcessingHTTPServer(
     # endregion
 
 
+class AccessLogSink(Class):
+
+    '''
+        Serializes access log records. Derived classes define a concrete \
+        format and are selectable by name via "AccessLog.SINKS".
+    '''
+
+    # region dynamic methods
+
+    # # region public
+
+# # python3.5
+# #     def encode(self: Self, record: builtins.dict) -> builtins.bytes:
+    def encode(self, record):
+# #
+        '''
+            Converts given record into its binary representation.
+
+            **record** - access log record to serialize
+
+            Examples:
+
+            >>> AccessLogSink().encode({}) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            NotImplementedError: Method "encode()" has to be implemented...
+        '''
+        raise builtins.NotImplementedError(
+            'Method "encode()" has to be implemented by derived sinks.')
+
+    # # endregion
+
+    # endregion
+
+
+class JSONLinesAccessLogSink(AccessLogSink):
+
+    '''Serializes each access log record as a single line of json.'''
+
+    # region dynamic methods
+
+    # # region public
+
+# # python3.5
+# #     def encode(self: Self, record: builtins.dict) -> builtins.bytes:
+    def encode(self, record):
+# #
+        '''
+            Converts given record into a new line terminated json object.
+
+            **record** - access log record to serialize
+
+            Examples:
+
+            >>> JSONLinesAccessLogSink().encode({
+            ...     'path': '/', 'status': 200
+            ... }) == b'{"path":"/","status":200}\\n'
+            True
+        '''
+        return (json.dumps(
+            record, sort_keys=True, separators=(',', ':')
+        ) + '\n').encode(ENCODING)
+
+    # # endregion
+
+    # endregion
+
+
+class BinaryAccessLogSink(AccessLogSink):
+
+    '''
+        Packs each access log record into a fixed size header followed by \
+        request method and path. The header consists of timestamp, duration \
+        in seconds, status code, process id, number of sent bytes, cache hit \
+        flag and the lengths of method and path.
+    '''
+
+    # region properties
+
+    HEADER = struct.Struct(builtins.str('!dfHIQ?BH'))
+    '''Describes the binary layout of each record header.'''
+
+    # endregion
+
+    # region static methods
+
+    # # region public
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def decode(
+# #         cls: SelfClass, content: builtins.bytes
+# #     ) -> builtins.list:
+    def decode(cls, content):
+# #
+        '''
+            Converts given binary access log content back into records.
+
+            **content** - consecutive encoded records
+
+            Examples:
+
+            >>> record = {
+            ...     'bytes': 5, 'cache_hit': True, 'duration': 0.5,
+            ...     'method': 'GET', 'path': '/index.html', 'process_id': 1,
+            ...     'status': 304, 'timestamp': 1.0}
+            >>> content = 2 * BinaryAccessLogSink().encode(record)
+            >>> BinaryAccessLogSink.decode(content) == [record, record]
+            True
+
+            >>> BinaryAccessLogSink.decode(b'')
+            []
+        '''
+        records = []
+        index = 0
+        while index < builtins.len(content):
+            (timestamp, duration, status, process_id, number_of_bytes,
+             cache_hit, method_length, path_length) = cls.HEADER.unpack_from(
+                content, index)
+            index += cls.HEADER.size
+            method = content[index:index + method_length].decode(ENCODING)
+            index += method_length
+            path = content[index:index + path_length].decode(ENCODING)
+            index += path_length
+            records.append({
+                'bytes': number_of_bytes, 'cache_hit': cache_hit,
+                'duration': duration, 'method': method, 'path': path,
+                'process_id': process_id, 'status': status,
+                'timestamp': timestamp})
+        return records
+
+    # # endregion
+
+    # endregion
+
+    # region dynamic methods
+
+    # # region public
+
+# # python3.5
+# #     def encode(self: Self, record: builtins.dict) -> builtins.bytes:
+    def encode(self, record):
+# #
+        '''
+            Converts given record into its packed representation.
+
+            **record** - access log record to serialize
+
+            Examples:
+
+            >>> content = BinaryAccessLogSink().encode({
+            ...     'bytes': 0, 'cache_hit': False, 'duration': 0.0,
+            ...     'method': 'GET', 'path': '/', 'process_id': 1,
+            ...     'status': 200, 'timestamp': 0.0})
+            >>> len(content) == BinaryAccessLogSink.HEADER.size + 4
+            True
+        '''
+        method = record['method'].encode(ENCODING)[:255]
+        path = record['path'].encode(ENCODING)[:65535]
+        return self.HEADER.pack(
+            record['timestamp'], record['duration'], record['status'],
+            record['process_id'], record['bytes'], record['cache_hit'],
+            builtins.len(method), builtins.len(path)
+        ) + method + path
+
+    # # endregion
+
+    # endregion
+
+
+class AccessLog(Class):
+
+    '''
+        Collects one structured record per handled request and writes them \
+        buffered into a rotated log file.
+
+        Each batch is written with a single system call to a file opened in \
+        append mode. So forked workers can share one log file without \
+        interleaving their records.
+
+        NOTE: Methods running for each request aren't wrapped by joint \
+        points to keep logging cheap.
+
+        **path**                         - location of the current log file
+
+        **sink**                         - name of the record format (see \
+                                           "SINKS")
+
+        **maximum_size_in_byte**         - rotates the log file once it \
+                                           reaches this size, "0" disables \
+                                           size based rotation
+
+        **rotation_interval_in_seconds** - starts a new log file for each \
+                                           time period of this length, "0" \
+                                           disables time based rotation
+
+        **buffer_size_in_byte**          - number of buffered bytes which \
+                                           triggers a write
+
+        **flush_interval_in_seconds**    - maximum age of buffered records \
+                                           before they are written with the \
+                                           next record
+
+        Examples:
+
+        >>> access_log = AccessLog(
+        ...     path=__test_folder__.path + 'AccessLog',
+        ...     buffer_size_in_byte=1024)
+        >>> access_log.write({'path': '/', 'status': 200})
+        >>> access_log.close() # doctest: +ELLIPSIS
+        Object of "AccessLog" with path "...AccessLog" and sink "jsonl".
+        >>> FileHandler(__test_folder__.path + 'AccessLog').content
+        '{"path":"/","status":200}\\n'
+
+        >>> AccessLog(
+        ...     path=__test_folder__.path + 'AccessLog', sink='xml'
+        ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        boostnode.extension.native.ServerError: Access log sink "xml" ...
+    '''
+
+    # region properties
+
+    SINKS = {'binary': BinaryAccessLogSink, 'jsonl': JSONLinesAccessLogSink}
+    '''Maps each supported sink name to its implementation.'''
+
+    # endregion
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+    @JointPoint
+# # python3.5
+# #     def __init__(
+# #         self: Self, path: builtins.str, sink='jsonl',
+# #         maximum_size_in_byte=0, rotation_interval_in_seconds=0,
+# #         buffer_size_in_byte=65536, flush_interval_in_seconds=1
+# #     ) -> None:
+    def __init__(
+        self, path, sink='jsonl', maximum_size_in_byte=0,
+        rotation_interval_in_seconds=0, buffer_size_in_byte=65536,
+        flush_interval_in_seconds=1
+    ):
+# #
+        '''Initializes an empty record buffer for given log file.'''
+        if sink not in self.SINKS:
+            raise __exception__('Access log sink "%s" isn\'t supported.', sink)
+        self.path = path
+        self.sink = self.SINKS[sink]()
+        self.maximum_size_in_byte = maximum_size_in_byte
+        self.rotation_interval_in_seconds = rotation_interval_in_seconds
+        self.buffer_size_in_byte = buffer_size_in_byte
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        self._reset()
+
+    @JointPoint
+# # python3.5     def __repr__(self: Self) -> builtins.str:
+    def __repr__(self):
+        '''
+            Invokes if this object should describe itself by a string.
+
+            Examples:
+
+            >>> repr(AccessLog(path='access.log'))
+            'Object of "AccessLog" with path "access.log" and sink "jsonl".'
+        '''
+        for name, sink in self.SINKS.items():
+            if builtins.isinstance(self.sink, sink):
+                break
+        return 'Object of "{class_name}" with path "{path}" and sink '\
+               '"{sink}".'.format(
+                   class_name=self.__class__.__name__, path=self.path,
+                   sink=name)
+
+    # # # endregion
+
+# # python3.5
+# #     def write(self: Self, record: builtins.dict) -> None:
+    def write(self, record):
+# #
+        '''
+            Buffers given record and writes all buffered records if the \
+            buffer is full or too old.
+
+            **record** - access log record to write
+
+            Examples:
+
+            >>> access_log = AccessLog(
+            ...     path=__test_folder__.path + 'write',
+            ...     buffer_size_in_byte=0)
+            >>> FileHandler(__test_folder__.path + 'write').content = ''
+            >>> access_log.write({'status': 200})
+            >>> FileHandler(__test_folder__.path + 'write').content
+            '{"status":200}\\n'
+            >>> access_log.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "...write" and sink "jsonl".
+        '''
+        if self._process_id != os.getpid():
+            '''
+                NOTE: Records inherited by a forked worker are written by \
+                their parent process.
+            '''
+            self._reset()
+        content = self.sink.encode(record)
+        with self._lock:
+            self._chunks.append(content)
+            self._size += builtins.len(content)
+            if(self._size >= self.buffer_size_in_byte or
+               time.time() - self._last_flush_time >=
+               self.flush_interval_in_seconds):
+                self._flush()
+
+    @JointPoint
+# # python3.5     def flush(self: Self) -> Self:
+    def flush(self):
+        '''
+            Writes all buffered records.
+
+            Examples:
+
+            >>> access_log = AccessLog(path=__test_folder__.path + 'flush')
+            >>> FileHandler(__test_folder__.path + 'flush').content = ''
+            >>> access_log.write({'status': 200})
+            >>> access_log.flush() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "...flush" and sink "jsonl".
+            >>> FileHandler(__test_folder__.path + 'flush').content
+            '{"status":200}\\n'
+            >>> access_log.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "...flush" and sink "jsonl".
+        '''
+        if self._process_id == os.getpid():
+            with self._lock:
+                self._flush()
+        return self
+
+    @JointPoint
+# # python3.5     def close(self: Self) -> Self:
+    def close(self):
+        '''
+            Writes all buffered records and releases the log file. Further \
+            records reopen it.
+        '''
+        self.flush()
+        with self._lock:
+            if self._file_descriptor is not None:
+                os.close(self._file_descriptor)
+                self._file_descriptor = None
+        return self
+
+    # # endregion
+
+    # # region protected
+
+# # python3.5     def _reset(self: Self) -> None:
+    def _reset(self):
+        '''Initializes the record buffer for the current process.'''
+        self._process_id = os.getpid()
+        self._lock = threading.Lock()
+        self._chunks = []
+        self._size = 0
+        self._last_flush_time = time.time()
+        '''
+            NOTE: A descriptor inherited from a parent process stays open \
+            for the parent.
+        '''
+        self._file_descriptor = None
+        self._period = None
+
+# # python3.5     def _flush(self: Self) -> None:
+    def _flush(self):
+        '''Writes all buffered records. The caller has to hold the lock.'''
+        self._last_flush_time = time.time()
+        if self._chunks:
+            content = b''.join(self._chunks)
+            self._chunks = []
+            self._size = 0
+            file_descriptor = self._open()
+            while content:
+                content = content[os.write(file_descriptor, content):]
+
+# # python3.5     def _open(self: Self) -> builtins.int:
+    def _open(self):
+        '''
+            Returns a descriptor to the current log file. Rotates the log \
+            file if needed and follows rotations done by other processes.
+
+            Examples:
+
+            >>> FileHandler(__test_folder__.path + '_open').content = 'a'
+            >>> access_log = AccessLog(
+            ...     path=__test_folder__.path + '_open',
+            ...     maximum_size_in_byte=1, buffer_size_in_byte=0)
+            >>> access_log.write({'status': 200})
+            >>> access_log.write({'status': 404})
+            >>> FileHandler(__test_folder__.path + '_open').content
+            '{"status":404}\\n'
+            >>> access_log.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "..._open" and sink "jsonl".
+
+            Writers sharing a log file follow each other's rotations \
+            instead of rotating again.
+
+            >>> path = __test_folder__.path + '_open_shared'
+            >>> first = AccessLog(
+            ...     path=path, maximum_size_in_byte=30, buffer_size_in_byte=0)
+            >>> second = AccessLog(
+            ...     path=path, maximum_size_in_byte=30, buffer_size_in_byte=0)
+            >>> for access_log in (first, second, first, second):
+            ...     access_log.write({'status': 200})
+            >>> FileHandler(path).content
+            '{"status":200}\\n{"status":200}\\n'
+            >>> builtins.len(builtins.list(builtins.filter(
+            ...     lambda name: name.startswith('_open_shared.'),
+            ...     os.listdir(__test_folder__.path))))
+            1
+            >>> first.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "..._open_shared" and sink "jsonl".
+            >>> second.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "..._open_shared" and sink "jsonl".
+        '''
+        now = time.time()
+        if self._file_descriptor is not None and not self._is_current():
+            '''Another writer has rotated the log file already.'''
+            os.close(self._file_descriptor)
+            self._file_descriptor = None
+        if self._file_descriptor is not None:
+            if(self.rotation_interval_in_seconds and builtins.int(
+                now // self.rotation_interval_in_seconds
+            ) != self._period):
+                self._rotate(suffix=time.strftime(
+                    '%Y-%m-%d_%H-%M-%S', time.localtime(
+                        self._period * self.rotation_interval_in_seconds)))
+            elif(self.maximum_size_in_byte and os.fstat(
+                self._file_descriptor
+            ).st_size >= self.maximum_size_in_byte):
+                self._rotate(suffix=time.strftime(
+                    '%Y-%m-%d_%H-%M-%S', time.localtime(now)
+                ) + '_%06d' % builtins.int(now % 1 * 1000000))
+        if self._file_descriptor is None:
+            self._file_descriptor = os.open(
+                self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            if self.rotation_interval_in_seconds:
+                self._period = builtins.int(
+                    now // self.rotation_interval_in_seconds)
+        return self._file_descriptor
+
+# # python3.5     def _rotate(self: Self, suffix: builtins.str) -> None:
+    def _rotate(self, suffix):
+        '''
+            Moves the current log file aside and releases its descriptor. \
+            If another process already rotated it nothing is moved.
+
+            **suffix** - suffix for the rotated log file name
+        '''
+        current = self._is_current()
+        os.close(self._file_descriptor)
+        self._file_descriptor = None
+        target = '%s.%s' % (self.path, suffix)
+        if current and not os.path.exists(target):
+            try:
+                os.rename(self.path, target)
+            except builtins.OSError:
+                pass
+
+# # python3.5     def _is_current(self: Self) -> builtins.bool:
+    def _is_current(self):
+        '''
+            Checks whether the open descriptor still refers to the file at \
+            the log file path.
+        '''
+        try:
+            return os.stat(self.path).st_ino == os.fstat(
+                self._file_descriptor
+            ).st_ino
+        except builtins.OSError:
+            return False
+
+    # # endregion
+
+    # endregion
+
+
+class RedirectRouter(Class):
+
+    '''
+        Compiles redirect rules into a routing table. Rules are indexed per \
+        request type by the literal prefix of their uri pattern, so only \
+        rules with a fitting prefix have to be tested. Rules without a \
+        literal prefix are always tested. The first matching rule in given \
+        order wins. Sources without a request type apply to every type.
+
+        **redirects** - pairs of source pattern and target as described for \
+                        "Web.internal_redirects" and "Web.external_redirects"
+
+        Examples:
+
+        >>> router = RedirectRouter((
+        ...     ('GET:/blog/(.+)', '/articles/\\\\1'),
+        ...     ('*:/blog/archive', '/archive'),
+        ...     ('POST|PUT:/api/.*', '-:/service'),
+        ...     ('*:.+[.]php', '/index.html'),
+        ...     ('/legacy', '/')))
+
+        >>> router.route('GET', '/blog/archive')[1]
+        '/articles/\\\\1'
+        >>> router.route('POST', '/blog/archive')[1]
+        '/archive'
+        >>> router.route('PUT', '/api/users')[1]
+        '-:/service'
+        >>> router.route('GET', '/old/index.php')[1]
+        '/index.html'
+        >>> router.route('GET', '/api/users')
+        >>> router.route('DELETE', '/legacy')[1]
+        '/'
+    '''
+
+    # region properties
+
+# # python3.5
+# #     PATTERN = regularExpression.compile('(?P<type>.+?):(?P<uri>.*)')
+    PATTERN = regularExpression.compile('(?P<type>.+?):(?P<uri>.*)$')
+# #
+    '''Splits redirect sources and targets into request type and uri.'''
+    SPECIAL_CHARACTERS = '.^$*+?{}[]\\|()'
+    '''Characters which end a literal prefix in regular expressions.'''
+
+    # endregion
+
+    # region static methods
+
+    # # region protected
+
+    @JointPoint(builtins.classmethod)
+# # python3.5
+# #     def _determine_literal_prefix(
+# #         cls: SelfClass, pattern: builtins.str
+# #     ) -> builtins.str:
+    def _determine_literal_prefix(cls, pattern):
+# #
+        '''
+            Determines the longest literal string every match of given \
+            regular expression pattern starts with.
+
+            **pattern** - regular expression pattern to analyze
+
+            Examples:
+
+            >>> RedirectRouter._determine_literal_prefix('/blog/(.+)')
+            '/blog/'
+
+            >>> RedirectRouter._determine_literal_prefix('/index\\\\.html?')
+            '/index.htm'
+
+            >>> RedirectRouter._determine_literal_prefix('/a|/b')
+            ''
+
+            >>> RedirectRouter._determine_literal_prefix('\\\\d+')
+            ''
+        '''
+        if '|' in pattern:
+            return ''
+        prefix = ''
+        index = 0
+        while index < builtins.len(pattern):
+            character = pattern[index]
+            if character == '\\':
+                index += 1
+                if index == builtins.len(pattern) or pattern[index].isalnum():
+                    break
+                character = pattern[index]
+            elif character in cls.SPECIAL_CHARACTERS:
+                break
+            index += 1
+            if index < builtins.len(pattern) and pattern[index] in '*?{':
+                '''An optional character doesn't belong to the prefix.'''
+                break
+            prefix += character
+        return prefix
+
+    # # endregion
+
+    # endregion
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+    @JointPoint
+# # python3.5
+# #     def __init__(
+# #         self: Self, redirects: NativeIterable
+# #     ) -> None:
+    def __init__(self, redirects):
+# #
+        '''Compiles all given redirects into a prefix tree per type.'''
+        self.redirects = redirects
+        '''
+            Maps each request type to the root node of its prefix tree. \
+            Each node consists of its children and its rules.
+        '''
+        self.routes = {}
+        for index, (source, target) in builtins.enumerate(redirects):
+# # python3.5             source_match = self.PATTERN.fullmatch(source)
+            source_match = self.PATTERN.match(source)
+            types, uri = ['*'], source
+            if source_match is not None:
+                types = source_match.group('type').split('|')
+                uri = source_match.group('uri')
+# # python3.5             pattern = regularExpression.compile(uri)
+            pattern = regularExpression.compile('(?:%s)$' % uri)
+            prefix = self._determine_literal_prefix(uri)
+            for type in types:
+                node = self.routes.setdefault(type, ({}, []))
+                for character in prefix:
+                    node = node[0].setdefault(character, ({}, []))
+                node[1].append((index, pattern, target))
+
+    @JointPoint
+# # python3.5     def __repr__(self: Self) -> builtins.str:
+    def __repr__(self):
+        '''
+            Invokes if this object should describe itself by a string.
+
+            Examples:
+
+            >>> repr(RedirectRouter((('GET:/a', '/b'),)))
+            'Object of "RedirectRouter" with 1 redirects.'
+        '''
+        return 'Object of "{class_name}" with {number} redirects.'.format(
+            class_name=self.__class__.__name__,
+            number=builtins.len(self.redirects))
+
+    # # # endregion
+
+    @JointPoint
+# # python3.5
+# #     def route(
+# #         self: Self, type: builtins.str, uri: builtins.str
+# #     ) -> (builtins.tuple, builtins.type(None)):
+    def route(self, type, uri):
+# #
+        '''
+            Determines the first redirect matching given request. Returns \
+            the compiled source pattern and the target or "None" if no \
+            redirect matches.
+
+            **type** - uppercased request type
+
+            **uri**  - requested uri
+        '''
+        candidates = []
+        for name in (type, '*'):
+            node = self.routes.get(name)
+            if node is not None:
+                candidates.extend(node[1])
+                for character in uri:
+                    node = node[0].get(character)
+                    if node is None:
+                        break
+                    candidates.extend(node[1])
+        candidates.sort(key=lambda candidate: candidate[0])
+        for index, pattern, target in candidates:
+# # python3.5             if pattern.fullmatch(uri) is not None:
+            if pattern.match(uri) is not None:
+                return pattern, target
+        return None
+
+    # # endregion
+
+    # endregion
+
+
 class Web(Class, Runnable):
 
     '''
@@ -554,6 +1250,33 @@ class Web(Class, Runnable):
                                                   expression replacements are \
                                                   supported.
 
+        **access_log**                          - Path of a structured access \
+                                                  log file. One record is \
+                                                  written per request instead \
+                                                  of a textual logging line. \
+                                                  An empty string disables it.
+
+        **access_log_sink**                     - Record format of the access \
+                                                  log (see "AccessLog.SINKS").
+
+        **access_log_maximum_size_in_byte**     - Size which triggers an \
+                                                  access log rotation.
+
+        **access_log_rotation_interval_in_seconds** - Time period after \
+                                                      which a new access log \
+                                                      file is started.
+
+        **authentication_cache_time_in_seconds**    - Time period a verified \
+                                                      authorization is \
+                                                      trusted without \
+                                                      checking its \
+                                                      authentication file \
+                                                      again. Removed or \
+                                                      changed logins stay \
+                                                      valid for this \
+                                                      period. "0" disables \
+                                                      trusting.
+
         Examples:
 
         >>> key_file = FileHandler(
@@ -882,12 +1605,71 @@ class Web(Class, Runnable):
              'type': {'execute': 'type(__initializer_default_value__)'},
              'required': {'execute': '__initializer_default_value__ is None'},
              'help': {
-                 'execute': "'Defines the maximum number of concurrent running"
-                            ' processes. If set to zero a useful value '
-                            'depending on detected processor will be '
-                            '''determined (default: "%d").' % '''
+                 'execute': "'Defines the maximum number of concurrent running"
+                            ' processes. If set to zero a useful value '
+                            'depending on detected processor will be '
+                            '''determined (default: "%d").' % '''
+                            '__initializer_default_value__'},
+             'dest': 'maximum_number_of_processes',
+             'metavar': 'NUMBER'}},
+        {'arguments': ('-L', '--access-log'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': 'Defines a file to write one structured record per '
+                     'request into. Those records replace the textual '
+                     'request logging lines (default: disabled).',
+             'dest': 'access_log',
+             'metavar': 'PATH'}},
+        {'arguments': ('-F', '--access-log-sink'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'choices': ('binary', 'jsonl'),
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': {
+                 'execute': "'Defines the access log record format (default: "
+                            '''"%s").' % __initializer_default_value__'''},
+             'dest': 'access_log_sink',
+             'metavar': 'NAME'}},
+        {'arguments': ('-S', '--access-log-maximum-size-in-byte'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': 'Defines the access log size which triggers a rotation. '
+                     'If set to zero (default) the access log will never be '
+                     'rotated by size.',
+             'dest': 'access_log_maximum_size_in_byte',
+             'metavar': 'NUMBER'}},
+        {'arguments': ('-T', '--access-log-rotation-interval-in-seconds'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': 'Defines the time period after which a new access log '
+                     'file is started. If set to zero (default) the access '
+                     'log will never be rotated by time.',
+             'dest': 'access_log_rotation_interval_in_seconds',
+             'metavar': 'NUMBER'}},
+        {'arguments': ('-V', '--authentication-cache-time-in-seconds'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': {
+                 'execute': "'Defines how long a verified authorization is "
+                            'trusted without checking its authentication '
+                            'file again. Revoked logins stay valid for this '
+                            '''period (default: "%d").' % '''
                             '__initializer_default_value__'},
-             'dest': 'maximum_number_of_processes',
+             'dest': 'authentication_cache_time_in_seconds',
              'metavar': 'NUMBER'}})
     '''Holds all command line interface argument informations.'''
     HIGHEST_AVAILABLE_PORT = 2 ** 16 - 1
@@ -948,6 +1730,288 @@ class Web(Class, Runnable):
 
     @JointPoint
 # # python3.5
+# #     def determine_authentication(
+# #         self: Self, location: FileHandler
+# #     ) -> (builtins.frozenset, builtins.type(None)):
+    def determine_authentication(self, location):
+# #
+        '''
+            Determines all authorization header values accepted by the \
+            nearest authentication file from given location up to the web \
+            root. Returns "None" if no authentication file applies. Results \
+            are cached per directory until one of the walked directories or \
+            the authentication file itself is modified.
+
+            **location** - directory to start searching from
+
+            Examples:
+
+            >>> web = Web(__test_folder__)
+            >>> location = FileHandler(
+            ...     __test_folder__.path + 'determine_authentication',
+            ...     make_directory=True)
+
+            >>> web.determine_authentication(location)
+
+            >>> FileHandler(location.path + '.htpasswd').content = (
+            ...     'hans:secret\\npeter:password\\n')
+            >>> sorted(web.determine_authentication(location))
+            ['Basic aGFuczpzZWNyZXQ=', 'Basic cGV0ZXI6cGFzc3dvcmQ=']
+        '''
+        key = (
+            location.path, self.authentication_file_name,
+            self.authentication_file_content_pattern)
+        cached = self._authentications.get(key)
+        if cached is not None and self._determine_timestamps(builtins.map(
+            lambda timestamp: timestamp[0], cached[0]
+        )) == cached[0]:
+            return cached[1]
+        paths, accepted = self._search_authentication(location)
+        timestamps = self._determine_timestamps(paths)
+        if timestamps is not None:
+            self._update_cache(
+                '_authentications', key=key, value=(timestamps, accepted))
+        return accepted
+
+    @JointPoint
+# # python3.5
+# #     def determine_default_file(self: Self) -> (
+# #         FileHandler, builtins.type(None)
+# #     ):
+    def determine_default_file(self):
+# #
+        '''
+            Determines the first file in the root directory matching one of \
+            the default file name patterns. The result is cached until the \
+            root directory is modified, so a cached lookup costs a single \
+            stat call.
+
+            Examples:
+
+            >>> web = Web(__test_folder__, default_file_name_pattern=(
+            ...     'determine_default_file\\\\..+',))
+            >>> web.determine_default_file()
+
+            >>> FileHandler(
+            ...     __test_folder__.path + 'determine_default_file.txt'
+            ... ).content = ''
+            >>> web.determine_default_file().name
+            'determine_default_file.txt'
+        '''
+        key = self.root.path, builtins.tuple(self.default_file_name_pattern)
+        timestamp = self.root.timestamp
+        cached = self._default_files.get(key)
+        '''
+            NOTE: Modification times have a limited resolution, so recently \
+            changed directories are always scanned again.
+        '''
+        if(cached is None or cached[0] != timestamp or
+           time.time() - timestamp < 1):
+            cached = self._update_cache(
+                '_default_files', key=key,
+                value=(timestamp, self._search_default_file()))
+        if cached[1] is None:
+            return None
+        return FileHandler(location=cached[1])
+
+    @JointPoint
+# # python3.5
+# #     def determine_module_file_path(
+# #         self: Self, module_name: builtins.str
+# #     ) -> (builtins.str, builtins.bool):
+    def determine_module_file_path(self, module_name):
+# #
+        '''
+            Determines the file path of given module like \
+            "boostnode.extension.native.Module.get_file_path()". Results are \
+            cached until one of the module search paths is modified.
+
+            **module_name** - context path of the module to search for
+
+            Examples:
+
+            >>> web = Web(__test_folder__)
+
+            >>> web.determine_module_file_path('not_existing')
+            False
+
+            >>> 'doctest' in web.determine_module_file_path('doctest')
+            True
+        '''
+        timestamps = self._determine_timestamps(sys.path)
+        cached = self._module_file_paths.get(module_name)
+        if(timestamps is None or cached is None or
+           cached[0] != timestamps):
+            cached = self._update_cache(
+                '_module_file_paths', key=module_name, value=(
+                    timestamps, Module.get_file_path(
+                        context_path=module_name)))
+        return cached[1]
+
+    @JointPoint
+# # python3.5
+# #     def determine_redirect_router(
+# #         self: Self, external=True
+# #     ) -> RedirectRouter:
+    def determine_redirect_router(self, external=True):
+# #
+        '''
+            Returns the compiled routing table for current internal or \
+            external redirects. The table is compiled again if the redirects \
+            have been replaced since last call.
+
+            **external** - indicates whether to route external or internal \
+                           redirects
+
+            Examples:
+
+            >>> web = Web(__test_folder__, external_redirects=(
+            ...     ('GET:/a', '/b'),))
+
+            >>> web.determine_redirect_router()
+            Object of "RedirectRouter" with 1 redirects.
+            >>> web.determine_redirect_router(external=False)
+            Object of "RedirectRouter" with 0 redirects.
+
+            >>> web.external_redirects = ()
+            >>> web.determine_redirect_router()
+            Object of "RedirectRouter" with 0 redirects.
+        '''
+        redirects = self.internal_redirects
+        if external:
+            redirects = self.external_redirects
+        router = self._redirect_routers.get(external)
+        if router is None or router.redirects is not redirects:
+            router = self._redirect_routers[external] = RedirectRouter(
+                redirects)
+        return router
+
+    @JointPoint
+# # python3.5
+# #     def is_authorized(
+# #         self: Self, location: FileHandler,
+# #         authorization: (builtins.str, builtins.type(None))
+# #     ) -> (builtins.bool, builtins.type(None)):
+    def is_authorized(self, location, authorization):
+# #
+        '''
+            Checks given authorization header value against the nearest \
+            authentication file from given location up to the web root. \
+            Returns "None" if no authentication file applies. Verified \
+            authorizations are trusted for \
+            "authentication_cache_time_in_seconds" without looking at any \
+            authentication file again, so revoking them takes effect after \
+            that period.
+
+            **location**      - directory to start searching from
+
+            **authorization** - value of the "Authorization" request header
+
+            Examples:
+
+            >>> web = Web(__test_folder__)
+            >>> location = FileHandler(
+            ...     __test_folder__.path + 'is_authorized',
+            ...     make_directory=True)
+            >>> authentication_file = FileHandler(location.path + '.htpasswd')
+
+            >>> web.is_authorized(location, 'Basic aGFuczpzZWNyZXQ=')
+
+            >>> authentication_file.content = 'hans:secret\\npeter:password'
+            >>> web.is_authorized(location, 'Basic aGFuczpwZXRlcg==')
+            False
+            >>> web.is_authorized(location, 'Basic cGV0ZXI6cGFzc3dvcmQ=')
+            True
+            >>> web.is_authorized(location, 'Basic aGFuczpzZWNyZXQ=')
+            True
+
+            >>> authentication_file.remove_file()
+            True
+            >>> web.is_authorized(location, 'Basic aGFuczpzZWNyZXQ=')
+
+            >>> authentication_file.content = 'hans:secret'
+            >>> web.authentication_cache_time_in_seconds = 60
+            >>> web.is_authorized(location, 'Basic aGFuczpzZWNyZXQ=')
+            True
+            >>> authentication_file.remove_file()
+            True
+            >>> web.is_authorized(location, 'Basic aGFuczpzZWNyZXQ=')
+            True
+        '''
+        key = location.path, authorization
+        now = time.time()
+        if now - self._verified_authorizations.get(
+            key, 0
+        ) < self.authentication_cache_time_in_seconds:
+            return True
+        accepted = self.determine_authentication(location)
+        if accepted is None:
+            return None
+        if authorization in accepted:
+            if self.authentication_cache_time_in_seconds:
+                self._update_cache(
+                    '_verified_authorizations', key=key, value=now)
+            return True
+        return False
+
+    @JointPoint
+# # python3.5     def merge_cache_updates(self: Self) -> Self:
+    def merge_cache_updates(self):
+        '''
+            Merges all cache entries determined by forked workers into the \
+            caches of this process. Has to be called in the server process \
+            before new workers are forked.
+
+            Examples:
+
+            >>> web = Web(__test_folder__, default_file_name_pattern=(
+            ...     'merge_cache_updates\\..+',))
+            >>> FileHandler(
+            ...     __test_folder__.path + 'merge_cache_updates.txt'
+            ... ).content = ''
+
+            >>> web.merge_cache_updates() # doctest: +ELLIPSIS
+            Object of "Web" with root path "...
+            >>> worker = multiprocessing.Process(
+            ...     target=lambda: web.determine_default_file(
+            ...     ) and web.send_cache_updates())
+            >>> worker.start()
+            >>> worker.join()
+            >>> web._default_files
+            {}
+            >>> list(web.merge_cache_updates(
+            ... )._default_files.values())[0][1] # doctest: +ELLIPSIS
+            '...merge_cache_updates.txt'
+        '''
+        '''
+            NOTE: Workers inherit the updates collected so far, so only \
+            their own updates are sent back.
+        '''
+        self._cache_updates = []
+        if self._cache_update_queue is None:
+            self._cache_update_queue = multiprocessing.Queue()
+        while True:
+            try:
+                updates = self._cache_update_queue.get_nowait()
+            except queue.Empty:
+                return self
+            for name, key, value in updates:
+                builtins.getattr(self, name)[key] = value
+
+    @JointPoint
+# # python3.5     def send_cache_updates(self: Self) -> Self:
+    def send_cache_updates(self):
+        '''
+            Sends all cache entries determined in this forked worker to the \
+            server process (see "merge_cache_updates()").
+        '''
+        if self._cache_update_queue is not None and self._cache_updates:
+            self._cache_update_queue.put(self._cache_updates)
+            self._cache_updates = []
+        return self
+
+    @JointPoint
+# # python3.5
 # #     def stop(
 # #         self: Self, *arguments: builtins.object, force_stopping=False,
 # #         **keywords: builtins.object
@@ -1013,6 +2077,8 @@ class Web(Class, Runnable):
                 self.service.socket.setsockopt(
                     socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 self.service.socket.close()
+        if self.access_log is not None:
+            self.access_log.close()
         '''Take this method type from abstract class via introspection.'''
         return builtins.getattr(
             builtins.super(self.__class__, self), inspect.stack()[0][3]
@@ -1094,6 +2160,10 @@ class Web(Class, Runnable):
 # #         directory_listing=True, internal_redirects=None,
 # #         external_redirects=None,
 # #         known_big_web_mime_types=('application/x-shockwave-flash',),
+# #         access_log='', access_log_sink='jsonl',
+# #         access_log_maximum_size_in_byte=0,
+# #         access_log_rotation_interval_in_seconds=0,
+# #         authentication_cache_time_in_seconds=0,
 # #         **keywords: builtins.object
 # #     ) -> Self:
     def _initialize(
@@ -1124,7 +2194,10 @@ class Web(Class, Runnable):
         directory_listing=True, internal_redirects=None,
         external_redirects=None,
         known_big_web_mime_types=('application/x-shockwave-flash',),
-        **keywords
+        access_log='', access_log_sink='jsonl',
+        access_log_maximum_size_in_byte=0,
+        access_log_rotation_interval_in_seconds=0,
+        authentication_cache_time_in_seconds=0, **keywords
     ):
 # #
         '''
@@ -1139,6 +2212,28 @@ class Web(Class, Runnable):
             self.internal_redirects = ()
         if self.external_redirects is None:
             self.external_redirects = ()
+        '''Caches compiled routing tables of all redirects.'''
+        self._redirect_routers = {}
+        '''
+            Caches resolved default files per root directory and default \
+            module file paths per module name.
+        '''
+        self._default_files = {}
+        self._module_file_paths = {}
+        '''
+            Caches parsed authentication files per directory and the last \
+            verification time of each accepted authorization.
+        '''
+        self._authentications = {}
+        self._verified_authorizations = {}
+        '''
+            Collects cache entries determined in a forked worker and the \
+            queue to send them back to the server process.
+        '''
+        self._cache_updates = []
+        self._cache_update_queue = None
+        self.determine_redirect_router(external=False)
+        self.determine_redirect_router(external=True)
         '''Indicates if new worker are currently allowed to spawn.'''
         self.block_new_worker = False
         '''Saves server runtime properties.'''
@@ -1171,6 +2266,15 @@ class Web(Class, Runnable):
                 raise __exception__(
                     'Given public key file path "%s" doesn\'t points to a '
                     'file.', self.key_file._path)
+        '''Saves the structured access log if configured.'''
+        if self.access_log:
+            self.access_log = AccessLog(
+                path=self.access_log, sink=self.access_log_sink,
+                maximum_size_in_byte=self.access_log_maximum_size_in_byte,
+                rotation_interval_in_seconds=
+                    self.access_log_rotation_interval_in_seconds)
+        else:
+            self.access_log = None
 
         # # # endregions
 
@@ -1180,6 +2284,187 @@ class Web(Class, Runnable):
 
     @JointPoint
 # # python3.5
+# #     def _determine_timestamps(
+# #         self: Self, paths: NativeIterable
+# #     ) -> (builtins.list, builtins.type(None)):
+    def _determine_timestamps(self, paths):
+# #
+        '''
+            Determines the modification time of each given path. Returns \
+            "None" if one of them has been modified within the last second \
+            since changes that close together may share a timestamp.
+
+            **paths** - file system paths to inspect
+
+            Examples:
+
+            >>> web = Web(__test_folder__)
+
+            >>> web._determine_timestamps(('/not/existing/path',))
+            [('/not/existing/path', None)]
+
+            >>> FileHandler(
+            ...     __test_folder__.path + '_determine_timestamps'
+            ... ).content = ''
+            >>> web._determine_timestamps((
+            ...     __test_folder__.path + '_determine_timestamps',))
+        '''
+        now = time.time()
+        timestamps = []
+        for path in paths:
+            try:
+                timestamp = os.stat(path or os.curdir).st_mtime
+            except builtins.OSError:
+                timestamp = None
+            if timestamp is not None and now - timestamp < 1:
+                return None
+            timestamps.append((path, timestamp))
+        return timestamps
+
+    @JointPoint
+# # python3.5
+# #     def _parse_authentication_file(
+# #         self: Self, authentication_file: FileHandler
+# #     ) -> builtins.frozenset:
+    def _parse_authentication_file(self, authentication_file):
+# #
+        '''
+            Determines the authorization header values of all logins saved \
+            line by line in given authentication file.
+
+            **authentication_file** - file to parse
+        '''
+        __logger__.info(
+            'Use authentication file "%s".', authentication_file._path)
+        accepted = builtins.set()
+# # python3.5
+# #         pattern = regularExpression.compile(
+# #             self.authentication_file_content_pattern)
+# #         for line in authentication_file.content.splitlines():
+# #             match = pattern.fullmatch(line.strip())
+# #             if match:
+# #                 accepted.add('Basic %s' % base64_encode(('%s:%s' % (
+# #                     match.group('name'), match.group('password')
+# #                 )).encode(self.encoding)).decode(self.encoding))
+        pattern = regularExpression.compile(
+            '(?:%s)$' % self.authentication_file_content_pattern)
+        for line in authentication_file.content.splitlines():
+            match = pattern.match(line.strip())
+            if match:
+                accepted.add('Basic %s' % base64_encode('%s:%s' % (
+                    match.group('name'), match.group('password'))))
+# #
+        return builtins.frozenset(accepted)
+
+    @JointPoint
+# # python3.5
+# #     def _search_authentication(
+# #         self: Self, location: FileHandler
+# #     ) -> builtins.tuple:
+    def _search_authentication(self, location):
+# #
+        '''
+            Walks from given location up to the web root until an \
+            authentication file is found. Returns all inspected paths and \
+            the accepted authorization header values or "None" if no \
+            authentication file exists.
+
+            **location** - directory to start searching from
+
+            Examples:
+
+            >>> Web(__test_folder__)._search_authentication(
+            ...     __test_folder__
+            ... ) # doctest: +ELLIPSIS
+            ([...], None)
+        '''
+        paths = []
+        while True:
+            paths.append(location.path)
+            authentication_file = FileHandler(
+                location=location.path + self.authentication_file_name)
+            if authentication_file:
+                paths.append(authentication_file.path)
+                return paths, self._parse_authentication_file(
+                    authentication_file)
+            if location == self.root:
+                return paths, None
+            location = location.directory
+
+    @JointPoint
+# # python3.5
+# #     def _search_default_file(self: Self) -> (
+# #         builtins.str, builtins.type(None)
+# #     ):
+    def _search_default_file(self):
+# #
+        '''
+            Scans the root directory for the first file matching one of the \
+            default file name patterns and returns its path.
+
+            Examples:
+
+            >>> Web(__test_folder__, default_file_name_pattern=(
+            ...     'not_existing',))._search_default_file()
+        '''
+        files = builtins.tuple(self.root.list())
+        for pattern in self.default_file_name_pattern:
+# # python3.5
+# #             pattern = regularExpression.compile(pattern)
+# #             for file in files:
+# #                 if pattern.fullmatch(file.name):
+            pattern = regularExpression.compile('(?:%s)$' % pattern)
+            for file in files:
+                if pattern.match(file.name):
+# #
+                    return file.path
+        return None
+
+    @JointPoint
+# # python3.5
+# #     def _update_cache(
+# #         self: Self, name: builtins.str, key: builtins.object,
+# #         value: builtins.object
+# #     ) -> builtins.object:
+    def _update_cache(self, name, key, value):
+# #
+        '''
+            Stores given value in given cache. Entries determined in a \
+            forked worker are collected to send them back to the server \
+            process (see "send_cache_updates()").
+
+            **name**  - attribute name of the cache to update
+
+            **key**   - key to store given value under
+
+            **value** - value to store
+
+            Returns given value.
+
+            Examples:
+
+            >>> web = Web(__test_folder__)
+
+            >>> web._update_cache('_module_file_paths', 'a', (None, False))
+            (None, False)
+            >>> web._module_file_paths['a']
+            (None, False)
+            >>> web._cache_updates
+            []
+
+            >>> web._cache_update_queue = True
+            >>> web._update_cache('_module_file_paths', 'a', (None, False))
+            (None, False)
+            >>> web._cache_updates
+            [('_module_file_paths', 'a', (None, False))]
+        '''
+        builtins.getattr(self, name)[key] = value
+        if self._cache_update_queue is not None:
+            self._cache_updates.append((name, key, value))
+        return value
+
+    @JointPoint
+# # python3.5
 # #     def _stop_graceful(
 # #         self: Self, number_of_running_workers: builtins.int
 # #     ) -> Self:
@@ -1188,6 +2473,11 @@ class Web(Class, Runnable):
         '''Waits until all child processes and threads have been terminated.'''
         shown_number = 0
         while number_of_running_workers > 0:
+            '''
+                NOTE: Forked workers can only exit after their cache \
+                updates have been received.
+            '''
+            self.merge_cache_updates()
             if(number_of_running_workers !=
                self.number_of_running_threads +
                builtins.len(multiprocessing.active_children())):
@@ -1455,6 +2745,15 @@ class CGIHTTPRequestHandler(
         self.respond = False
         self.response_sent = self.headers_ended = self.content_type_sent = \
             self.content_length_sent = False
+        '''Saves the response code sent for the current request.'''
+        self.response_code = None
+        '''Counts all content bytes sent for the current request.'''
+        self.number_of_sent_bytes = 0
+        '''
+            Indicates whether the current request was answered by \
+            confirming the client's cached version.
+        '''
+        self.cache_hit = False
 # # python3.5
 # #         '''Saves the error message format.'''
 # #         self.error_message_format = (
@@ -1966,6 +3265,8 @@ class CGIHTTPRequestHandler(
                 arguments[1] = arguments[1].replace('\n', '\\n')
                 arguments = builtins.tuple(arguments)
             self.response_sent = True
+            self.response_code = arguments[0] if arguments else keywords.get(
+                'code')
             '''Take this method via introspection.'''
             builtins.getattr(
                 builtins.super(self.__class__, self), inspect.stack()[0][3]
@@ -2449,6 +3750,105 @@ class CGIHTTPRequestHandler(
 
     @JointPoint
 # # python3.5
+# #     def handle_one_request(
+# #         self: Self, *arguments: builtins.object,
+# #         **keywords: builtins.object
+# #     ) -> None:
+    def handle_one_request(self, *arguments, **keywords):
+# #
+        '''
+            Handles a single request and writes its record into the \
+            structured access log if configured.
+
+            Examples:
+
+            >>> server = MultiProcessingHTTPServer()
+            >>> server.web = Web(__test_folder__)
+            >>> handler = CGIHTTPRequestHandler(
+            ...     socket.socket(socket.AF_INET, socket.SOCK_STREAM),
+            ...     ('127.0.0.1', 12345), server)
+            >>> handler.server.web.access_log = AccessLog(
+            ...     path=__test_folder__.path + 'handle_one_request')
+            >>> handler.rfile = __import__('io').BytesIO(
+            ...     b'HEAD / HTTP/1.0\\r\\n\\r\\n')
+            >>> handler.wfile = __import__('io').BytesIO()
+
+            >>> handler.handle_one_request()
+            >>> handler.server.web.access_log.close() # doctest: +ELLIPSIS
+            Object of "AccessLog" with path "...handle_one_request" and ...
+            >>> record = json.loads(FileHandler(
+            ...     __test_folder__.path + 'handle_one_request'
+            ... ).content)
+            >>> record['method'], record['path'], record['cache_hit']
+            ('HEAD', '/', False)
+            >>> record['process_id'] == os.getpid()
+            True
+        '''
+        start_time = time.time()
+        self.command = None
+        self.response_sent = self.headers_ended = self.content_type_sent = \
+            self.content_length_sent = self.cache_hit = False
+        self.response_code = None
+        self.number_of_sent_bytes = 0
+        '''Take this method via introspection.'''
+        builtins.getattr(
+            builtins.super(self.__class__, self), inspect.stack()[0][3]
+        )(*arguments, **keywords)
+        if self.command and self.server.web.access_log is not None:
+            '''
+                NOTE: The path attribute may be changed during handling so \
+                we take the originally requested one.
+            '''
+# # python3.5
+# #             method = self.command
+# #             request_line = self.requestline.split()
+            method = convert_to_unicode(self.command)
+            request_line = convert_to_unicode(self.requestline).split()
+# #
+            self.server.web.access_log.write({
+                'bytes': self.number_of_sent_bytes,
+                'cache_hit': self.cache_hit,
+                'duration': time.time() - start_time, 'method': method,
+                'path': request_line[1] if builtins.len(
+                    request_line
+                ) > 1 else '', 'process_id': os.getpid(),
+                'status': self.response_code or 0,
+                'timestamp': start_time})
+
+    @JointPoint
+# # python3.5
+# #     def log_request(
+# #         self: Self, *arguments: builtins.object,
+# #         **keywords: builtins.object
+# #     ) -> Self:
+    def log_request(self, *arguments, **keywords):
+# #
+        '''
+            Logs a textual line for the current request unless a structured \
+            access log records it.
+
+            Examples:
+
+            >>> server = MultiProcessingHTTPServer()
+            >>> server.web = Web(__test_folder__)
+            >>> handler = CGIHTTPRequestHandler(
+            ...     socket.socket(socket.AF_INET, socket.SOCK_STREAM),
+            ...     ('127.0.0.1', 12345), server)
+            >>> handler.server.web.access_log = AccessLog(
+            ...     path=__test_folder__.path + 'log_request')
+
+            >>> handler.log_request(200) # doctest: +ELLIPSIS
+            Object of "CGIHTTPRequestHandler" with request uri "" and parame...
+        '''
+        if self.server.web.access_log is None:
+            '''Take this method via introspection.'''
+            builtins.getattr(
+                builtins.super(self.__class__, self), inspect.stack()[0][3]
+            )(*arguments, **keywords)
+        return self
+
+    @JointPoint
+# # python3.5
 # #     def log_message(
 # #         self: Self, format: builtins.str,
 # #         message_or_error_code: (builtins.int, builtins.str),
@@ -2724,28 +4124,13 @@ class CGIHTTPRequestHandler(
             (True, None)
         '''
         if self.server.web.authentication:
-            while self.server.web.authentication_file_name:
-                file_path = (
-                    self._authentication_location.path +
-                    self.server.web.authentication_file_name)
-                authentication_file = FileHandler(location=file_path)
-                if authentication_file:
-                    return (
-# # python3.5
-# #                         self.headers.get('authorization') ==
-# #                         'Basic %s' % self._get_login_data(
-# #                             authentication_file
-# #                         ), None)
-                        convert_to_unicode(self.headers.get(
-                            'authorization'
-                        )) == 'Basic %s' % self._get_login_data(
-                            authentication_file
-                        ), None)
-# #
-                if self._authentication_location == self.server.web.root:
-                    break
-                self._authentication_location = \
-                    self._authentication_location.directory
+            if self.server.web.authentication_file_name:
+                authorized = self.server.web.is_authorized(
+                    self._authentication_location,
+# # python3.5                     self.headers.get('authorization'))
+                    convert_to_unicode(self.headers.get('authorization')))
+                if authorized is not None:
+                    return authorized, None
 # # python3.5
 # #             login_data_match = regularExpression.compile(
 # #                 '(?P<name>[^:]+):(?P<password>.+)$'
@@ -2978,31 +4363,6 @@ class CGIHTTPRequestHandler(
 # #
         return self.do_GET()
 
-    @JointPoint
-# # python3.5
-# #     def _get_login_data(
-# #         self: Self, authentication_file: FileHandler
-# #     ) -> builtins.str:
-    def _get_login_data(self, authentication_file):
-# #
-        '''Determines needed login data for current request.'''
-        __logger__.info(
-            'Use authentication file "%s".', authentication_file._path)
-# # python3.5
-# #         match = regularExpression.compile(
-# #             self.server.web.authentication_file_content_pattern
-# #         ).fullmatch(authentication_file.content.strip())
-# #         return base64_encode(('%s:%s' % (
-# #             match.group('name'), match.group('password')
-# #         )).encode(self.server.web.encoding)).decode(
-# #             self.server.web.encoding)
-        match = regularExpression.compile(
-            '(?:%s)$' % self.server.web.authentication_file_content_pattern
-        ).match(authentication_file.content.strip())
-        return base64_encode(
-            '%s:%s' % (match.group('name'), match.group('password')))
-# #
-
     @JointPoint
 # # python3.5     def _determine_data(self: Self) -> builtins.dict:
     def _determine_data(self):
@@ -3393,36 +4753,14 @@ class CGIHTTPRequestHandler(
             Deals with specified redirects. External Redirects will send an \
             http redirection code.
         '''
-# # python3.5
-# #         patterns = regularExpression.compile(
-# #             '(?P<type>.+?):(?P<uri>.*)')
-        patterns = regularExpression.compile(
-            '(?P<type>.+?):(?P<uri>.*)$')
-# #
-        type_uppercase = self.type.upper()
-        redirects = self.server.web.internal_redirects
-        if external:
-            redirects = self.server.web.external_redirects
-        for source, target in redirects:
-# # python3.5             source_match = patterns.fullmatch(source)
-            source_match = patterns.match(source)
-            types = source_match.group('type').split('|')
-# # python3.5
-# #             pattern = regularExpression.compile(source_match.group('uri'))
-# #             if(type_uppercase in types or
-# #                '*' in types
-# #                ) and pattern.fullmatch(
-# #                    self.external_uri) is not None:
-            pattern = regularExpression.compile(
-                '(?:%s)$' % source_match.group('uri'))
-            if(type_uppercase in types or
-               '*' in types
-               ) and pattern.match(self.external_uri) is not None:
-# #
-                self._handle_matched_redirect(
-                    pattern, patterns, target, external)
-                return True
-        return False
+        route = self.server.web.determine_redirect_router(
+            external
+        ).route(self.type.upper(), self.external_uri)
+        if route is None:
+            return False
+        self._handle_matched_redirect(
+            route[0], RedirectRouter.PATTERN, route[1], external)
+        return True
 
     @JointPoint
 # # python3.5
@@ -3446,12 +4784,19 @@ class CGIHTTPRequestHandler(
             target_match = patterns.match(target)
             if target_match.group('type') != '-':
                 self.type = target_match.group('type')
-            for request in target_match.group('uri').split('#'):
-                self.uri = pattern.sub(
-                    request, self.external_uri
-                ).format(host_name=regularExpression.compile(':[0-9]+$').sub(
-                    '', self.host))
-                if FileHandler(location=self.uri):
+            host_name = regularExpression.compile(':[0-9]+$').sub(
+                '', self.host)
+            requests = target_match.group('uri').split('#')
+            for index, request in builtins.enumerate(requests):
+                self.uri = pattern.sub(request, self.external_uri).format(
+                    host_name=host_name)
+                '''
+                    NOTE: The last candidate is taken anyway so checking its \
+                    existence isn't needed.
+                '''
+                if index + 1 == builtins.len(requests) or FileHandler(
+                    location=self.uri
+                ):
                     break
         return self
 
@@ -3558,22 +4903,11 @@ class CGIHTTPRequestHandler(
         if(self.server.web.module_loading and
            self._is_default_module_requested()):
             return True
-        for pattern in self.server.web.default_file_name_pattern:
-# # python3.5
-# #             for file in builtins.filter(
-# #                 lambda file: regularExpression.compile(
-# #                     '(?:%s)$' % pattern
-# #                 ).fullmatch(file.name), self.server.web.root.list()
-# #             ):
-            for file in builtins.filter(
-                lambda file: regularExpression.compile(
-                    '(?:%s)$' % pattern
-                ).match(file.name), self.server.web.root.list()
-            ):
-# #
-                self.requested_file = file
-                self._set_dynamic_or_static_get(file_name=file.name)
-                return True
+        file = self.server.web.determine_default_file()
+        if file is not None:
+            self.requested_file = file
+            self._set_dynamic_or_static_get(file_name=file.name)
+            return True
         if self.server.web.directory_listing:
             self._static_get()
             return True
@@ -3677,7 +5011,7 @@ class CGIHTTPRequestHandler(
             if __name__ != '__main__':
                 self.load_module = True
                 return self._set_dynamic_or_static_get(file_name=module_name)
-        elif Module.get_file_path(context_path=module_name):
+        elif self.server.web.determine_module_file_path(module_name):
             self.load_module = True
             return self._set_dynamic_or_static_get(file_name=module_name)
         return False
@@ -3721,7 +5055,8 @@ class CGIHTTPRequestHandler(
         '''
         if((self.server.web.module_loading is True or
             self.server.web.module_loading == self.server.web.default) and
-           Module.get_file_path(context_path=self.server.web.default)):
+           self.server.web.determine_module_file_path(
+               self.server.web.default)):
             self.load_module = True
             __logger__.info(
                 'Determine "%s" as default module.', self.server.web.default)
@@ -3880,6 +5215,7 @@ class CGIHTTPRequestHandler(
 # # python3.5     def _send_not_modified_header(self: Self) -> Self:
     def _send_not_modified_header(self):
         '''Sends a header to client indicating cached file hasn't changed.'''
+        self.cache_hit = True
         self.send_content_type_header(
             mime_type=self.requested_file.mime_type, response_code=304
         ).send_static_file_cache_header(
@@ -3901,17 +5237,17 @@ class CGIHTTPRequestHandler(
             output is None or __test_mode__ or self.type == 'head'
         ):
             if self._encoded_output:
-                self.wfile.write(self._encoded_output)
-# # python3.5
-# #             elif builtins.isinstance(output, builtins.bytes):
-            elif builtins.isinstance(output, builtins.str):
-# #
-                self.wfile.write(output)
+                output = self._encoded_output
 # # python3.5             elif builtins.isinstance(output, builtins.str):
             elif builtins.isinstance(output, builtins.unicode):
-                self.wfile.write(output.encode(self.server.web.encoding))
+                output = output.encode(self.server.web.encoding)
+# # python3.5             if builtins.isinstance(output, builtins.bytes):
+            if builtins.isinstance(output, builtins.str):
+                self.wfile.write(output)
+                self.number_of_sent_bytes += builtins.len(output)
             else:
                 self.copyfile(output, self.wfile)
+                self.number_of_sent_bytes += output.tell()
                 output.close()
         return self
 
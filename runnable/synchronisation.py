@@ -33,13 +33,33 @@ __version__ = '1.0'
 # # from collections import Iterable
 import __builtin__ as builtins
 # #
+# # python3.5 import _io
+pass
+import array
+import ctypes
+import ctypes.util
+import heapq
 import inspect
+import json
 import os
+import select
+import shutil
+import struct
 import sys
+import tempfile
+import time
+# # python3.5
+# # from types import FunctionType as Function
+# # from types import GeneratorType as Generator
+# # from types import MethodType as Method
+pass
+# #
 
 '''Make boostnode packages and modules importable via relative paths.'''
 sys.path.append(os.path.abspath(sys.path[0] + 2 * (os.sep + '..')))
 
+# # python3.5 pass
+from boostnode import convert_to_string, convert_to_unicode
 from boostnode.extension.file import Handler as FileHandler
 from boostnode.extension.native import Module, InstancePropertyInitializer
 from boostnode.extension.output import Logger
@@ -54,6 +74,294 @@ from boostnode.paradigm.objectOrientation import Class
 
 # region classes
 
+class CandidateList(Class):
+
+    '''
+        Stores files which could be copied into a reflection (size, \
+        relative path and score) in a compact way. Sizes and scores are \
+        held in arrays, directories of relative paths are interned and file \
+        names are concatenated in a byte array. If the estimated memory \
+        usage exceeds "memory_limit_in_byte" all hold candidates are sorted \
+        and spilled into a temporary file. Iterating merges all spilled and \
+        hold candidates in sorted order.
+
+        **key**                  - Function determining the sort criterion \
+                                   (a number) of a candidate by its size \
+                                   and score. Equal candidates keep their \
+                                   insertion order. Candidates are sorted by \
+                                   size if nothing is given.
+
+        **memory_limit_in_byte** - Estimated memory usage which triggers \
+                                   spilling to disk.
+
+        Examples:
+
+        >>> candidates = CandidateList(memory_limit_in_byte=70)
+        >>> for size, path in ((3, 'A/c'), (1, 'A/B/a'), (2, 'b'), (1, 'A/d')):
+        ...     candidates = candidates.append(size, path)
+        >>> len(candidates)
+        4
+        >>> len(candidates._runs)
+        1
+        >>> list(candidates) # doctest: +NORMALIZE_WHITESPACE
+        [(1.0, 'A/B/a', 0.0), (1.0, 'A/d', 0.0), (2.0, 'b', 0.0),
+         (3.0, 'A/c', 0.0)]
+
+        >>> candidates = CandidateList(
+        ...     key=lambda size, score: -score / max(size, 1))
+        >>> candidates.append(2, 'a', score=1)
+        Object of "CandidateList" with 1 candidates (0 spilled runs).
+        >>> candidates.append(2, 'b', score=4)
+        Object of "CandidateList" with 2 candidates (0 spilled runs).
+        >>> list(candidates)
+        [(2.0, 'b', 4.0), (2.0, 'a', 1.0)]
+    '''
+
+    # region properties
+
+    DEFAULT_MEMORY_LIMIT_IN_BYTE = 256 * 1024 ** 2
+    '''Estimated memory usage which triggers spilling to disk by default.'''
+    ESTIMATED_MEMORY_PER_CANDIDATE_IN_BYTE = 2 * 8 + 2 * 8
+    '''
+        Estimated memory of each hold candidate without its file name (size, \
+        score, directory index and file name end).
+    '''
+
+    # endregion
+
+    # region dynamic methods
+
+    # # region public
+
+    # # # region special
+
+    @JointPoint
+# # python3.5
+# #     def __init__(
+# #         self: Self, key=None, memory_limit_in_byte=None
+# #     ) -> None:
+    def __init__(self, key=None, memory_limit_in_byte=None):
+# #
+        '''
+            Initializes an empty candidate list.
+
+            Examples:
+
+            >>> CandidateList() # doctest: +ELLIPSIS
+            Object of "CandidateList" with 0 candidates (0 spilled runs).
+        '''
+
+        # # # region properties
+
+        '''Determines the sort criterion of each candidate.'''
+        self.key = key
+        if self.key is None:
+            self.key = lambda size, score: size
+        self.memory_limit_in_byte = memory_limit_in_byte
+        if self.memory_limit_in_byte is None:
+            self.memory_limit_in_byte = self.DEFAULT_MEMORY_LIMIT_IN_BYTE
+        '''Interned directory paths and their indexes.'''
+        self._directories = []
+        self._directory_indexes = {}
+        '''Hold candidates.'''
+        self._directory_numbers = array.array('L')
+        self._names = builtins.bytearray()
+        self._name_ends = array.array('L')
+        self._sizes = array.array('d')
+        self._scores = array.array('d')
+        '''Temporary files holding spilled and sorted candidates.'''
+        self._runs = []
+        '''Number of all candidates and number of spilled candidates.'''
+        self._length = 0
+        self._spilled_length = 0
+
+        # # # endregion
+
+    @JointPoint
+# # python3.5     def __repr__(self: Self) -> builtins.str:
+    def __repr__(self):
+        '''
+            Invokes if this object should describe itself by a string.
+
+            Examples:
+
+            >>> repr(CandidateList())
+            'Object of "CandidateList" with 0 candidates (0 spilled runs).'
+        '''
+        return (
+            'Object of "{class_name}" with {number} candidates ({runs} '
+            'spilled runs).'.format(
+                class_name=self.__class__.__name__, number=self._length,
+                runs=builtins.len(self._runs)))
+
+    @JointPoint
+# # python3.5     def __len__(self: Self) -> builtins.int:
+    def __len__(self):
+        '''
+            Is triggered if you use the pythons native "builtins.len()" \
+            function on a "CandidateList" object.
+
+            Returns the number of stored candidates.
+
+            Examples:
+
+            >>> len(CandidateList().append(1, 'a'))
+            1
+        '''
+        return self._length
+
+    @JointPoint
+# # python3.5     def __iter__(self: Self) -> Generator:
+    def __iter__(self):
+        '''
+            Invokes if the current object is tried to iterate.
+
+            Returns a generator yielding size, relative path and score of \
+            each candidate in sorted order.
+
+            Examples:
+
+            >>> list(CandidateList().append(1, 'a', score=2))
+            [(1.0, 'a', 2.0)]
+        '''
+        for key, number, size, score, path in heapq.merge(*(
+            [self._iterate_run(run) for run in self._runs] +
+            [self._iterate_memory()]
+        )):
+            yield size, path, score
+
+    # # # endregion
+
+    @JointPoint
+# # python3.5
+# #     def append(
+# #         self: Self, size: builtins.float, path: builtins.str, score=0
+# #     ) -> Self:
+    def append(self, size, path, score=0):
+# #
+        '''
+            Adds a new candidate.
+
+            **size**  - File size of the candidate.
+
+            **path**  - Relative path of the candidate.
+
+            **score** - Score of the candidate.
+
+            Examples:
+
+            >>> CandidateList().append(1, 'A/a') # doctest: +ELLIPSIS
+            Object of "CandidateList" with 1 candidates (0 spilled runs).
+        '''
+        directory, separator, name = path.rpartition(os.sep)
+        index = self._directory_indexes.get(directory)
+        if index is None:
+            index = builtins.len(self._directories)
+            self._directories.append(directory)
+            self._directory_indexes[directory] = index
+        self._directory_numbers.append(index)
+        self._names.extend(name.encode('utf_8'))
+        self._name_ends.append(builtins.len(self._names))
+        self._sizes.append(size)
+        self._scores.append(score)
+        self._length += 1
+        if builtins.len(self._names) + (
+            self._length - self._spilled_length
+        ) * self.ESTIMATED_MEMORY_PER_CANDIDATE_IN_BYTE > \
+                self.memory_limit_in_byte:
+            self._spill()
+        return self
+
+    # # endregion
+
+    # # region protected
+
+    @JointPoint
+# # python3.5     def _iterate_memory(self: Self) -> Generator:
+    def _iterate_memory(self):
+        '''
+            Sorts all hold candidates.
+
+            Returns a generator yielding the sort criterion, the number, \
+            size, score and relative path of each hold candidate.
+
+            Examples:
+
+            >>> candidates = CandidateList().append(2, 'A/a').append(1, 'b')
+            >>> list(candidates._iterate_memory())
+            [(1.0, 1, 1.0, 0.0, 'b'), (2.0, 0, 2.0, 0.0, 'A/a')]
+        '''
+        sizes = self._sizes
+        scores = self._scores
+        name_ends = self._name_ends
+        keys = array.array('d')
+        for index, size in builtins.enumerate(sizes):
+            keys.append(self.key(size, scores[index]))
+        for index in builtins.sorted(
+            builtins.range(builtins.len(keys)), key=keys.__getitem__
+        ):
+            path = self._names[
+                name_ends[index - 1] if index else 0:name_ends[index]
+            ].decode('utf_8')
+            directory = self._directories[self._directory_numbers[index]]
+            if directory:
+                path = directory + os.sep + path
+            yield (
+                keys[index], self._spilled_length + index, sizes[index],
+                scores[index], path)
+
+    @JointPoint
+# # python3.5
+# #     def _iterate_run(
+# #         self: Self, run: builtins.object
+# #     ) -> Generator:
+    def _iterate_run(self, run):
+# #
+        '''
+            Reads given spilled run from its beginning.
+
+            Returns a generator yielding the sort criterion, the number, \
+            size, score and relative path of each spilled candidate.
+        '''
+        run.seek(0)
+        for line in run:
+            yield builtins.tuple(json.loads(line.decode('utf_8')))
+
+    @JointPoint
+# # python3.5     def _spill(self: Self) -> Self:
+    def _spill(self):
+        '''
+            Sorts all hold candidates and writes them into a new temporary \
+            file.
+
+            Examples:
+
+            >>> candidates = CandidateList().append(2, 'a').append(1, 'b')
+            >>> candidates._spill() # doctest: +ELLIPSIS
+            Object of "CandidateList" with 2 candidates (1 spilled runs).
+            >>> len(candidates._sizes), list(candidates)
+            (0, [(1.0, 'b', 0.0), (2.0, 'a', 0.0)])
+        '''
+        __logger__.debug(
+            'Spill %d reflection candidates to disk.',
+            self._length - self._spilled_length)
+        run = tempfile.TemporaryFile()
+        for record in self._iterate_memory():
+            run.write((json.dumps(record) + '\n').encode('utf_8'))
+        self._runs.append(run)
+        self._spilled_length = self._length
+        self._directory_numbers = array.array('L')
+        self._names = builtins.bytearray()
+        self._name_ends = array.array('L')
+        self._sizes = array.array('d')
+        self._scores = array.array('d')
+        return self
+
+    # # endregion
+
+    # endregion
+
+
 class Reflector(Class, Runnable):
 
     '''
@@ -90,6 +398,39 @@ class Reflector(Class, Runnable):
                                               back. This is only used as \
                                               sanity check.
 
+        **incremental**                     - Indicates whether an existing \
+                                              reflection should be updated \
+                                              instead of rebuild. Only \
+                                              changed files are copied, \
+                                              linked or deleted.
+
+        **number_of_threads**               - Number of files to copy or \
+                                              link at the same time. A \
+                                              value of zero uses twice the \
+                                              number of available cpu's.
+
+        **selection_strategy**              - Strategy to select files which \
+                                              should be copied into the \
+                                              reflection. "size" prefers \
+                                              small files to maximize the \
+                                              number of copied files. \
+                                              "knapsack" maximizes a score \
+                                              derived from access time, \
+                                              access log and priority \
+                                              locations.
+
+        **access_log_location**             - Optional file listing an \
+                                              accessed source path per line. \
+                                              It is used to score files for \
+                                              the "knapsack" selection \
+                                              strategy.
+
+        **watch**                           - Indicates whether source and \
+                                              reflection should be kept in \
+                                              sync by listening to file \
+                                              system events after creating \
+                                              the reflection.
+
         Examples:
 
         >>> Reflector(
@@ -292,6 +633,55 @@ class Reflector(Class, Runnable):
                             '__initializer_default_value__'},
              'dest': 'minimum_reflection_size_in_byte',
              'metavar': 'NUMBER_OF_BYTES'}},
+        {'arguments': ('-i', '--incremental'),
+         'specification': {
+             'action': 'store_true',
+             'default': {'execute': '__initializer_default_value__'},
+             'help': 'Select to update an existing reflection by only '
+                     'copying, linking or deleting changed files.',
+             'dest': 'incremental'}},
+        {'arguments': ('-j', '--number-of-threads'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': {'execute': 'type(__initializer_default_value__)'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': 'Select how many files should be copied or linked at '
+                     "the same time (default: twice the number of cpu's).",
+             'dest': 'number_of_threads',
+             'metavar': 'NUMBER'}},
+        {'arguments': ('-g', '--selection-strategy'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': builtins.str,
+             'choices': {'execute': 'self.SELECTION_STRATEGIES'},
+             'required': {'execute': '__initializer_default_value__ is None'},
+             'help': {
+                 'execute': "'Select how files to copy into the reflection "
+                            'are chosen (one of "%s", default: "%s").\' % '
+                            "('\", \"'.join(self.SELECTION_STRATEGIES), "
+                            '__initializer_default_value__)'},
+             'dest': 'selection_strategy',
+             'metavar': 'STRATEGY'}},
+        {'arguments': ('-w', '--access-log-location'),
+         'specification': {
+             'action': 'store',
+             'default': {'execute': '__initializer_default_value__'},
+             'type': builtins.str,
+             'required': False,
+             'help': 'Select a file listing an accessed source path per '
+                     'line to score files for knapsack selection.',
+             'dest': 'access_log_location',
+             'metavar': 'PATH'}},
+        {'arguments': ('-k', '--watch'),
+         'specification': {
+             'action': 'store_true',
+             'default': {'execute': '__initializer_default_value__'},
+             'help': 'Select to keep source and reflection in sync by '
+                     'listening to file system events after creating the '
+                     'reflection.',
+             'dest': 'watch'}},
         {'arguments': ('-o', '--open'),
          'specification': {
              'action': 'store',
@@ -303,6 +693,59 @@ class Reflector(Class, Runnable):
              'dest': 'open',
              'metavar': 'FILE_PATHS'}},)
     '''Holds all command line arguments.'''
+    MANIFEST_FILE_NAME = '.reflection_manifest.json'
+    '''
+        Name of the file in reflection location which describes each \
+        reflected file by its size, modification time and representation.
+    '''
+    JOURNAL_FILE_NAME = '.reflection_journal'
+    '''
+        Name of the file in reflection location which records planned and \
+        processed steps of a running reflection creation or synchronisation \
+        back to source.
+    '''
+    JOURNAL_SYNCHRONISATION_INTERVAL = 256
+    '''Number of processed paths after which the journal is synced to disk.'''
+    QUICK_HASH_SIZE_IN_BYTE = 64 * 1024
+    '''
+        Number of leading bytes compared before whole contents are compared \
+        to detect files moved in reflection.
+    '''
+    OPERATION_BATCH_SIZE = 256
+    '''
+        Number of scheduled copy or link operations to process concurrently \
+        at once.
+    '''
+    PROGRESS_LOG_INTERVAL_IN_SECONDS = 5
+    '''Minimum time between two progress log messages.'''
+    SELECTION_STRATEGIES = 'size', 'knapsack'
+    '''
+        Supported strategies to select files to copy into the reflection. \
+        Each strategy is implemented by a method named \
+        "_select_by_<strategy>()".
+    '''
+    PRIORITY_SCORE = 10
+    '''Score added to files in priority locations by knapsack selection.'''
+    WATCH_EVENT_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+    '''
+        Inotify events to listen for in watch mode: modification, attribute \
+        change, closing after writing, moving, creating and deleting.
+    '''
+    WATCH_NEW_ELEMENT_MASK = 0x80 | 0x100
+    '''Inotify events indicating a new element in a watched directory.'''
+    WATCH_DIRECTORY_FLAG = 0x40000000
+    '''Inotify flag marking events concerning a directory.'''
+    WATCH_OVERFLOW_FLAG = 0x4000
+    '''Inotify flag marking lost events due to an overflowed queue.'''
+    WATCH_IGNORED_FLAG = 0x8000
+    '''Inotify flag marking a removed watch.'''
+    WATCH_EVENT_FORMAT = 'iIII'
+    '''
+        Binary format of an inotify event header (watch descriptor, mask, \
+        cookie and name length).
+    '''
+    _inotify = None
+    '''Saves the loaded c standard library providing inotify.'''
 
     # endregion
 
@@ -682,15 +1125,146 @@ class Reflector(Class, Runnable):
             ...         location=__test_folder__.path + 'target/big_link'
             ...     ).read_symbolic_link() # doctest: +ELLIPSIS
             '...target...B...A...B...C...big.txt'
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'create_cache_incremental_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A/B').make_directories()
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content = 'hans'
+            >>> FileHandler(source.path + 'A/B/b.txt').content = 'hans'
+            >>> FileHandler(source.path + 'big.txt').content = 100 * 'big'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'create_cache_incremental_target')
+            >>> reflector = Reflector(
+            ...     source, target, limit='20 byte', incremental=True)
+            >>> repr(reflector.create_cache()) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...incremental_source...'
+            >>> FileHandler(target.path + 'big.txt').is_portable_link()
+            True
+            >>> manifest = FileHandler(
+            ...     target.path + Reflector.MANIFEST_FILE_NAME)
+            >>> manifest.is_file()
+            True
+
+            >>> FileHandler(source.path + 'A/B/b.txt').remove_file()
+            True
+            >>> FileHandler(source.path + 'c.txt').content = 'peter'
+            >>> kept_file = FileHandler(target.path + 'A/a.txt')
+            >>> kept_timestamp = kept_file.timestamp
+            >>> repr(Reflector(
+            ...     source, target, limit='20 byte', incremental=True
+            ... ).create_cache()) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...incremental_source...'
+            >>> kept_file.timestamp == kept_timestamp
+            True
+            >>> FileHandler(target.path + 'c.txt').content
+            'peter'
+            >>> FileHandler(target.path + 'A/B/b.txt').is_element()
+            False
+            >>> FileHandler(target.path + 'big.txt').is_portable_link()
+            True
+
+            >>> kept_file.content = 'changed in reflection'
+            >>> repr(Reflector(
+            ...     source, target, limit='20 byte', incremental=True
+            ... ).create_cache()) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...incremental_source...'
+            >>> kept_file.content
+            'hans'
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'create_cache_knapsack_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'hot.txt').content = 1500 * 'hot'
+            >>> FileHandler(source.path + 'cold.txt').content = 1000 * 'old'
+            >>> access_log = FileHandler(
+            ...     __test_folder__.path + 'create_cache_knapsack.log')
+            >>> access_log.content = 100 * 'hot.txt\\n'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'create_cache_knapsack_target')
+            >>> repr(Reflector(
+            ...     source, target, limit='4500 byte',
+            ...     selection_strategy='knapsack',
+            ...     access_log_location=access_log.path
+            ... ).create_cache()) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...knapsack_source...'
+            >>> FileHandler(target.path + 'hot.txt').is_file(allow_link=False)
+            True
+            >>> FileHandler(target.path + 'cold.txt').is_portable_link()
+            True
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'create_cache_resume_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A').make_directory()
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content = 'hans'
+            >>> FileHandler(source.path + 'b.txt').content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'create_cache_resume_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'A').make_directory()
+            True
+            >>> journal = FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME)
+            >>> journal.content = (
+            ...     '["planning", "structure"]\\n["structure", "A"]\\n'
+            ...     '["planned", "structure"]\\n["planning", "reflection"]\\n'
+            ...     '["reflection", [4, "A/a.txt"]]\\n'
+            ...     '["reflection", [4, "b.txt"]]\\n'
+            ...     '["planned", "reflection"]\\n'
+            ...     '["progress", "reflection", 1]\\n["progress", "refl')
+            >>> repr(Reflector(
+            ...     source, target
+            ... ).create_cache()) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...resume_source...'
+            >>> FileHandler(target.path + 'A/a.txt').is_element()
+            False
+            >>> FileHandler(target.path + 'b.txt').content
+            'hans'
+            >>> journal.is_element()
+            False
         '''
-        __logger__.info('Clear reflection directory.')
-        self.target_location.clear_directory()
-        __logger__.info('Create reflection structure.')
-        self.source_location.iterate_directory(
-            function=self._create_reflection_structure,
-            target=self.target_location, recursive_in_link=False)
-        __logger__.info('Create reflection files.')
-        return self._create_reflection_files()
+        journal_path = self.target_location.path + self.JOURNAL_FILE_NAME
+        records = self._read_journal()
+        manifest_file = FileHandler(
+            location=self.target_location.path + self.MANIFEST_FILE_NAME)
+        if self.incremental and manifest_file.is_file():
+            __logger__.info('Load reflection manifest.')
+            self._manifest = json.loads(manifest_file.content)
+        elif 'structure' not in records['planned']:
+            __logger__.info('Clear reflection directory.')
+            for element in builtins.tuple(self.target_location.list()):
+                if element.name != self.JOURNAL_FILE_NAME:
+                    element.remove_deep()
+        if self.access_log_location and 'structure' not in records[
+            'planned'
+        ]:
+            self._load_access_counts()
+# # python3.5         journal = builtins.open(journal_path, mode='a')
+        journal = builtins.open(convert_to_string(journal_path), mode='a')
+        try:
+            __logger__.info('Create reflection structure.')
+            self._reflected_paths.update(self._plan_journal_step(
+                journal, records, name='structure',
+                function=self._determine_reflection_structure_paths))
+            candidates = self._plan_journal_step(
+                journal, records, name='reflection',
+                function=builtins.getattr(
+                    self, '_select_by_%s' % self.selection_strategy))
+            __logger__.info('Create reflection files.')
+            self._create_reflection_files(
+                candidates, journal=journal,
+                start=records['progress'].get('reflection', 0))
+        finally:
+            journal.close()
+        if self.incremental:
+            __logger__.info('Remove outdated reflection elements.')
+            self._remove_outdated_reflection_elements()
+            manifest_file.content = json.dumps(self._new_manifest)
+        FileHandler(location=journal_path).remove_file()
+        return self
 
     @JointPoint
 # # python3.5     def synchronize_back_to_source(self: Self) -> Self:
@@ -824,24 +1398,156 @@ class Reflector(Class, Runnable):
                 ' your intended job after this.',
                 __module_name__.capitalize())
         else:
-            __logger__.info('Relocate moved files.')
-            self.target_location.iterate_directory(
-                function=self._relocate_moved_file,
-                recursive=True, recursive_in_link=False)
-            __logger__.info('Copy new files in cache to source.')
-            self.target_location.iterate_directory(
-                function=self._copy_cache_to_source,
-                recursive=True, recursive_in_link=False)
-            __logger__.info('Delete source files not existing in target.')
-            self.source_location.iterate_directory(
-                function=self._delete_source_file_not_existing_in_target,
-                recursive=True, recursive_in_link=False, deep_first=True)
+            self._apply_reflection_to_source()
             Platform.set_process_lock(description=__module_name__)
         __logger__.info('Clear cache.')
         self.target_location.clear_directory()
         Platform.clear_process_lock(description=__module_name__)
         return self
 
+    @JointPoint
+# # python3.5
+# #     def watch_for_changes(
+# #         self: Self, debounce_in_seconds=1, timeout_in_seconds=None,
+# #         maximum_delay_in_seconds=10
+# #     ) -> Self:
+    def watch_for_changes(
+        self, debounce_in_seconds=1, timeout_in_seconds=None,
+        maximum_delay_in_seconds=10
+    ):
+# #
+        '''
+            Keeps source and reflection in sync by listening to file system \
+            events (via inotify) in both areas. Collected changes are \
+            applied after no further event occurred for \
+            "debounce_in_seconds" or at the latest \
+            "maximum_delay_in_seconds" after their first event so that a \
+            continuous stream of events can't defer them forever. Changes \
+            in reflection are synchronized \
+            back like "synchronize_back_to_source()" does but only for \
+            changed paths. Changes in source are reflected. If a path was \
+            changed in both areas the reflection wins.
+
+            A process lock is hold while changes are applied. If a former \
+            watching process was interrupted in that state the whole \
+            reflection is synchronized back before watching starts.
+
+            **debounce_in_seconds**      - Time without any event to wait \
+                                           until collected changes are \
+                                           applied.
+
+            **timeout_in_seconds**       - Time to watch. Watches until \
+                                           current thread is terminated if \
+                                           "None" is given.
+
+            **maximum_delay_in_seconds** - Maximum time to wait after the \
+                                           first collected event until \
+                                           collected changes are applied.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'watch_source', make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'watch_target', make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> if Platform().operating_system == 'linux':
+            ...     repr(reflector.watch_for_changes(timeout_in_seconds=0.1))
+            ... else:
+            ...     repr(reflector) # doctest: +ELLIPSIS
+            'Object of "Reflector" with source path "...watch_source...'
+
+            >>> import threading
+            >>> reflected = []
+            >>> def change_continuously():
+            ...     deadline = time.time() + 1
+            ...     while not reflected and time.time() < deadline:
+            ...         FileHandler(target.path + 'a.txt').content = 'hans'
+            ...         time.sleep(0.05)
+            ...         source_file = FileHandler(source.path + 'a.txt')
+            ...         if source_file.content == 'hans':
+            ...             reflected.append(True)
+            >>> if Platform().operating_system == 'linux':
+            ...     changer = threading.Thread(target=change_continuously)
+            ...     changer.start()
+            ...     reflector = reflector.watch_for_changes(
+            ...         timeout_in_seconds=1.5, maximum_delay_in_seconds=0.2)
+            ...     changer.join()
+            ... else:
+            ...     reflected.append(True)
+            >>> reflected
+            [True]
+        '''
+        lock_description = __module_name__ + '_watch'
+        if Platform.check_process_lock(description=lock_description):
+            __logger__.warning(
+                'The last watching process was interrupted while applying '
+                'changes. %s will synchronize the whole reflection back '
+                'before watching.', __module_name__.capitalize())
+            self._apply_reflection_to_source()
+            Platform.clear_process_lock(description=lock_description)
+        descriptor = self._initialize_watch_descriptor()
+        try:
+            watches = {}
+            for location in ('source', 'target'):
+                self._add_watches(descriptor, watches, location, path='')
+            __logger__.info(
+                'Watching {number} directories for changes.'.format(
+                    number=builtins.len(watches)))
+            changes = {'source': builtins.set(), 'target': builtins.set()}
+            '''Maps paths touched by this process to an expiration time.'''
+            suppressed = {}
+            end_time = None
+            if timeout_in_seconds is not None:
+                end_time = time.time() + timeout_in_seconds
+            first_event_time = last_event_time = None
+            while not Platform.check_thread():
+                now = time.time()
+                if end_time is not None and now >= end_time:
+                    break
+                waiting_time = debounce_in_seconds
+                if first_event_time is not None:
+                    waiting_time = builtins.max(0, builtins.min(
+                        waiting_time,
+                        first_event_time + maximum_delay_in_seconds - now))
+                if end_time is not None:
+                    waiting_time = builtins.min(waiting_time, end_time - now)
+                if select.select([descriptor], [], [], waiting_time)[0]:
+                    for location, path in self._read_watch_events(
+                        descriptor, watches
+                    ):
+                        if suppressed.get((location, path), 0) < now:
+                            changes[location].add(path)
+                    last_event_time = time.time()
+                    if first_event_time is None:
+                        first_event_time = last_event_time
+                now = time.time()
+                if last_event_time is not None and (
+                    now - last_event_time >= debounce_in_seconds or
+                    now - first_event_time >= maximum_delay_in_seconds
+                ):
+                    Platform.set_process_lock(description=lock_description)
+                    touched = self._apply_watched_changes(changes)
+                    Platform.clear_process_lock(description=lock_description)
+                    now = time.time()
+                    suppressed = builtins.dict(
+                        (key, expiration)
+                        for key, expiration in suppressed.items()
+                        if expiration > now)
+                    for key in touched:
+                        suppressed[key] = now + 2 * debounce_in_seconds
+                    changes = {
+                        'source': builtins.set(), 'target': builtins.set()}
+                    first_event_time = last_event_time = None
+            if changes['source'] or changes['target']:
+                Platform.set_process_lock(description=lock_description)
+                self._apply_watched_changes(changes)
+                Platform.clear_process_lock(description=lock_description)
+        finally:
+            os.close(descriptor)
+        return self
+
     # # endregion
 
     # # region protected
@@ -898,7 +1604,8 @@ class Reflector(Class, Runnable):
 # #         exclude_locations=(), target_rights=777, synchronize_back=False,
 # #         create=False, use_native_symlinks=False,
 # #         minimum_reflection_size_in_byte=100 * 10 ** 3,  # 100 Kilobyte
-# #         **keywords: builtins.object
+# #         incremental=False, number_of_threads=0, selection_strategy='size',
+# #         access_log_location='', watch=False, **keywords: builtins.object
 # #     ) -> Self:
     def _initialize(
         self, source_location, target_location=None, limit='100 MB',
@@ -906,7 +1613,8 @@ class Reflector(Class, Runnable):
         target_rights=777, synchronize_back=False, create=False,
         use_native_symlinks=False,
         minimum_reflection_size_in_byte=100 * 10 ** 3,  # 100 Kilobyte
-        **keywords
+        incremental=False, number_of_threads=0, selection_strategy='size',
+        access_log_location='', watch=False, **keywords
     ):
 # #
         '''Initializes a new object of a given synchronisation process.'''
@@ -918,12 +1626,41 @@ class Reflector(Class, Runnable):
         '''Count all edited files during the creation process.'''
         self._edited_number_of_files = 0
         '''
-            Lists which will be created before the reflection starts. It \
-            provides a list of all files in descending order depending on \
-            there file-sizes.
+            Candidate lists which will be created before the reflection \
+            starts. They provide size, relative path and score of all files \
+            in the order given by the selection strategy.
+        '''
+        key = None
+        if self.selection_strategy == 'knapsack':
+            key = lambda size, score: -score / builtins.max(size, 1)
+        self._files = CandidateList(key=key)
+        self._priority_files = CandidateList()
+        '''
+            Maps relative source paths to the number of accesses found in \
+            given access log (used by knapsack selection).
+        '''
+        self._access_counts = {}
         '''
-        self._files = []
-        self._priority_files = []
+            Saves the manifest of the last reflection and the manifest \
+            describing the current one (used in incremental mode). Each \
+            relative file path is mapped to its size, its modification time \
+            in source, its representation ("copy" or "link") and the \
+            modification time of its representation in reflection.
+        '''
+        self._manifest = {}
+        self._new_manifest = {}
+        '''Collects relative paths of all elements of current reflection.'''
+        self._reflected_paths = builtins.set()
+        '''
+            Holds copy and link operations which will be processed \
+            concurrently. Each item consists of an operation (as supported \
+            by "FileHandler.process_operations()" or "None" if already \
+            done), the relative path in reflection area and the beginning \
+            of its manifest entry.
+        '''
+        self._pending_operations = []
+        '''Saves the last time the reflection progress was logged.'''
+        self._last_progress_log_time = 0
         '''Defines source and target objects for there locations.'''
         self.source_location = FileHandler(
             location=self.source_location, must_exist=True)
@@ -946,6 +1683,8 @@ class Reflector(Class, Runnable):
                 self._synchronize_back()
             else:
                 self.create_cache()
+                if self.watch:
+                    self.watch_for_changes()
         __logger__.info(
             '{program} {version} {status} finished successful.'.format(
                 program=__module_name__, version=__version__,
@@ -994,43 +1733,1008 @@ class Reflector(Class, Runnable):
         return self
 
     @JointPoint
-# # python3.5     def _validate_inputs(self: Self) -> Self:
-    def _validate_inputs(self):
-        '''
-            Validates the given parameters to the "self.__init__()" method. \
-            Checks if all paths makes sense and all inputs are in the right \
-            format.
+# # python3.5     def _apply_reflection_to_source(self: Self) -> Self:
+    def _apply_reflection_to_source(self):
         '''
-        if self.target_location.path.startswith((
-            self.source_location.path, self.target_location.path
-        )):
-            raise __exception__(
-                'Source path "%s" and reflection path "%s" have to be in '
-                'different locations.', self.source_location.path,
-                self.target_location.path)
-        if self.limit is False or self.limit < 0:
-            raise __exception__('Invalid cache-limit.')
-        elif(not (builtins.isinstance(
-                self.target_rights, builtins.int) and
-            builtins.len(builtins.str(self.target_rights)) == 3 and
-            self.target_rights >= 0 and self.target_rights <= 777)
-        ):
-            raise __exception__(
-                'Reflection-rights "%s" aren\'t written in a convenient way '
-                'like "770".', self.target_rights)
-        return self._check_path_lists()
+            Relocates moved files, copies new files and deletes removed \
+            files of the whole reflection in source. Each planned step and \
+            its progress is recorded in a write-ahead journal in reflection \
+            location. An interrupted run is resumed from its journal without \
+            walking already planned trees again.
 
-    @JointPoint
-# # python3.5     def _check_path_lists(self: Self) -> Self:
-    def _check_path_lists(self):
-        '''
-            Checks if all given paths lists are in locations which makes \
-            sense, to prevent user for failures.
-        '''
-        return self._check_path_in_source(
-            paths=self.priority_locations, path_type='Priority'
-        )._check_path_in_source(
-            paths=self.exclude_locations, path_type='Exclude')
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'apply_reflection_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'deleted.txt').content = 'hans'
+            >>> FileHandler(source.path + 'A').make_directory()
+            True
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'apply_reflection_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'A').make_directory()
+            True
+            >>> FileHandler(target.path + 'A/a.txt').content = 'peter'
+            >>> reflector = Reflector(source, target)
+
+            >>> journal = FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME)
+            >>> journal.content = (
+            ...     '["target", "A"]\\n["target", "A/a.txt"]\\n'
+            ...     '["planned", "target"]\\n["progress", "relocate", 2]\\n'
+            ...     '["progress", "copy", 1]\\n["source", "A/b.')
+            >>> reflector._apply_reflection_to_source() # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(source.path + 'A/a.txt').content
+            'peter'
+            >>> FileHandler(source.path + 'deleted.txt').is_element()
+            False
+            >>> journal.is_element()
+            False
+
+            >>> FileHandler(source.path + 'kept.txt').content = 'hans'
+            >>> journal.content = '["planning", "structure"]\\n'
+            >>> reflector._apply_reflection_to_source() # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(source.path + 'kept.txt').is_file()
+            True
+        '''
+        journal_path = self.target_location.path + self.JOURNAL_FILE_NAME
+        records = self._read_journal()
+        if 'structure' in records['plans']:
+            __logger__.warning(
+                'Creating reflection was interrupted. Its incomplete '
+                'reflection will not be synchronized back to source.')
+            return self
+# # python3.5         journal = builtins.open(journal_path, mode='a')
+        journal = builtins.open(convert_to_string(journal_path), mode='a')
+        try:
+            target_paths = self._plan_journal_step(
+                journal, records, name='target',
+                function=self._determine_reflection_paths)
+            __logger__.info('Relocate moved files.')
+            self._process_journal_step(
+                journal, records, name='relocate', paths=target_paths,
+                function=self._relocate_moved_file,
+                location=self.target_location)
+            source_paths = self._plan_journal_step(
+                journal, records, name='source',
+                function=self._determine_removed_source_paths)
+            moves = self._plan_journal_step(
+                journal, records, name='moves',
+                function=lambda: self._determine_moved_files(
+                    target_paths, source_paths))
+            __logger__.info('Move files moved or renamed in cache.')
+            self._process_journal_step(
+                journal, records, name='move', paths=moves,
+                function=self._move_source_file)
+            __logger__.info('Copy new files in cache to source.')
+            self._process_journal_step(
+                journal, records, name='copy', paths=target_paths,
+                function=self._copy_cache_to_source,
+                location=self.target_location)
+            __logger__.info('Delete source files not existing in target.')
+            self._process_journal_step(
+                journal, records, name='delete', paths=source_paths,
+                function=self._delete_source_file_not_existing_in_target,
+                location=self.source_location)
+        finally:
+            journal.close()
+        FileHandler(location=journal_path).remove_file()
+        return self
+
+    @JointPoint
+# # python3.5
+# #     def _determine_moved_files(
+# #         self: Self, target_paths: builtins.list,
+# #         source_paths: builtins.list
+# #     ) -> Generator:
+    def _determine_moved_files(self, target_paths, source_paths):
+# #
+        '''
+            Detects copied files which were moved or renamed in reflection. \
+            Files only existing in reflection are compared with files only \
+            existing in source by their size, a hash of their first \
+            "QUICK_HASH_SIZE_IN_BYTE" bytes and (if needed) a hash of their \
+            whole content. Hashes are determined concurrently.
+
+            **target_paths** - All relative paths in reflection.
+
+            **source_paths** - Relative paths of source elements without \
+                               counterpart in reflection.
+
+            Returns a generator yielding pairs of old and new relative path.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_determine_moved_files_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'a.txt').content = 'hans'
+            >>> FileHandler(source.path + 'b.txt').content = 'peter'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_determine_moved_files_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'A').make_directory()
+            True
+            >>> FileHandler(target.path + 'A/c.txt').content = 'hans'
+            >>> FileHandler(target.path + 'd.txt').content = 'klaus'
+            >>> reflector = Reflector(source, target)
+
+            >>> list(reflector._determine_moved_files(
+            ...     ['A', 'A/c.txt', 'd.txt'], ['a.txt', 'b.txt']))
+            [['a.txt', 'A/c.txt']]
+
+            >>> Reflector.QUICK_HASH_SIZE_IN_BYTE = 1
+            >>> list(reflector._determine_moved_files(
+            ...     ['A', 'A/c.txt', 'd.txt'], ['a.txt', 'b.txt']))
+            [['a.txt', 'A/c.txt']]
+            >>> Reflector.QUICK_HASH_SIZE_IN_BYTE = 64 * 1024
+
+            >>> list(reflector._determine_moved_files(['d.txt'], ['b.txt']))
+            []
+        '''
+# # python3.5
+# #         source_root = self.source_location.path
+# #         target_root = self.target_location.path
+        source_root = convert_to_string(self.source_location.path)
+        target_root = convert_to_string(self.target_location.path)
+# #
+        new_files = {}
+        for path in target_paths:
+# # python3.5
+# #             target = os.path.join(target_root, path)
+# #             source = os.path.join(source_root, path)
+            target = os.path.join(target_root, convert_to_string(path))
+            source = os.path.join(source_root, convert_to_string(path))
+# #
+            if(os.path.isfile(target) and not os.path.islink(target) and
+               not os.path.lexists(source)):
+                new_files.setdefault(os.path.getsize(target), []).append(path)
+        moved_files = {}
+        for path in source_paths:
+# # python3.5
+# #             target = os.path.join(target_root, path)
+# #             source = os.path.join(source_root, path)
+            target = os.path.join(target_root, convert_to_string(path))
+            source = os.path.join(source_root, convert_to_string(path))
+# #
+            if(os.path.isfile(source) and not os.path.islink(source) and
+               not os.path.lexists(target)):
+                size = os.path.getsize(source)
+                if size in new_files:
+                    moved_files.setdefault(size, []).append(path)
+        if not moved_files:
+            return
+        __logger__.info(
+            'Compare {number} files to detect moves.'.format(number=(
+                builtins.sum(builtins.map(
+                    builtins.len, moved_files.values()
+                )) + builtins.sum(
+                    builtins.len(new_files[size]) for size in moved_files))))
+        number_of_threads = self.number_of_threads or None
+        '''Maps size and hash of first bytes to old and new paths.'''
+        groups = {}
+        for index, (root, paths) in builtins.enumerate((
+            (self.source_location.path, moved_files),
+            (self.target_location.path, builtins.dict(
+                (size, new_files[size]) for size in moved_files))
+        )):
+            hashes = FileHandler.determine_hashes(
+                [root + path for size in paths for path in paths[size]],
+                limit=self.QUICK_HASH_SIZE_IN_BYTE,
+                number_of_threads=number_of_threads)
+            for size in paths:
+                for path in paths[size]:
+                    groups.setdefault(
+                        (size, hashes[root + path]), ([], [])
+                    )[index].append(path)
+        '''
+            Files with matching leading bytes are compared by their whole \
+            content if they are bigger.
+        '''
+        locations = []
+        for (size, digest), (old_paths, new_paths) in groups.items():
+            if old_paths and new_paths and size > self.QUICK_HASH_SIZE_IN_BYTE:
+                locations.extend(
+                    self.source_location.path + path for path in old_paths)
+                locations.extend(
+                    self.target_location.path + path for path in new_paths)
+        hashes = {}
+        if locations:
+            hashes = FileHandler.determine_hashes(
+                locations, number_of_threads=number_of_threads)
+        for (size, digest), (old_paths, new_paths) in builtins.sorted(
+            groups.items()
+        ):
+            if not (old_paths and new_paths):
+                continue
+            matches = {None: (old_paths, new_paths)}
+            if size > self.QUICK_HASH_SIZE_IN_BYTE:
+                matches = {}
+                for path in old_paths:
+                    matches.setdefault(hashes[
+                        self.source_location.path + path
+                    ], ([], []))[0].append(path)
+                for path in new_paths:
+                    matches.setdefault(hashes[
+                        self.target_location.path + path
+                    ], ([], []))[1].append(path)
+            for old_paths, new_paths in matches.values():
+                for old_path, new_path in builtins.zip(
+                    builtins.sorted(old_paths), builtins.sorted(new_paths)
+                ):
+                    yield [old_path, new_path]
+
+    @JointPoint
+# # python3.5
+# #     def _move_source_file(
+# #         self: Self, move: builtins.list
+# #     ) -> builtins.bool:
+    def _move_source_file(self, move):
+# #
+        '''
+            Moves a source file to the location where it was moved in \
+            reflection.
+
+            **move** - Old and new relative path of the moved file.
+
+            Returns "True" if moving was successful or not needed and \
+            "False" otherwise.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_move_source_file_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'a.txt').content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_move_source_file_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> reflector._move_source_file(['a.txt', 'A/b.txt'])
+            True
+            >>> FileHandler(source.path + 'A/b.txt').content
+            'hans'
+            >>> reflector._move_source_file(['a.txt', 'A/b.txt'])
+            True
+        '''
+        old_file = FileHandler(location=self.source_location.path + move[0])
+        new_file = FileHandler(location=self.source_location.path + move[1])
+        if old_file.is_file() and not new_file.is_element():
+            return self._relocate_missing_file(
+                relocated_file=new_file, linked_file=old_file)
+        return True
+
+    @JointPoint
+# # python3.5     def _read_journal(self: Self) -> builtins.dict:
+    def _read_journal(self):
+        '''
+            Reads the journal of an interrupted synchronisation. A \
+            truncated last record is ignored and removed from journal so \
+            that new records can be appended. Records of a walk which was \
+            planned again are dropped when its "planning" marker is reached.
+
+            Returns a dictionary with planned paths of each started walk \
+            ("plans"), names of completely planned walks ("planned") and \
+            number of processed paths of each step ("progress").
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_read_journal_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_read_journal_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> reflector._read_journal() == {
+            ...     'plans': {}, 'planned': set(), 'progress': {}}
+            True
+
+            >>> FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME
+            ... ).content = (
+            ...     '["target", "a"]\\n["planned", "target"]\\n'
+            ...     '["progress", "copy", 1]\\n["progress", "cop')
+            >>> reflector._read_journal() == {
+            ...     'plans': {'target': ['a']}, 'planned': set(['target']),
+            ...     'progress': {'copy': 1}}
+            True
+            >>> FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME
+            ... ).content.endswith('["progress", "copy", 1]\\n')
+            True
+
+            >>> FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME
+            ... ).content = (
+            ...     '["planning", "target"]\\n["target", "a"]\\n'
+            ...     '["planning", "target"]\\n["target", "a"]\\n'
+            ...     '["target", "b"]\\n["planned", "target"]\\n'
+            ...     '["planning", "source"]\\n["source", "a"]\\n')
+            >>> reflector._read_journal() == {
+            ...     'plans': {'target': ['a', 'b'], 'source': ['a']},
+            ...     'planned': set(['target']), 'progress': {}}
+            True
+        '''
+        records = {'plans': {}, 'planned': builtins.set(), 'progress': {}}
+        journal = FileHandler(
+            location=self.target_location.path + self.JOURNAL_FILE_NAME)
+        if journal.is_file():
+            __logger__.warning(
+                'The last synchronisation process was interrupted. Resume '
+                'it from journal "%s".', journal.path)
+            lines = []
+            truncated = False
+            for line in journal.iterate_lines():
+                try:
+                    if not line.endswith('\n'):
+                        raise builtins.ValueError('Record is incomplete.')
+                    record = json.loads(line)
+                except builtins.ValueError:
+                    truncated = True
+                    break
+                lines.append(line)
+                if record[0] == 'planning':
+                    records['plans'][record[1]] = []
+                    records['planned'].discard(record[1])
+                elif record[0] == 'planned':
+                    records['planned'].add(record[1])
+                elif record[0] == 'progress':
+                    records['progress'][record[1]] = record[2]
+                else:
+                    records['plans'].setdefault(record[0], []).append(
+                        record[1])
+            if truncated:
+                journal.content = ''.join(lines)
+        return records
+
+    @JointPoint
+# # python3.5
+# #     def _write_journal_record(
+# #         self: Self, journal: _io.TextIOWrapper, record: builtins.list,
+# #         synchronize=False
+# #     ) -> Self:
+    def _write_journal_record(self, journal, record, synchronize=False):
+# #
+        '''
+            Appends given record to given journal.
+
+            **journal**     - Opened journal file.
+
+            **record**      - Record to append.
+
+            **synchronize** - Indicates whether all written records should \
+                              be flushed to disk.
+        '''
+        journal.write(json.dumps(record) + '\n')
+        if synchronize:
+            journal.flush()
+            os.fsync(journal.fileno())
+        return self
+
+    @JointPoint
+# # python3.5
+# #     def _plan_journal_step(
+# #         self: Self, journal: _io.TextIOWrapper, records: builtins.dict,
+# #         name: builtins.str, function: (Function, Method)
+# #     ) -> builtins.list:
+    def _plan_journal_step(self, journal, records, name, function):
+# #
+        '''
+            Determines paths to handle in a synchronisation step and \
+            records them in given journal. Already planned paths are taken \
+            from journal. A plan is only taken if it was completely recorded.
+
+            **journal**  - Opened journal file.
+
+            **records**  - Records of an interrupted synchronisation.
+
+            **name**     - Name of the walk to plan.
+
+            **function** - Function yielding relative paths to plan.
+
+            Returns a list of planned relative paths.
+        '''
+        if name in records['planned']:
+            return records['plans'][name]
+        '''
+            Records of an unterminated plan of an interrupted run are \
+            dropped by readers when they reach this marker.
+        '''
+        self._write_journal_record(journal, record=['planning', name])
+        paths = []
+        for path in function():
+            paths.append(path)
+            self._write_journal_record(journal, record=[name, path])
+        self._write_journal_record(
+            journal, record=['planned', name], synchronize=True)
+        return paths
+
+    @JointPoint
+# # python3.5
+# #     def _process_journal_step(
+# #         self: Self, journal: _io.TextIOWrapper, records: builtins.dict,
+# #         name: builtins.str, paths: builtins.list,
+# #         function: (Function, Method), location=None
+# #     ) -> Self:
+    def _process_journal_step(
+        self, journal, records, name, paths, function, location=None
+    ):
+# #
+        '''
+            Applies given function to each planned path which wasn't \
+            processed before. Progress is recorded in given journal every \
+            "JOURNAL_SYNCHRONISATION_INTERVAL" paths.
+
+            **journal**  - Opened journal file.
+
+            **records**  - Records of an interrupted synchronisation.
+
+            **name**     - Name of the step to process.
+
+            **paths**    - Planned relative paths.
+
+            **function** - Function to call with a file object for each path.
+
+            **location** - Location given paths are relative to. If \
+                           "None" is given planned items are passed to \
+                           "function" as they are.
+        '''
+        start = records['progress'].get(name, 0)
+        if start:
+            __logger__.info(
+                'Resume step "%s" after %d of %d paths.', name, start,
+                builtins.len(paths))
+        for index in builtins.range(start, builtins.len(paths)):
+            if location is None:
+                function(paths[index])
+            else:
+                function(FileHandler(location=location.path + paths[index]))
+            if (index + 1) % self.JOURNAL_SYNCHRONISATION_INTERVAL == 0:
+                self._write_journal_record(
+                    journal, record=['progress', name, index + 1],
+                    synchronize=True)
+        return self._write_journal_record(
+            journal, record=['progress', name, builtins.len(paths)],
+            synchronize=True)
+
+    @JointPoint
+# # python3.5
+# #     def _determine_reflection_structure_paths(self: Self) -> Generator:
+    def _determine_reflection_structure_paths(self):
+# #
+        '''
+            Creates reflection structure and collects all files to reflect.
+
+            Returns a generator yielding relative paths of all directories \
+            and links in reflection.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'reflection_structure_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A/B').make_directories()
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'reflection_structure_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> list(reflector._determine_reflection_structure_paths()) == [
+            ...     'A', os.path.join('A', 'B')]
+            True
+            >>> len(reflector._files)
+            1
+        '''
+        self.source_location.iterate_directory(
+            function=self._create_reflection_structure,
+            target=self.target_location, recursive_in_link=False)
+        for path in builtins.sorted(self._reflected_paths):
+            yield path
+
+    @JointPoint
+# # python3.5     def _determine_reflection_paths(self: Self) -> Generator:
+    def _determine_reflection_paths(self):
+        '''
+            Walks through reflection area. Parents are given before their \
+            children. Manifest and journal are left out.
+
+            Returns a generator yielding all relative element paths.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'reflection_paths_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'reflection_paths_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'A').make_directory()
+            True
+            >>> FileHandler(target.path + 'A/a.txt').content = 'hans'
+            >>> FileHandler(
+            ...     target.path + Reflector.JOURNAL_FILE_NAME
+            ... ).content = ''
+            >>> list(Reflector(source, target)._determine_reflection_paths())
+            ['A', 'A/a.txt']
+        '''
+# # python3.5         target_path = self.target_location.path
+        target_path = convert_to_string(self.target_location.path)
+        for directory_path, directory_names, file_names in os.walk(
+            target_path
+        ):
+            directory_names.sort()
+            for name in builtins.sorted(directory_names + file_names):
+# # python3.5
+# #                 path = os.path.relpath(
+# #                     os.path.join(directory_path, name), target_path)
+                path = convert_to_unicode(os.path.relpath(
+                    os.path.join(directory_path, name), target_path))
+# #
+                if path not in (
+                    self.MANIFEST_FILE_NAME, self.JOURNAL_FILE_NAME
+                ):
+                    yield path
+
+    @JointPoint
+# # python3.5     def _determine_removed_source_paths(self: Self) -> Generator:
+    def _determine_removed_source_paths(self):
+        '''
+            Walks through source area and determines elements which don't \
+            have an analogical element of the same type in reflection. \
+            Children are given before their parents.
+
+            Returns a generator yielding relative source paths.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_determine_removed_source_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A').make_directory()
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content = 'hans'
+            >>> FileHandler(source.path + 'b.txt').content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_determine_removed_source_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'b.txt').content = 'hans'
+            >>> list(Reflector(
+            ...     source, target
+            ... )._determine_removed_source_paths())
+            ['A/a.txt', 'A']
+        '''
+# # python3.5
+# #         source_path = self.source_location.path
+# #         target_path = self.target_location.path
+        source_path = convert_to_string(self.source_location.path)
+        target_path = convert_to_string(self.target_location.path)
+# #
+        for directory_path, directory_names, file_names in os.walk(
+            source_path, topdown=False
+        ):
+            for name in builtins.sorted(directory_names + file_names):
+                path = os.path.relpath(
+                    os.path.join(directory_path, name), source_path)
+                source = os.path.join(source_path, path)
+                target = os.path.join(target_path, path)
+                if not (os.path.isdir(source) and os.path.isdir(target) or
+                        os.path.isfile(source) and os.path.isfile(target)):
+# # python3.5                     yield path
+                    yield convert_to_unicode(path)
+
+    @JointPoint
+# # python3.5     def _initialize_watch_descriptor(self: Self) -> builtins.int:
+    def _initialize_watch_descriptor(self):
+        '''
+            Loads the inotify interface of the c standard library and \
+            creates a new inotify instance.
+
+            Returns the file descriptor of created inotify instance.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + 'watch_descriptor_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + 'watch_descriptor_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> if Platform().operating_system == 'linux':
+            ...     descriptor = reflector._initialize_watch_descriptor()
+            ...     os.close(descriptor)
+            ...     descriptor > 0
+            ... else:
+            ...     True
+            True
+        '''
+        if self.__class__._inotify is None:
+            try:
+                library = ctypes.CDLL(
+                    ctypes.util.find_library('c'), use_errno=True)
+            except builtins.EnvironmentError:
+                library = None
+            if library is None or not builtins.hasattr(
+                library, 'inotify_init'
+            ):
+                raise __exception__(
+                    'Watching for changes needs a c standard library '
+                    'providing inotify.')
+            self.__class__._inotify = library
+        descriptor = self._inotify.inotify_init()
+        if descriptor < 0:
+            raise __exception__(
+                'Initializing inotify failed: %s',
+                os.strerror(ctypes.get_errno()))
+        return descriptor
+
+    @JointPoint
+# # python3.5
+# #     def _add_watches(
+# #         self: Self, descriptor: builtins.int, watches: builtins.dict,
+# #         location: builtins.str, path: builtins.str
+# #     ) -> builtins.list:
+    def _add_watches(self, descriptor, watches, location, path):
+# #
+        '''
+            Watches given directory and all its sub directories.
+
+            **descriptor** - File descriptor of an inotify instance.
+
+            **watches**    - Maps each watch descriptor to its location \
+                             ("source" or "target") and its relative path. \
+                             New watches are added to it.
+
+            **location**   - Indicates whether given path is in "source" or \
+                             "target".
+
+            **path**       - Relative path of directory to watch.
+
+            Returns a list of relative paths of all elements found in given \
+            directory. They may have been created before the watch could be \
+            set up.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_add_watches_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A/B').make_directories()
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_add_watches_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> if Platform().operating_system == 'linux':
+            ...     descriptor = reflector._initialize_watch_descriptor()
+            ...     watches = {}
+            ...     paths = reflector._add_watches(
+            ...         descriptor, watches, 'source', path='A')
+            ...     os.close(descriptor)
+            ...     sorted(paths), sorted(watches.values())
+            ... else:
+            ...     (['A/B', 'A/a.txt'], [('source', 'A'), ('source', 'A/B')])
+            (['A/B', 'A/a.txt'], [('source', 'A'), ('source', 'A/B')])
+        '''
+# # python3.5
+# #         root = builtins.getattr(self, location + '_location').path
+# #         path = os.path.join(root, path)
+        root = convert_to_string(builtins.getattr(
+            self, location + '_location'
+        ).path)
+        path = os.path.join(root, convert_to_string(path))
+# #
+        paths = []
+        for directory_path, directory_names, file_names in os.walk(path):
+            relative_path = os.path.relpath(directory_path, root)
+            if relative_path == os.curdir:
+                relative_path = ''
+# # python3.5
+# #             watch = self._inotify.inotify_add_watch(
+# #                 descriptor, os.fsencode(directory_path),
+# #                 self.WATCH_EVENT_MASK)
+            watch = self._inotify.inotify_add_watch(
+                descriptor, directory_path, self.WATCH_EVENT_MASK)
+            relative_path = convert_to_unicode(relative_path)
+# #
+            if watch < 0:
+                __logger__.warning(
+                    'Watching "%s" failed: %s', directory_path,
+                    os.strerror(ctypes.get_errno()))
+            else:
+                watches[watch] = location, relative_path
+            for name in directory_names + file_names:
+# # python3.5
+# #                 paths.append(os.path.join(relative_path, name))
+                paths.append(os.path.join(
+                    relative_path, convert_to_unicode(name)))
+# #
+        return paths
+
+    @JointPoint
+# # python3.5
+# #     def _read_watch_events(
+# #         self: Self, descriptor: builtins.int, watches: builtins.dict
+# #     ) -> Generator:
+    def _read_watch_events(self, descriptor, watches):
+# #
+        '''
+            Reads all available events of given inotify instance. Watches \
+            for new directories are added on the fly.
+
+            **descriptor** - File descriptor of an inotify instance.
+
+            **watches**    - Maps each watch descriptor to its location \
+                             ("source" or "target") and its relative path.
+
+            Returns a generator yielding location and relative path of each \
+            changed element.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_read_watch_events_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_read_watch_events_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> if Platform().operating_system == 'linux':
+            ...     descriptor = reflector._initialize_watch_descriptor()
+            ...     watches = {}
+            ...     paths = reflector._add_watches(
+            ...         descriptor, watches, 'target', path='')
+            ...     created = FileHandler(target.path + 'A').make_directory()
+            ...     FileHandler(target.path + 'A/a.txt').content = 'hans'
+            ...     events = sorted(set(reflector._read_watch_events(
+            ...         descriptor, watches)))
+            ...     os.close(descriptor)
+            ...     events
+            ... else:
+            ...     [('target', 'A'), ('target', 'A/a.txt')]
+            [('target', 'A'), ('target', 'A/a.txt')]
+        '''
+        data = os.read(descriptor, 64 * 1024)
+        header_size = struct.calcsize(self.WATCH_EVENT_FORMAT)
+        offset = 0
+        while offset < builtins.len(data):
+            watch, mask, cookie, length = struct.unpack_from(
+                self.WATCH_EVENT_FORMAT, data, offset)
+            name = data[offset + header_size:offset + header_size + length]
+            offset += header_size + length
+            if mask & self.WATCH_OVERFLOW_FLAG:
+                __logger__.warning(
+                    'Too many changes to watch. Rescan all watched '
+                    'directories.')
+                for location in ('source', 'target'):
+                    for path in self._add_watches(
+                        descriptor, watches, location, path=''
+                    ):
+                        yield location, path
+            elif watch in watches:
+                if mask & self.WATCH_IGNORED_FLAG:
+                    del watches[watch]
+                    continue
+                location, directory_path = watches[watch]
+# # python3.5
+# #                 name = os.fsdecode(name.rstrip(b'\0'))
+                name = convert_to_unicode(name.rstrip(b'\0'))
+# #
+                if name:
+                    path = os.path.join(directory_path, name)
+                    yield location, path
+                    if mask & self.WATCH_DIRECTORY_FLAG and mask & (
+                        self.WATCH_NEW_ELEMENT_MASK
+                    ):
+                        for sub_path in self._add_watches(
+                            descriptor, watches, location, path
+                        ):
+                            yield location, sub_path
+
+    @JointPoint
+# # python3.5
+# #     def _apply_watched_changes(
+# #         self: Self, changes: builtins.dict
+# #     ) -> builtins.set:
+    def _apply_watched_changes(self, changes):
+# #
+        '''
+            Applies given changed paths in source and reflection. Paths \
+            changed in reflection are synchronized back, paths changed in \
+            source are reflected.
+
+            **changes** - Maps "source" and "target" to a set of changed \
+                          relative paths.
+
+            Returns a set of location and path tuples touched while applying \
+            given changes.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_apply_watched_changes_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'deleted.txt').content = 'hans'
+            >>> FileHandler(source.path + 'new.txt').content = 'peter'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_apply_watched_changes_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'A').make_directory()
+            True
+            >>> FileHandler(target.path + 'A/a.txt').content = 'klaus'
+            >>> reflector = Reflector(source, target)
+
+            >>> touched = reflector._apply_watched_changes({
+            ...     'source': set(['new.txt']),
+            ...     'target': set(['A', 'A/a.txt', 'deleted.txt'])})
+            >>> sorted(touched) == [
+            ...     ('source', 'A'), ('source', 'A/a.txt'),
+            ...     ('source', 'deleted.txt'), ('target', 'new.txt')]
+            True
+            >>> FileHandler(source.path + 'A/a.txt').content
+            'klaus'
+            >>> FileHandler(source.path + 'deleted.txt').is_element()
+            False
+            >>> FileHandler(target.path + 'new.txt').is_portable_link()
+            True
+
+            >>> FileHandler(source.path + 'new.txt').remove_file()
+            True
+            >>> sorted(reflector._apply_watched_changes({
+            ...     'source': set(['new.txt']), 'target': set()}))
+            [('target', 'new.txt')]
+            >>> FileHandler(target.path + 'new.txt').is_element()
+            False
+        '''
+        touched = builtins.set()
+        for path in changes['source'] & changes['target']:
+            __logger__.warning(
+                '"%s" was changed in source and reflection. Reflection wins.',
+                path)
+        '''Parents are handled before their children.'''
+        target_paths = builtins.sorted(changes['target'])
+        for path in target_paths:
+            file = FileHandler(location=self.target_location.path + path)
+            if file.is_symbolic_link() or file.is_element():
+                self._relocate_moved_file(file)
+                self._copy_cache_to_source(file)
+            touched.add(('source', path))
+        for path in builtins.reversed(target_paths):
+            file = FileHandler(location=self.source_location.path + path)
+            if file.is_symbolic_link() or file.is_element():
+                self._delete_source_file_not_existing_in_target(file)
+        for path in builtins.sorted(changes['source'] - changes['target']):
+            self._reflect_source_change(path)
+            touched.add(('target', path))
+        return touched
+
+    @JointPoint
+# # python3.5
+# #     def _reflect_source_change(self: Self, path: builtins.str) -> Self:
+    def _reflect_source_change(self, path):
+# #
+        '''
+            Updates the reflection of given changed source element. Deleted \
+            elements are removed from reflection, copied files are updated \
+            and all other files are (re-)linked.
+
+            **path** - Relative path of changed element in source.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_reflect_source_change_source',
+            ...     make_directory=True)
+            >>> FileHandler(source.path + 'A').make_directory()
+            True
+            >>> FileHandler(source.path + 'copied.txt').content = 'new'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_reflect_source_change_target',
+            ...     make_directory=True)
+            >>> FileHandler(target.path + 'copied.txt').content = 'old'
+            >>> reflector = Reflector(source, target)
+
+            >>> reflector._reflect_source_change('A') # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(target.path + 'A').is_directory(allow_link=False)
+            True
+
+            >>> reflector._reflect_source_change(
+            ...     'copied.txt'
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(target.path + 'copied.txt').content
+            'new'
+        '''
+        source = FileHandler(location=self.source_location.path + path)
+        target = FileHandler(location=self.target_location.path + path)
+        if self.is_location_in_paths(
+            search=source, paths=self.exclude_locations
+        ):
+            return self
+        if source.is_symbolic_link():
+            self._remove_reflection_element(path)
+            self._handle_source_link(source, target_file=target)
+        elif source.is_directory():
+            if not target.is_directory(allow_link=False):
+                __logger__.info('Generating target folder: "%s".', target.path)
+                self._remove_reflection_element(path)
+                target.make_directory(right=self.target_rights)
+        elif source.is_file():
+            if target.is_file(allow_link=False) and not \
+                    target.is_portable_link():
+                __logger__.info(
+                    'Update reflection "%s" of changed source file.',
+                    target.path)
+                source.copy(target=target, right=self.target_rights)
+            else:
+                self._remove_reflection_element(path)
+                self._create_reflection_link(source, path=path)
+                self._process_pending_operations()
+        else:
+            __logger__.info(
+                'Remove reflection "%s" of deleted source element.',
+                target.path)
+            self._remove_reflection_element(path)
+        return self
+
+    @JointPoint
+# # python3.5     def _validate_inputs(self: Self) -> Self:
+    def _validate_inputs(self):
+        '''
+            Validates the given parameters to the "self.__init__()" method. \
+            Checks if all paths makes sense and all inputs are in the right \
+            format.
+        '''
+        if(self.target_location.path.startswith(
+            self.source_location.path
+        ) or self.source_location.path.startswith(
+            self.target_location.path
+        )):
+            raise __exception__(
+                'Source path "%s" and reflection path "%s" have to be in '
+                'different locations.', self.source_location.path,
+                self.target_location.path)
+        if self.limit is False or self.limit < 0:
+            raise __exception__('Invalid cache-limit.')
+        elif(not (builtins.isinstance(
+                self.target_rights, builtins.int) and
+            builtins.len(builtins.str(self.target_rights)) == 3 and
+            self.target_rights >= 0 and self.target_rights <= 777)
+        ):
+            raise __exception__(
+                'Reflection-rights "%s" aren\'t written in a convenient way '
+                'like "770".', self.target_rights)
+        elif self.selection_strategy not in self.SELECTION_STRATEGIES:
+            raise __exception__(
+                'Selection strategy "%s" isn\'t one of "%s".',
+                self.selection_strategy,
+                '", "'.join(self.SELECTION_STRATEGIES))
+        return self._check_path_lists()
+
+    @JointPoint
+# # python3.5     def _check_path_lists(self: Self) -> Self:
+    def _check_path_lists(self):
+        '''
+            Checks if all given paths lists are in locations which makes \
+            sense, to prevent user for failures.
+        '''
+        return self._check_path_in_source(
+            paths=self.priority_locations, path_type='Priority'
+        )._check_path_in_source(
+            paths=self.exclude_locations, path_type='Exclude')
 
     @JointPoint
 # # python3.5
@@ -1134,14 +2838,28 @@ class Reflector(Class, Runnable):
     # # # region core concern
 
     @JointPoint
-# # python3.5     def _create_reflection_files(self: Self) -> Self:
-    def _create_reflection_files(self):
+# # python3.5
+# #     def _create_reflection_files(
+# #         self: Self, candidates=None, journal=None, start=0
+# #     ) -> Self:
+    def _create_reflection_files(self, candidates=None, journal=None, start=0):
+# #
         '''
             Iterates throw all files which should be included in the \
-            reflection. They will be sorted by its file-size in descending \
-            order. Small files will be preferred. In that way the maximum \
-            number of files which fits to the cache-limit will be copied in \
-            the reflection location.
+            reflection. They will be ordered by the configured selection \
+            strategy (see "_select_by_size()" and "_select_by_knapsack()"). \
+            Files are copied in that order as long as they fit into the \
+            cache-limit.
+
+            **candidates** - Planned size and relative path pairs. If \
+                             "None" is given they are taken from the \
+                             configured selection strategy.
+
+            **journal**    - Opened journal file to record the number of \
+                             reflected candidates in.
+
+            **start**      - Number of leading candidates which were \
+                             already reflected by an interrupted run.
 
             Examples:
 
@@ -1156,30 +2874,582 @@ class Reflector(Class, Runnable):
 
             >>> Platform.terminate_thread = True
             >>> reflector = Reflector(source, target)
-            >>> reflector._files = [(0, file.path)]
+            >>> reflector._files.append(0, 'test_file') # doctest: +ELLIPSIS
+            Object of "CandidateList" with 1 candidates (0 spilled runs).
             >>> reflector._create_reflection_files() # doctest: +ELLIPSIS
             Object of "Reflector" with source path "...
             >>> Platform.terminate_thread = False
+
+            >>> FileHandler(source.path + 'done_file').content = 'hans'
+            >>> reflector._create_reflection_files(
+            ...     [[4, 'done_file'], [0, 'test_file']], start=1
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(target.path + 'done_file').is_element()
+            False
+            >>> FileHandler(target.path + 'test_file').is_file()
+            True
         '''
-        self._priority_files.sort()
-        self._files.sort()
-        self._number_of_files = builtins.len(self._priority_files) +\
-            builtins.len(self._files)
-        for size, relative_path in self._priority_files + self._files:
+        if candidates is None:
+            self._number_of_files = builtins.len(self._priority_files) +\
+                builtins.len(self._files)
+            candidates = builtins.getattr(
+                self, '_select_by_%s' % self.selection_strategy)()
+        else:
+            self._number_of_files = builtins.len(candidates)
+        for index, (size, relative_path) in builtins.enumerate(candidates):
             if Platform.check_thread():
-                return self
+                return self._process_pending_operations()._record_reflection(
+                    journal, number=index)
             source = FileHandler(
                 location=self.source_location.path + relative_path,
                 must_exist=True)
             self._edited_number_of_files += 1
+            self._reflected_paths.add(relative_path)
+            representation = 'link'
             if(self.limit >= size or
                size <= source.dummy_size and not self.use_native_symlinks or
                size <= source.BLOCK_SIZE_IN_BYTE and
                self.use_native_symlinks):
-                self._copy_reflection_file(
-                    source, path=relative_path, size=size)
+                representation = 'copy'
+            if index < start:
+                '''
+                    Reflected by an interrupted run. Only limit and manifest \
+                    have to be restored.
+                '''
+                if representation == 'copy':
+                    self.limit -= size
+                self._pending_operations.append((None, relative_path, [
+                    size, source.timestamp if self.incremental else None,
+                    representation]))
+            elif self._is_reflection_unchanged(
+                source, path=relative_path, size=size,
+                representation=representation
+            ):
+                __logger__.debug(
+                    'Keep unchanged reflection "%s".',
+                    self.target_location.path + relative_path)
+                if representation == 'copy':
+                    self.limit -= size
+                self._new_manifest[relative_path] = self._manifest[
+                    relative_path]
             else:
-                self._create_reflection_link(source, path=relative_path)
+                if self.incremental:
+                    self._remove_reflection_element(relative_path)
+                if representation == 'copy':
+                    self._copy_reflection_file(
+                        source, path=relative_path, size=size)
+                else:
+                    self._create_reflection_link(source, path=relative_path)
+            if builtins.len(
+                self._pending_operations
+            ) >= self.OPERATION_BATCH_SIZE:
+                self._process_pending_operations()._record_reflection(
+                    journal, number=index + 1)
+            self._log_progress()
+        return self._process_pending_operations()._record_reflection(
+            journal, number=self._number_of_files
+        )._log_progress(force=True)
+
+    @JointPoint
+# # python3.5
+# #     def _record_reflection(
+# #         self: Self, journal: (builtins.type(None), _io.TextIOWrapper),
+# #         number: builtins.int
+# #     ) -> Self:
+    def _record_reflection(self, journal, number):
+# #
+        '''
+            Records the number of reflected candidates in given journal. \
+            Should only be called if all pending operations are processed.
+
+            **journal** - Opened journal file or "None" if nothing should \
+                          be recorded.
+
+            **number**  - Number of leading candidates already reflected.
+        '''
+        if journal is not None:
+            self._write_journal_record(
+                journal, record=['progress', 'reflection', number],
+                synchronize=True)
+        return self
+
+    @JointPoint
+# # python3.5     def _select_by_size(self: Self) -> Generator:
+    def _select_by_size(self):
+        '''
+            Orders all files which should be included in the reflection by \
+            their size in ascending order. Files in priority locations come \
+            first. In that way the maximum number of files which fits to the \
+            cache-limit will be copied in the reflection location.
+
+            Returns a generator yielding size and relative path tuples.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_select_by_size_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_select_by_size_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+            >>> reflector._files.append(2, 'b').append(
+            ...     1, 'c'
+            ... ) # doctest: +ELLIPSIS
+            Object of "CandidateList" with 2 candidates (0 spilled runs).
+            >>> reflector._priority_files.append(3, 'a') # doctest: +ELLIPSIS
+            Object of "CandidateList" with 1 candidates (0 spilled runs).
+            >>> list(reflector._select_by_size())
+            [(3.0, 'a'), (1.0, 'c'), (2.0, 'b')]
+        '''
+        for candidates in (self._priority_files, self._files):
+            for size, path, score in candidates:
+                yield size, path
+
+    @JointPoint
+# # python3.5     def _select_by_knapsack(self: Self) -> Generator:
+    def _select_by_knapsack(self):
+        '''
+            Orders all files which should be included in the reflection to \
+            approximate a knapsack which maximizes the summarized score of \
+            copied files under the cache-limit. Files are ordered greedily \
+            by score per byte. If the single best scored file which fits \
+            into the limit outweighs the greedy selection it is moved to \
+            front. This guarantees at least half of the optimal score. The \
+            ordered candidates are streamed twice so they never have to be \
+            hold in memory at once.
+
+            Returns a generator yielding size and relative path tuples.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_select_by_knapsack_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_select_by_knapsack_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(
+            ...     source, target, limit='10 byte',
+            ...     selection_strategy='knapsack')
+            >>> key = reflector._files.key
+
+            >>> reflector._files = CandidateList(key=key).append(
+            ...     5, 'b', score=1
+            ... ).append(6, 'a', score=6).append(0, 'c', score=2)
+            >>> list(reflector._select_by_knapsack())
+            [(0.0, 'c'), (6.0, 'a'), (5.0, 'b')]
+
+            >>> reflector._files = CandidateList(key=key).append(
+            ...     1, 'a', score=2
+            ... ).append(10, 'b', score=10)
+            >>> list(reflector._select_by_knapsack())
+            [(10.0, 'b'), (1.0, 'a')]
+
+            >>> reflector._files = CandidateList(key=key)
+            >>> list(reflector._select_by_knapsack())
+            []
+        '''
+        limit = self.limit
+        greedy_score = 0
+        best = None
+        for size, path, score in self._files:
+            if size <= limit:
+                limit -= size
+                greedy_score += score
+            if size <= self.limit and (best is None or score > best[2]):
+                best = size, path, score
+        if best is not None and best[2] > greedy_score:
+            yield best[:2]
+        else:
+            best = None
+        for size, path, score in self._files:
+            if best is None or path != best[1]:
+                yield size, path
+
+    @JointPoint
+# # python3.5
+# #     def _determine_selection_score(
+# #         self: Self, source: FileHandler, path: builtins.str,
+# #         priority: builtins.bool
+# #     ) -> builtins.float:
+    def _determine_selection_score(self, source, path, priority):
+# #
+        '''
+            Determines how valuable a copy of given file in reflection would \
+            be. Each file has a base score of one. Recently accessed files \
+            get up to one additional point, each entry in given access log \
+            adds one point and files in priority locations get \
+            "PRIORITY_SCORE" points.
+
+            **source**   - The file in source area to score.
+
+            **path**     - Relative path of given file.
+
+            **priority** - Indicates whether given file is in a priority \
+                           location.
+
+            Returns the determined score.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_determine_selection_score_source',
+            ...     make_directory=True)
+            >>> file = FileHandler(source.path + 'file')
+            >>> file.content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_determine_selection_score_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+
+            >>> score = reflector._determine_selection_score(
+            ...     file, path='file', priority=False)
+            >>> 1.99 < score <= 2
+            True
+
+            >>> reflector._access_counts = {'file': 3}
+            >>> score = reflector._determine_selection_score(
+            ...     file, path='file', priority=True)
+            >>> 14.99 < score <= 15
+            True
+        '''
+# # python3.5         source_path = source.path
+        source_path = convert_to_string(source.path)
+        age_in_days = builtins.max(
+            time.time() - os.stat(source_path).st_atime, 0) / (24 * 60 * 60)
+        score = 1 + 1 / (1 + age_in_days) + self._access_counts.get(path, 0)
+        if priority:
+            score += self.PRIORITY_SCORE
+        return score
+
+    @JointPoint
+# # python3.5     def _load_access_counts(self: Self) -> Self:
+    def _load_access_counts(self):
+        '''
+            Counts accesses per relative source path listed in given access \
+            log. The log is read line by line. Each line holds an absolute \
+            or source relative path.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_load_access_counts_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_load_access_counts_target',
+            ...     make_directory=True)
+            >>> access_log = FileHandler(
+            ...     __test_folder__.path + '_load_access_counts.log')
+            >>> access_log.content = 'a.txt\\n%sa.txt\\n\\nA/b.txt\\n' % (
+            ...     source.path)
+            >>> reflector = Reflector(
+            ...     source, target, access_log_location=access_log.path)
+            >>> sorted(reflector._load_access_counts()._access_counts.items())
+            [('A/b.txt', 1), ('a.txt', 2)]
+        '''
+        __logger__.info(
+            'Load access log "%s".', self.access_log_location)
+        for line in FileHandler(
+            location=self.access_log_location, must_exist=True
+        ).iterate_lines():
+            path = line.strip()
+            if path.startswith(self.source_location.path):
+                path = path[builtins.len(self.source_location.path):]
+            if path:
+                self._access_counts[path] = self._access_counts.get(
+                    path, 0
+                ) + 1
+        return self
+
+    @JointPoint
+# # python3.5     def _process_pending_operations(self: Self) -> Self:
+    def _process_pending_operations(self):
+        '''
+            Processes all scheduled copy and link operations concurrently \
+            and sets reflection rights of copied files. In incremental mode \
+            all processed files are added to the new manifest.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_process_pending_source',
+            ...     make_directory=True)
+            >>> file = FileHandler(source.path + 'file')
+            >>> file.content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_process_pending_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target, incremental=True)
+            >>> reflector._number_of_files = 1
+
+            >>> reflector._copy_reflection_file(
+            ...     file, 'file', file.size
+            ... )._process_pending_operations() # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(target.path + 'file').content
+            'hans'
+            >>> reflector._pending_operations
+            []
+            >>> reflector._new_manifest['file'][:3] == [
+            ...     4, file.timestamp, 'copy']
+            True
+
+            >>> reflector._pending_operations.append((
+            ...     ('copy', source.path + 'not_existing', target.path + 'a'),
+            ...     'a', [0, 0, 'copy']))
+            >>> reflector._process_pending_operations(
+            ... ) # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+            ...
+            SynchronisationError: 1 reflection operations failed (first: ...
+        '''
+        pending_operations = self._pending_operations
+        self._pending_operations = []
+        errors = FileHandler.process_operations(
+            (operation for operation, path, entry in pending_operations
+             if operation is not None),
+            number_of_threads=self.number_of_threads or None)
+        if errors:
+            raise __exception__(
+                '%d reflection operations failed (first: "%s").',
+                builtins.len(errors), errors[0][1])
+        right = builtins.eval('0o%d' % self.target_rights)
+        for operation, path, entry in pending_operations:
+# # python3.5
+# #             target_path = self.target_location.path + path
+            target_path = convert_to_string(self.target_location.path + path)
+# #
+            if operation is not None and operation[0] == 'copy':
+                os.chmod(target_path, right)
+            if self.incremental:
+                self._new_manifest[path] = entry + [
+                    os.lstat(target_path).st_mtime]
+        return self
+
+    @JointPoint
+# # python3.5     def _log_progress(self: Self, force=False) -> Self:
+    def _log_progress(self, force=False):
+        '''
+            Logs the reflection progress. To avoid flooding the log a \
+            message is only written once in \
+            "PROGRESS_LOG_INTERVAL_IN_SECONDS".
+
+            **force** - Indicates whether to log regardless of the last time \
+                        the progress was logged.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_log_progress_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_log_progress_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+            >>> reflector._edited_number_of_files = 1
+            >>> reflector._number_of_files = 2
+            >>> __test_buffer__.clear() # doctest: +ELLIPSIS
+            '...'
+
+            >>> reflector._log_progress() # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> __test_buffer__.clear() # doctest: +ELLIPSIS
+            '...Reflected 1/2 files (50.0%)...'
+
+            >>> reflector._log_progress() # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> __test_buffer__.clear()
+            ''
+
+            >>> reflector._number_of_files = 0
+            >>> reflector._log_progress(force=True) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+        '''
+        if self._number_of_files and (
+            force or time.time() - self._last_progress_log_time >=
+            self.PROGRESS_LOG_INTERVAL_IN_SECONDS
+        ):
+            self._last_progress_log_time = time.time()
+            __logger__.info(
+                'Reflected {edited_number_of_files}/{number_of_files} files '
+                '({percent}%).'.format(
+                    edited_number_of_files=self._edited_number_of_files,
+                    number_of_files=self._number_of_files,
+                    percent=self.status_in_percent))
+        return self
+
+    @JointPoint
+# # python3.5
+# #     def _is_reflection_unchanged(
+# #         self: Self, source: FileHandler, path: builtins.str,
+# #         size: builtins.int, representation: builtins.str
+# #     ) -> builtins.bool:
+    def _is_reflection_unchanged(self, source, path, size, representation):
+# #
+        '''
+            Checks if given file is already represented in reflection area \
+            like described in the last manifest. The representation itself \
+            mustn't be touched since last reflection as well.
+
+            **source**         - is a handler object with the file in source.
+
+            **path**           - is the relative path to the representation \
+                                 in the reflection area.
+
+            **size**           - is the given files size.
+
+            **representation** - "copy" or "link" to indicate how given file \
+                                 should be represented.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_is_reflection_unchanged_source',
+            ...     make_directory=True)
+            >>> file = FileHandler(source.path + 'file')
+            >>> file.content = 'hans'
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_is_reflection_unchanged_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target, incremental=True)
+            >>> reflector._is_reflection_unchanged(file, 'file', 4, 'copy')
+            False
+
+            >>> file.copy(target.path + 'file')
+            True
+            >>> reflector._manifest['file'] = [
+            ...     4, file.timestamp, 'copy',
+            ...     FileHandler(target.path + 'file').timestamp]
+            >>> reflector._is_reflection_unchanged(file, 'file', 4, 'copy')
+            True
+            >>> reflector._is_reflection_unchanged(file, 'file', 4, 'link')
+            False
+
+            >>> reflector.incremental = False
+            >>> reflector._is_reflection_unchanged(file, 'file', 4, 'copy')
+            False
+        '''
+        if not self.incremental or path not in self._manifest:
+            return False
+# # python3.5         target_path = self.target_location.path + path
+        target_path = convert_to_string(self.target_location.path + path)
+        size_in_source, timestamp, last_representation, target_timestamp = \
+            self._manifest[path]
+        return (
+            [size_in_source, timestamp, last_representation] ==
+            [size, source.timestamp, representation] and
+            os.path.lexists(target_path) and
+            os.lstat(target_path).st_mtime == target_timestamp)
+
+    @JointPoint
+# # python3.5
+# #     def _remove_reflection_element(self: Self, path: builtins.str) -> Self:
+    def _remove_reflection_element(self, path):
+# #
+        '''
+            Removes given element (file, link or directory) from reflection \
+            area if it exists. Links are removed without touching their \
+            referenced files.
+
+            **path** - is the relative path of the element to remove.
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path + '_remove_reflection_element_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path + '_remove_reflection_element_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+            >>> FileHandler(target.path + 'A/B').make_directories()
+            True
+            >>> FileHandler(target.path + 'file').content = ''
+
+            >>> reflector._remove_reflection_element(
+            ...     'A'
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> reflector._remove_reflection_element(
+            ...     'file'
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> reflector._remove_reflection_element(
+            ...     'not_existing'
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> len(target)
+            0
+        '''
+# # python3.5
+# #         path = os.path.join(self.target_location.path, path)
+        path = os.path.join(convert_to_string(
+            self.target_location.path
+        ), convert_to_string(path))
+# #
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.remove(path)
+        return self
+
+    @JointPoint
+# # python3.5
+# #     def _remove_outdated_reflection_elements(self: Self) -> Self:
+    def _remove_outdated_reflection_elements(self):
+# #
+        '''
+            Removes all elements in reflection area which doesn't belong to \
+            the current reflection anymore (e.g. deleted files in source).
+
+            Examples:
+
+            >>> source = FileHandler(
+            ...     __test_folder__.path +
+            ...     '_remove_outdated_reflection_elements_source',
+            ...     make_directory=True)
+            >>> target = FileHandler(
+            ...     __test_folder__.path +
+            ...     '_remove_outdated_reflection_elements_target',
+            ...     make_directory=True)
+            >>> reflector = Reflector(source, target)
+            >>> FileHandler(target.path + 'A/B').make_directories()
+            True
+            >>> FileHandler(target.path + 'A/B/file').content = ''
+            >>> FileHandler(target.path + 'A/outdated').content = ''
+            >>> reflector._reflected_paths = set(('A', os.path.join(
+            ...     'A', 'B'
+            ... ), os.path.join('A', 'B', 'file')))
+
+            >>> reflector._remove_outdated_reflection_elements(
+            ... ) # doctest: +ELLIPSIS
+            Object of "Reflector" with source path "...
+            >>> FileHandler(target.path + 'A/B/file').is_file()
+            True
+            >>> FileHandler(target.path + 'A/outdated').is_element()
+            False
+        '''
+# # python3.5         target_path = self.target_location.path
+        target_path = convert_to_string(self.target_location.path)
+        for directory_path, directory_names, file_names in os.walk(
+            target_path, topdown=False
+        ):
+            for name in file_names + directory_names:
+# # python3.5
+# #                 path = os.path.relpath(
+# #                     os.path.join(directory_path, name), target_path)
+                path = convert_to_unicode(os.path.relpath(
+                    os.path.join(directory_path, name), target_path))
+# #
+                if not (path in self._reflected_paths or path in (
+                    self.MANIFEST_FILE_NAME, self.JOURNAL_FILE_NAME
+                )):
+                    __logger__.info(
+                        'Remove outdated reflection element "%s".',
+                        self.target_location.path + path)
+                    self._remove_reflection_element(path)
         return self
 
     @JointPoint
@@ -1191,8 +3461,9 @@ class Reflector(Class, Runnable):
     def _copy_reflection_file(self, source, path, size):
 # #
         '''
-            Serves as helper method for "_create_reflection_files()". Copies \
-            given files in source to its pendant in the reflection area.
+            Serves as helper method for "_create_reflection_files()". \
+            Schedules a copy of given file in source to its pendant in the \
+            reflection area. The limit is reduced immediately.
 
             **source** - is a directory object with the file in source to copy.
 
@@ -1201,16 +3472,12 @@ class Reflector(Class, Runnable):
 
             **size**   - is the given files size.
         '''
-        __logger__.info(
-            'Copying file "{source}" to "{target}". '
-            '({edited_number_of_files}/{number_of_files} {percent}%)'.format(
-                source=source.path, target=self.target_location.path + path,
-                edited_number_of_files=self._edited_number_of_files,
-                number_of_files=self._number_of_files,
-                percent=self.status_in_percent))
-        source.copy(
-            target=self.target_location.path + path,
-            right=self.target_rights)
+        __logger__.debug(
+            'Copying file "%s" to "%s".', source.path,
+            self.target_location.path + path)
+        self._pending_operations.append((
+            ('copy', source, self.target_location.path + path), path,
+            [size, source.timestamp if self.incremental else None, 'copy']))
         self.limit -= size
         return self
 
@@ -1222,7 +3489,8 @@ class Reflector(Class, Runnable):
     def _create_reflection_link(self, source, path):
 # #
         '''
-            Creates a link to the given source element in target.
+            Creates a link to the given source element in target. Native \
+            symbolic links are scheduled to be created concurrently.
 
             **source** - is a handler object with the file in source to link.
 
@@ -1249,17 +3517,18 @@ class Reflector(Class, Runnable):
             ...         Reflector)
             True
         '''
-        __logger__.info(
-            'Creating link from "{source}" to "{target}". '
-            '({edited_number_of_files}/{number_of_files} {percent}%)'.format(
-                source=source.path, target=self.target_location.path + path,
-                edited_number_of_files=self._edited_number_of_files,
-                number_of_files=self._number_of_files,
-                percent=self.status_in_percent))
+        __logger__.debug(
+            'Creating link from "%s" to "%s".', source.path,
+            self.target_location.path + path)
+        operation = None
         if self.use_native_symlinks:
-            source.make_symbolic_link(target=self.target_location.path + path)
+            '''Native links are created concurrently like copies.'''
+            operation = 'link', source, self.target_location.path + path
         else:
             source.make_portable_link(target=self.target_location.path + path)
+        self._pending_operations.append((operation, path, [
+            source.size, source.timestamp if self.incremental else None,
+            'link']))
         return self
 
     @JointPoint
@@ -1403,7 +3672,22 @@ class Reflector(Class, Runnable):
             >>> source_file.content = ''
             >>> reflector._copy_cache_to_source(target_file)
             True
+
+            >>> manifest = FileHandler(
+            ...     target.path + Reflector.MANIFEST_FILE_NAME)
+            >>> manifest.content = '{}'
+            >>> reflector._copy_cache_to_source(manifest)
+            True
+            >>> FileHandler(
+            ...     source.path + Reflector.MANIFEST_FILE_NAME
+            ... ).is_element()
+            False
         '''
+        if file.path in (
+            self.target_location.path + self.MANIFEST_FILE_NAME,
+            self.target_location.path + self.JOURNAL_FILE_NAME
+        ):
+            return True
         if not self.is_location_in_paths(
             search=file, paths=self.exclude_locations
         ):
@@ -1416,6 +3700,12 @@ class Reflector(Class, Runnable):
                     source_file, link_file=file,
                     target_path_length=target_path_length)
             if file.is_file():
+                if(source_file.is_file() and
+                   source_file.size == file.size and
+                   source_file.timestamp == file.timestamp):
+                    __logger__.debug(
+                        'Keep unchanged file "%s".', source_file.path)
+                    return True
                 __logger__.info(
                     'Copying file "%s" to "%s".', file.path, source_file.path)
                 return file.copy(
@@ -1697,12 +3987,25 @@ class Reflector(Class, Runnable):
             Returns "True" if all file-operations where successful or "False" \
             otherwise.
         '''
+        relative_path = target_file.path[builtins.len(
+            self.target_location.path):]
+        if relative_path.endswith(os.sep):
+            relative_path = relative_path[:-builtins.len(os.sep)]
         if source_file.is_symbolic_link():
+            self._reflected_paths.add(relative_path)
+            if self.incremental:
+                self._remove_reflection_element(relative_path)
             return self._handle_source_link(source_file, target_file)
         elif source_file.is_directory():
-            __logger__.info(
-                'Generating target folder: "%s".', target_file.path)
-            target_file.make_directory(right=self.target_rights)
+            self._reflected_paths.add(relative_path)
+            if target_file.is_directory(allow_link=False):
+                __logger__.info(
+                    'Keep existing target folder: "%s".', target_file.path)
+            else:
+                self._remove_reflection_element(relative_path)
+                __logger__.info(
+                    'Generating target folder: "%s".', target_file.path)
+                target_file.make_directory(right=self.target_rights)
             return source_file.iterate_directory(
                 function=self._create_reflection_structure,
                 target=target_file, priority=priority, recursive_in_link=False)
@@ -1711,10 +4014,17 @@ class Reflector(Class, Runnable):
             __logger__.warning(
                 'Ignoring device file: "%s".', source_file.path)
         else:
-            appending_list = self._priority_files if priority else self._files
-            appending_list.append(
-                (source_file.size, source_file.path[builtins.len(
-                    self.source_location.path):]))
+            relative_path = source_file.path[builtins.len(
+                self.source_location.path):]
+            if self.selection_strategy == 'size':
+                candidates = self._priority_files if priority else \
+                    self._files
+                candidates.append(source_file.size, path=relative_path)
+            else:
+                self._files.append(
+                    source_file.size, path=relative_path,
+                    score=self._determine_selection_score(
+                        source_file, path=relative_path, priority=priority))
         return True
 
     @JointPoint
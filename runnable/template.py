@@ -119,7 +119,7 @@ from boostnode.extension.output import IDEOGRAM_OFF as OUTPUT_IDEOGRAM_OFF
 from boostnode.extension.system import CommandLine, Runnable
 # # python3.5 from boostnode.extension.type import Self, SelfClass
 pass
-from boostnode.paradigm.aspectOrientation import JointPoint
+from boostnode.paradigm.aspectOrientation import JointPoint, get_caller_frame
 from boostnode.paradigm.objectOrientation import Class
 
 # # python3.5
@@ -1957,12 +1957,9 @@ class Parser(Class, Runnable):
         internal_scope = copy(scope)
         internal_scope.update(keywords)
         for local in locals:
-            if sys.flags.optimize:
-                internal_scope[local] = \
-                    inspect.currentframe().f_back.f_locals[local]
-            else:
-                internal_scope[local] = \
-                    inspect.currentframe().f_back.f_back.f_locals[local]
+            internal_scope[local] = get_caller_frame(
+                inspect.currentframe()
+            ).f_locals[local]
         root_path = ''
         if self.file:
             root_path = self.file.directory.path